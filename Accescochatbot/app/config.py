@@ -17,8 +17,43 @@ class Settings:
     DB_PORT=os.getenv("DB_PORT","5432")
     DB_NAME=os.getenv("DB_NAME","postgres")
     # Database (Supabase / Render / Local)
-    DATABASE_URL =(f"postgresql+psycopg2://{DB_USER}:{DB_PASSWORD}"
+    # DATABASE_URL overrides the DB_* parts, e.g. sqlite:///local.db for local runs
+    DATABASE_URL = os.getenv("DATABASE_URL") or (f"postgresql+psycopg2://{DB_USER}:{DB_PASSWORD}"
     f"@{DB_HOST}:{DB_PORT}/{DB_NAME}")
+    DB_SSLMODE = os.getenv("DB_SSLMODE", "require")
+    # Read replica for read-only handlers (track order, cancel lookup); empty = primary only
+    REPLICA_DATABASE_URL = os.getenv("REPLICA_DATABASE_URL", "")
+
+    # Order archival: confirmed/cancelled orders older than ARCHIVE_AFTER_DAYS
+    # move to orders_archive, ARCHIVE_BATCH_SIZE rows per transaction.
+    # ARCHIVE_INTERVAL_MINUTES=0 turns the background job off.
+    ARCHIVE_AFTER_DAYS = int(os.getenv("ARCHIVE_AFTER_DAYS", "90"))
+    ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE", "500"))
+    ARCHIVE_INTERVAL_MINUTES = int(os.getenv("ARCHIVE_INTERVAL_MINUTES", "60"))
+
+    # Abandoned carts: pending orders untouched for CART_TTL_MINUTES become
+    # "expired", at most SWEEP_BATCH_SIZE * SWEEP_MAX_BATCHES per run.
+    # SWEEP_INTERVAL_MINUTES=0 turns the sweeper off.
+    CART_TTL_MINUTES = int(os.getenv("CART_TTL_MINUTES", "240"))
+    SWEEP_BATCH_SIZE = int(os.getenv("SWEEP_BATCH_SIZE", "500"))
+    SWEEP_MAX_BATCHES = int(os.getenv("SWEEP_MAX_BATCHES", "20"))
+    SWEEP_INTERVAL_MINUTES = int(os.getenv("SWEEP_INTERVAL_MINUTES", "5"))
+
+    # POST /catalog/sync needs this in X-Sync-Token; empty = endpoint off
+    CATALOG_SYNC_TOKEN = os.getenv("CATALOG_SYNC_TOKEN", "")
+
+    # Cart pricing (services/pricing_service.py): the in-memory price map checks
+    # the products table's version at most this often
+    PRICE_CHECK_SECONDS = float(os.getenv("PRICE_CHECK_SECONDS", "30"))
+
+    # Local /chat endpoint: matches below CHAT_CONFIDENCE go to Dialogflow's
+    # detectIntent, which needs DIALOGFLOW_PROJECT_ID plus either
+    # DIALOGFLOW_ACCESS_TOKEN or google-auth default credentials.
+    CHAT_CONFIDENCE = float(os.getenv("CHAT_CONFIDENCE", "0.7"))
+    DIALOGFLOW_PROJECT_ID = os.getenv("DIALOGFLOW_PROJECT_ID", "")
+    DIALOGFLOW_ACCESS_TOKEN = os.getenv("DIALOGFLOW_ACCESS_TOKEN", "")
+    # /chat conversation state older than this starts over (and is swept)
+    CHAT_SESSION_TTL_MINUTES = int(os.getenv("CHAT_SESSION_TTL_MINUTES", "30"))
 
     # Security (optional, future use)
     SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret")
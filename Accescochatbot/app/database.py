@@ -1,22 +1,60 @@
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.orm import sessionmaker, declarative_base, Session
 from sqlalchemy.pool import NullPool
+from sqlalchemy.sql import Select
 
 from Accescochatbot.app.config import settings
 
 # -----------------------------
-# SQLAlchemy Engine
+# SQLAlchemy Engines
 # -----------------------------
-engine = create_engine(
-    settings.DATABASE_URL,
-    poolclass=NullPool,                  # REQUIRED for Supabase Pooler
-    connect_args={"sslmode": "require"}, # REQUIRED for Supabase
-)
+def _create_engine(url: str):
+    if url.startswith("sqlite"):
+        # Local stand-in for the primary or the replica
+        return create_engine(url, connect_args={"check_same_thread": False})
+    return create_engine(
+        url,
+        poolclass=NullPool,                              # REQUIRED for Supabase Pooler
+        connect_args={"sslmode": settings.DB_SSLMODE},   # "require" for Supabase
+    )
+
+
+engine = _create_engine(settings.DATABASE_URL)
+
+# Read replica; without REPLICA_DATABASE_URL reads stay on the primary
+replica_engine = _create_engine(settings.REPLICA_DATABASE_URL) if settings.REPLICA_DATABASE_URL else engine
+
+# -----------------------------
+# Session routing
+# -----------------------------
+class RoutingSession(Session):
+    """
+    Session that can send reads to the replica.
+
+    With use_replica=True, plain SELECTs go to replica_engine until the
+    session writes anything (a flush, INSERT/UPDATE/DELETE, SELECT ... FOR
+    UPDATE, raw SQL). From then on it stays pinned to the primary, so it
+    reads its own writes (objects loaded before that keep what the replica
+    returned until refreshed). Without use_replica everything goes to the
+    primary.
+    """
+
+    def __init__(self, *args, use_replica: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.use_replica = use_replica
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.use_replica:
+            if not self._flushing and isinstance(clause, Select) and clause._for_update_arg is None:
+                return replica_engine
+            self.use_replica = False  # Pinned to the primary
+        return engine
 
 # -----------------------------
 # Session factory
 # -----------------------------
 SessionLocal = sessionmaker(
+    class_=RoutingSession,
     autocommit=False,
     autoflush=False,
     bind=engine,
@@ -28,7 +66,7 @@ SessionLocal = sessionmaker(
 Base = declarative_base()
 
 # -----------------------------
-# FastAPI DB dependency
+# FastAPI DB dependencies
 # -----------------------------
 def get_db():
     db = SessionLocal()
@@ -36,3 +74,12 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_read_db():
+    """For read-only handlers: queries go to the replica (see RoutingSession)."""
+    db = SessionLocal(use_replica=True)
+    try:
+        yield db
+    finally:
+        db.close()
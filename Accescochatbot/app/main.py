@@ -1,28 +1,65 @@
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import asdict
 from fastapi import FastAPI
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
 from Accescochatbot.app.routers.webhook import router as webhook_router
+from Accescochatbot.app.routers.catalog import router as catalog_router
+from Accescochatbot.app.routers.orders import router as orders_router
+from Accescochatbot.app.routers.chat import router as chat_router
+from Accescochatbot.app.config import settings
+from Accescochatbot.app.services.archive_service import run_archival
+from Accescochatbot.app.services.sweeper_service import SWEEP_STATS, run_sweeper
+from Accescochatbot.app.services.order_events import start_listener
+from Accescochatbot.app.services import dialogflow_client
+from Accescochatbot.app.utils.scheduler import run_periodically
 from fastapi import Request                                                                                             
 
-app = FastAPI()
+# 👇 BACKGROUND JOBS (started with the app, cancelled on shutdown)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    stop_listener = start_listener(asyncio.get_running_loop())  # Order status push
+    jobs = []
+    if settings.ARCHIVE_INTERVAL_MINUTES > 0:
+        jobs.append(run_periodically(settings.ARCHIVE_INTERVAL_MINUTES * 60, run_archival, name="order archival"))
+    if settings.SWEEP_INTERVAL_MINUTES > 0:
+        jobs.append(run_periodically(settings.SWEEP_INTERVAL_MINUTES * 60, run_sweeper, name="cart sweeper"))
+    yield
+    for job in jobs:
+        job.cancel()
+    stop_listener()
+
+
+app = FastAPI(lifespan=lifespan)
 
 templates = Jinja2Templates(directory="app/templates")
 
 from Accescochatbot.app.database import SessionLocal
 from sqlalchemy import text
-from Accescochatbot.app.database import engine
+from Accescochatbot.app.database import engine, replica_engine
 
 @app.get("/db-test")
 def db_test():
     try:
         with engine.connect() as conn:
             conn.execute(text("SELECT 1"))
+        if replica_engine is not engine:
+            with replica_engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            return {"db": "connected", "replica": "connected"}
         return {"db": "connected"}
     except Exception as e:
         return {"error": str(e)}
 
 
+@app.get("/metrics/sweeper")
+def sweeper_metrics():
+    """Abandoned-cart sweeper counters for this worker process."""
+    return asdict(SWEEP_STATS)
+
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -33,10 +70,22 @@ app.add_middleware(
 # 👇 ROOT URL → CHATBOT
 @app.get("/", response_class=HTMLResponse)
 def show_chat(request: Request):
+    # The local /chat panel needs Dialogflow detectIntent for what it can't match
+    # itself (menu items are Dialogflow entities); otherwise serve the hosted messenger
     return templates.TemplateResponse(
+        request,
         "chat.html",
-        {"request": request}
+        {"local_chat": dialogflow_client.is_configured()}
     )
 
 # 👇 DIALOGFLOW WEBHOOK
-app.include_router(webhook_router)
\ No newline at end of file
+app.include_router(webhook_router)
+
+# 👇 CATALOG SYNC
+app.include_router(catalog_router)
+
+# 👇 ORDER STATUS PUSH
+app.include_router(orders_router)
+
+# 👇 DIRECT CHAT (local intent matcher)
+app.include_router(chat_router)
@@ -1,3 +1,5 @@
 from .products import Products
 from .orders import Orders
 from .cancel_feedback import Cancel_Feedback
+from .orders_archive import OrdersArchive
+from .chat_sessions import ChatSessions
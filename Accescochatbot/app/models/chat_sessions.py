@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, JSON, DateTime
+from datetime import datetime
+from Accescochatbot.app.database import Base
+
+class ChatSessions(Base):
+    """Conversation state for the /chat endpoint (services/chat_service.py), one row per chat session."""
+    __tablename__ = "chat_sessions"
+
+    session_id = Column(String(64), primary_key=True)
+    state = Column(JSON, nullable=False)  # intent_matcher.ChatState as a dict
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
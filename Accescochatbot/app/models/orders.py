@@ -1,14 +1,45 @@
-from sqlalchemy import Column, Integer, String, JSON, DateTime
+from sqlalchemy import Column, Index, Integer, String, JSON, DateTime, Float, Sequence, event, func, select, text
 from datetime import datetime
 from Accescochatbot.app.database import Base
 
 class Orders(Base):
     __tablename__ = "orders"
 
-    id = Column(Integer, primary_key=True, index=True)
-    order_id = Column(String, unique=True, index=True, nullable=False)
+    # Partitioned by month on created_at (migrations/002), and Postgres wants the
+    # partition key in every unique constraint: the key is (id, created_at) and
+    # order_id has a plain index. order_service checks new order ids are unused.
+    id = Column(Integer, Sequence("orders_id_seq"), primary_key=True)
+    order_id = Column(String, index=True, nullable=False)
     platform = Column(String, nullable=False)
-    session_id = Column(String, index=True)
+    session_id = Column(String)
     items = Column(JSON, nullable=True)
     status = Column(String, default="pending")
-    created_at = Column(DateTime, default=datetime.utcnow)
+    total = Column(Float, nullable=True)  # Priced on confirm (services/pricing_service.py)
+    version = Column(Integer, nullable=False, default=0, server_default="0")  # Bumped on every change
+    created_at = Column(DateTime, primary_key=True, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)  # Last cart change
+
+    # UPDATEs check and bump `version`, so writes based on a stale read fail
+    __mapper_args__ = {"version_id_col": version}
+
+    # The partial indexes from migrations 002/003: they only cover rows still in play
+    __table_args__ = tuple(
+        Index(name, column, postgresql_where=text(where), sqlite_where=text(where))
+        for name, column, where in (
+            ("ix_orders_pending_session", "session_id", "status = 'pending'"),
+            ("ix_orders_pending_idle", "updated_at", "status = 'pending'"),
+            ("ix_orders_archivable", "created_at", "status IN ('confirmed', 'cancelled', 'expired')"),
+        )
+    )
+
+
+@event.listens_for(Orders, "before_insert")
+def _sqlite_next_id(mapper, connection, target):
+    """SQLite (local runs) only autoincrements a single-column key, so number ids here."""
+    if target.id is not None or connection.dialect.name != "sqlite":
+        return
+    last = connection.execute(select(func.max(Orders.id))).scalar() or 0
+    if connection.dialect.has_table(connection, "orders_archive"):
+        # Archived rows keep their id; don't hand it out again
+        last = max(last, connection.execute(select(func.max(Base.metadata.tables["orders_archive"].c.id))).scalar() or 0)
+    target.id = last + 1
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, JSON, DateTime, Float
+from datetime import datetime
+from Accescochatbot.app.database import Base
+
+class OrdersArchive(Base):
+    """Confirmed/cancelled orders moved out of `orders` by the archival job."""
+    __tablename__ = "orders_archive"
+
+    id = Column(Integer, primary_key=True)  # Kept from orders.id
+    order_id = Column(String, unique=True, index=True, nullable=False)
+    platform = Column(String, nullable=False)
+    session_id = Column(String)
+    items = Column(JSON, nullable=True)
+    status = Column(String)
+    total = Column(Float, nullable=True)
+    version = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime)
+    updated_at = Column(DateTime)
+    archived_at = Column(DateTime, default=datetime.utcnow)
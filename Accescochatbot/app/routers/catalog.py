@@ -0,0 +1,57 @@
+# app/routers/catalog.py
+import hmac
+import io
+import tempfile
+from dataclasses import asdict
+
+from fastapi import APIRouter, Header, HTTPException, Request
+from starlette.concurrency import run_in_threadpool
+
+from Accescochatbot.app.config import settings
+from Accescochatbot.app.database import SessionLocal
+from Accescochatbot.app.services.catalog_service import FEED_FORMATS, SyncResult, sync_catalog
+from Accescochatbot.app.utils.responses import FastJSONResponse
+
+router = APIRouter(default_response_class=FastJSONResponse)
+
+SPOOL_MAX_BYTES = 8 * 1024 * 1024  # Bigger uploads spill to a temp file
+
+
+def _sync_upload(upload, fmt: str, full: bool) -> SyncResult:
+    db = SessionLocal()
+    try:
+        return sync_catalog(db, io.TextIOWrapper(upload, encoding="utf-8", newline=""), fmt, full)
+    finally:
+        db.close()
+
+
+# -------------------------------------------------------
+# CATALOG SYNC
+# -------------------------------------------------------
+@router.post("/catalog/sync")
+async def catalog_sync(
+    request: Request,
+    format: str = "csv",
+    full: bool = False,
+    x_sync_token: str = Header(""),
+):
+    """
+    Syncs products from the CSV/NDJSON feed in the request body (see
+    catalog_service). Needs the X-Sync-Token header to match
+    CATALOG_SYNC_TOKEN; with no token configured the endpoint is off.
+    """
+    if not settings.CATALOG_SYNC_TOKEN or not hmac.compare_digest(x_sync_token, settings.CATALOG_SYNC_TOKEN):
+        raise HTTPException(status_code=403, detail="Invalid sync token")
+    if format not in FEED_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of {FEED_FORMATS}")
+
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES) as upload:
+        async for chunk in request.stream():
+            upload.write(chunk)
+        upload.seek(0)
+        try:
+            result = await run_in_threadpool(_sync_upload, upload, format, full)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    return FastJSONResponse(asdict(result))
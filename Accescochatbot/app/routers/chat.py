@@ -0,0 +1,33 @@
+# app/routers/chat.py
+from dataclasses import asdict
+
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel, Field
+from sqlalchemy.orm import Session
+
+from Accescochatbot.app.database import get_db, get_read_db
+from Accescochatbot.app.services.chat_service import chat_turn
+from Accescochatbot.app.utils.messages import DEFAULT_LOCALE
+from Accescochatbot.app.utils.responses import FastJSONResponse
+
+router = APIRouter(default_response_class=FastJSONResponse)
+
+
+class ChatMessage(BaseModel):
+    session: str = Field(min_length=1, max_length=64)
+    text: str = Field(min_length=1, max_length=500)
+    languageCode: str = DEFAULT_LOCALE
+
+
+# -------------------------------------------------------
+# DIRECT CHAT (local matcher, Dialogflow fallback)
+# -------------------------------------------------------
+@router.post("/chat")
+async def chat(
+    message: ChatMessage,
+    db: Session = Depends(get_db),
+    read_db: Session = Depends(get_read_db),
+):
+    """One chat turn: {"reply", "source", "intent", "confidence"}."""
+    result = await chat_turn(message.session, message.text, message.languageCode, db, read_db)
+    return asdict(result)
@@ -0,0 +1,68 @@
+# app/routers/orders.py
+import asyncio
+
+import orjson
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from Accescochatbot.app.database import SessionLocal
+from Accescochatbot.app.services.archive_service import find_order
+from Accescochatbot.app.services.order_events import ORDER_STATUS_HUB
+
+router = APIRouter()
+
+KEEPALIVE_SECONDS = 15  # Keeps proxies from closing a quiet stream
+
+
+def _current_status(order_id: str):
+    db = SessionLocal(use_replica=True)
+    try:
+        order = find_order(db, order_id)
+        return order.status if order else None
+    finally:
+        db.close()
+
+
+def _sse(event: dict) -> bytes:
+    return b"event: status\ndata: " + orjson.dumps(event) + b"\n\n"
+
+
+# -------------------------------------------------------
+# ORDER STATUS STREAM (Server-Sent Events)
+# -------------------------------------------------------
+@router.get("/orders/{order_id}/events")
+async def order_events(order_id: str, request: Request):
+    """
+    Streams `status` events ({"order_id", "status"}) for one order: the
+    current status first, then every change as it is committed.
+    """
+    # Subscribe before reading, so a change in between isn't missed
+    queue = ORDER_STATUS_HUB.add_subscriber(order_id)
+    status = None
+    try:
+        status = await run_in_threadpool(_current_status, order_id)
+    finally:
+        if status is None:
+            ORDER_STATUS_HUB.remove_subscriber(order_id, queue)
+    if status is None:
+        raise HTTPException(status_code=404, detail=f"No order {order_id}")
+
+    async def stream():
+        try:
+            yield _sse({"order_id": order_id, "status": status})
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield b": keepalive\n\n"
+                    continue
+                yield _sse(event)
+        finally:
+            ORDER_STATUS_HUB.remove_subscriber(order_id, queue)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,8 +1,12 @@
 # app/routers/webhook.py
 from fastapi import APIRouter, Request, Depends
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from Accescochatbot.app.database import get_db
+from Accescochatbot.app.database import get_db, get_read_db
+from Accescochatbot.app.utils.messages import locale_of, render
+from Accescochatbot.app.utils.responses import FastJSONResponse, fulfillment
+from Accescochatbot.app.utils.concurrency import SESSION_LOCKS
 from Accescochatbot.app.services.order_service import (
     handle_add_item,
     handle_confirm_order,
@@ -14,38 +18,62 @@ from Accescochatbot.app.services.cancel_service import (
     handle_cancel_feedback
 )
 
-router = APIRouter()
+router = APIRouter(default_response_class=FastJSONResponse)
 
 print(">>> WEBHOOK LOADED <<<")
 
 
+async def _run_locked(handler, body: dict, **kwargs):
+    """
+    Runs a handler that writes in the threadpool, one at a time per
+    Dialogflow session; other sessions go ahead in parallel.
+    """
+    session_id = body.get("session", "").split("/")[-1]
+    async with SESSION_LOCKS.hold(session_id):
+        return await run_in_threadpool(handler, body=body, **kwargs)
+
+
 # -------------------------------------------------------
 # MAIN WEBHOOK ENDPOINT
 # -------------------------------------------------------
 @router.post("/webhook")
-async def webhook(request: Request, db: Session = Depends(get_db)):
+async def webhook(
+    request: Request,
+    db: Session = Depends(get_db),
+    read_db: Session = Depends(get_read_db),  # Replica; for handlers that only read
+):
     try:
         body = await request.json()
        # return {"fullfillmentText": "Welcome to the accesco bot"}
     except Exception:
-        return {"fulfillmentText": "Invalid JSON received."}
+        return fulfillment(render("invalid_json"))
 
     query = body.get("queryResult", {}) or {}
     intent = query.get("intent", {}).get("displayName", "") or ""
     params = query.get("parameters", {}) or {}
 
-    intent_lower = intent.lower()
-
     print("\n---------------------------")
     print("Intent Triggered:", intent)
     print("Parameters:", params)
     print("---------------------------\n")
 
+    return FastJSONResponse(await dispatch_intent(body, db, read_db))
+
+
+# -------------------------------------------------------
+# INTENT DISPATCH (shared with the local /chat endpoint)
+# -------------------------------------------------------
+async def dispatch_intent(body: dict, db: Session, read_db: Session) -> dict:
+    """Runs the handler for the Dialogflow request's intent; returns the webhook reply dict."""
+    query = body.get("queryResult", {}) or {}
+    intent_lower = (query.get("intent", {}).get("displayName", "") or "").lower()
+
     # -------------------------------------------------------
     # 💥 ADD ITEM — EATFEAST
     # -------------------------------------------------------
     if intent_lower.startswith("order eatfeast - custom") and "- no" not in intent_lower:
-        order_id, response = handle_add_item(
+        order_id, response = await _run_locked(
+            handle_add_item,
             body=body,
             db=db,
             platform="EatFeast",
@@ -55,14 +83,15 @@ async def webhook(request: Request, db: Session = Depends(get_db)):
 
     # CONFIRM ORDER — EatFeast
     if intent_lower.startswith("order eatfeast - custom - no"):
-        reply = handle_confirm_order(body=body, db=db, platform="EatFeast")
+        reply = await _run_locked(handle_confirm_order, body=body, db=db, platform="EatFeast")
         return {"fulfillmentText": reply}
 
     # -------------------------------------------------------
     # 🛒 ADD ITEM — GROMART
     # -------------------------------------------------------
     if intent_lower.startswith("order gromart - custom") and "- no" not in intent_lower:
-        order_id, response = handle_add_item(
+        order_id, response = await _run_locked(
+            handle_add_item,
             body=body,
             db=db,
             platform="GroMart",
@@ -77,26 +106,25 @@ async def webhook(request: Request, db: Session = Depends(get_db)):
 
     # CONFIRM ORDER — GroMart
     if intent_lower.startswith("order gromart - custom - no"):
-        reply = handle_confirm_order(body=body, db=db, platform="GroMart")
+        reply = await _run_locked(handle_confirm_order, body=body, db=db, platform="GroMart")
         return {"fulfillmentText": reply}
 
     # -------------------------------------------------------
     # ❌ CANCEL ORDER (Ask)
     # -------------------------------------------------------
     if intent_lower == "cancel order":
-        reply = handle_cancel_order(body=body, db=db)
-        return {"fulfillmentText": reply}
+        return await run_in_threadpool(handle_cancel_order, body=body, db=read_db)
 
     # CANCEL ORDER (Confirmed)
     if intent_lower == "cancel order - yes":
-        reply = handle_cancel_confirm(body=body, db=db)
+        reply = await _run_locked(handle_cancel_confirm, body=body, db=db)
         return {"fulfillmentText": reply}
     
     # -------------------------------------------------------
     # 📝 CANCEL FEEDBACK
     #---------------------------------------------------------
     if intent_lower == "cancel order - yes - confirm":
-        reply = handle_cancel_feedback(body=body, db=db)
+        reply = await _run_locked(handle_cancel_feedback, body=body, db=db)
         return {"fulfillmentText": reply}
     
     # ============================================================
@@ -104,12 +132,12 @@ async def webhook(request: Request, db: Session = Depends(get_db)):
     # ============================================================
     # TRACK ORDER
     if "track order" in intent_lower:
-        reply = handle_track_order(body=body, db=db)
+        reply = await run_in_threadpool(handle_track_order, body=body, db=read_db)
         return {"fulfillmentText": reply}
 
 
     # -------------------------------------------------------
     # FALLBACK
     # -------------------------------------------------------
-    return {"fulfillmentText": "Sorry, I didn't understand that."}
+    return {"fulfillmentText": render("fallback", locale_of(body))}
 
@@ -0,0 +1,133 @@
+# app/services/archive_service.py
+"""
+Hot/cold order storage.
+
+`orders` holds pending orders plus recent history; it is range-partitioned
+by month on created_at in Postgres (migrations/002_orders_partitioning.sql).
+archive_orders() moves confirmed/cancelled/expired orders older than
+ARCHIVE_AFTER_DAYS into `orders_archive` in batches, so the hot table and its
+indexes stay about the size of the last few months. Lookups by order id go
+through find_order(), which checks `orders` first and falls back to the
+archive.
+
+    python -m Accescochatbot.app.services.archive_service --days 90
+"""
+import argparse
+from datetime import datetime, timedelta
+from typing import Optional, Union
+
+from sqlalchemy import delete, insert, select, text
+from sqlalchemy.orm import Session
+
+from Accescochatbot.app.config import settings
+from Accescochatbot.app.database import SessionLocal
+from Accescochatbot.app.models.orders import Orders
+from Accescochatbot.app.models.orders_archive import OrdersArchive
+
+ARCHIVED_STATUSES = ("confirmed", "cancelled", "expired")
+PARTITIONS_AHEAD = 3  # Monthly partitions created ahead of time
+
+
+# -------------------------------------------------------------
+# Lookup
+# -------------------------------------------------------------
+def find_order(db: Session, order_id: str) -> Optional[Union[Orders, OrdersArchive]]:
+    """The order with this id, from the hot table or else the archive."""
+    order = db.query(Orders).filter(Orders.order_id == order_id).first()
+    if order is None:
+        order = db.query(OrdersArchive).filter(OrdersArchive.order_id == order_id).first()
+    return order
+
+
+# -------------------------------------------------------------
+# Archival
+# -------------------------------------------------------------
+def archive_orders(
+    db: Session,
+    older_than_days: int = settings.ARCHIVE_AFTER_DAYS,
+    batch_size: int = settings.ARCHIVE_BATCH_SIZE,
+) -> int:
+    """
+    Moves confirmed/cancelled/expired orders created more than older_than_days
+    ago into orders_archive, one transaction per batch. Returns how many moved.
+    """
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+    orders = Orders.__table__
+    columns = [c.name for c in orders.columns]
+    old = (orders.c.status.in_(ARCHIVED_STATUSES), orders.c.created_at < cutoff)
+    moved = 0
+
+    while True:
+        # SKIP LOCKED lets several app workers run the job without colliding
+        batch = db.execute(
+            select(orders.c.id)
+            .where(*old)
+            .order_by(orders.c.created_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        ).scalars().all()
+        if not batch:
+            break
+
+        # created_at < cutoff keeps Postgres to the old partitions
+        db.execute(
+            insert(OrdersArchive.__table__).from_select(
+                columns, select(*orders.columns).where(orders.c.id.in_(batch), *old)
+            )
+        )
+        db.execute(delete(orders).where(orders.c.id.in_(batch), *old))
+        db.commit()
+        moved += len(batch)
+
+        if len(batch) < batch_size:
+            break
+
+    return moved
+
+
+def maintain_partitions(db: Session, older_than_days: int = settings.ARCHIVE_AFTER_DAYS):
+    """Postgres only: creates the next months' partitions and drops emptied old ones."""
+    if db.get_bind().dialect.name != "postgresql":
+        return
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+    db.execute(
+        text(
+            "SELECT orders_ensure_partition((date_trunc('month', now()) + make_interval(months => m))::date) "
+            "FROM generate_series(0, :ahead) AS m"
+        ),
+        {"ahead": PARTITIONS_AHEAD},
+    )
+    db.execute(text("SELECT orders_drop_empty_partitions(:cutoff)"), {"cutoff": cutoff})
+    db.commit()
+
+
+def run_archival():
+    """One archival pass with its own session; what the background job runs."""
+    db = SessionLocal()
+    try:
+        moved = archive_orders(db)
+        maintain_partitions(db)
+        if moved:
+            print(f"Archived {moved} orders")
+        return moved
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Move old confirmed/cancelled/expired orders to orders_archive.")
+    parser.add_argument("--days", type=int, default=settings.ARCHIVE_AFTER_DAYS, help="Archive orders older than this")
+    parser.add_argument("--batch", type=int, default=settings.ARCHIVE_BATCH_SIZE, help="Orders per transaction")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        moved = archive_orders(db, args.days, args.batch)
+        maintain_partitions(db, args.days)
+    finally:
+        db.close()
+    print(f"Archived {moved} orders older than {args.days} days")
+
+
+if __name__ == "__main__":
+    main()
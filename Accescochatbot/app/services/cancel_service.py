@@ -1,14 +1,25 @@
 # app/services/cancel_service.py
 from sqlalchemy.orm import Session
-from Accescochatbot.app.models.orders import Orders
+from Accescochatbot.app.services.archive_service import find_order
+from Accescochatbot.app.services.order_events import announce_status
 from Accescochatbot.app.models.cancel_feedback import Cancel_Feedback
+from Accescochatbot.app.models.orders_archive import OrdersArchive
+from Accescochatbot.app.utils.messages import locale_of, render
+from Accescochatbot.app.utils.concurrency import retry_on_conflict
+
+CANCEL_CONTEXT = "cancel-order"  # Holds the order_id while the user confirms
 
 
 # -------------------------------------------------------
 # STEP 1: Ask user to confirm cancellation
 # -------------------------------------------------------
-def handle_cancel_order(body: dict, db: Session):
+def handle_cancel_order(body: dict, db: Session) -> dict:
+    """
+    The webhook reply. When it asks the user to confirm, it carries the
+    CANCEL_CONTEXT output context with the order_id to cancel.
+    """
     params = body.get("queryResult", {}).get("parameters", {}) or {}
+    locale = locale_of(body)
 
     # Try reading order_id from parameters
     order_id = params.get("order_id")
@@ -24,23 +35,36 @@ def handle_cancel_order(body: dict, db: Session):
 
     # Still nothing?
     if not order_id:
-        return f"Please tell me the Order ID you want to cancel."
+        return {"fulfillmentText": render("cancel_ask_id", locale)}
 
     # Check if order exists
-    order = db.query(Orders).filter(Orders.order_id == order_id).first()
+    order = find_order(db, order_id)
 
     if not order:
-        return f"I couldn't find any order with ID {order_id}. Please check again."
+        return {"fulfillmentText": render("cancel_not_found", locale, order_id=order_id)}
+
+    # Archived orders are long finished, and the archive is read-only
+    if isinstance(order, OrdersArchive):
+        return {"fulfillmentText": render("cancel_archived", locale, order_id=order_id)}
 
     # Return confirmation + store order_id in context
-    return f"Are you sure you want to cancel order {order_id}?"
+    return {
+        "fulfillmentText": render("cancel_confirm", locale, order_id=order_id),
+        "outputContexts": [{
+            "name": f"{body.get('session', '')}/contexts/{CANCEL_CONTEXT}",
+            "lifespanCount": 2,
+            "parameters": {"order_id": order_id},
+        }],
+    }
 
 
 # -------------------------------------------------------
 # STEP 2: User says "Yes" → Cancel the order
 # -------------------------------------------------------
+@retry_on_conflict
 def handle_cancel_confirm(body: dict, db: Session):
     contexts = body.get("queryResult", {}).get("outputContexts", []) or []
+    locale = locale_of(body)
 
     order_id = None
     for ctx in contexts:
@@ -50,20 +74,24 @@ def handle_cancel_confirm(body: dict, db: Session):
             break
 
     if not order_id:
-        return "I couldn't identify which order to cancel. Please say the Order ID again."
+        return render("cancel_unknown_order", locale)
 
     # Fetch DB order
-    order = db.query(Orders).filter(Orders.order_id == order_id).first()
+    order = find_order(db, order_id)
 
     if not order:
-        return f"Order {order_id} was not found in our system."
+        return render("cancel_order_missing", locale, order_id=order_id)
+
+    if isinstance(order, OrdersArchive):
+        return render("cancel_archived", locale, order_id=order_id)
 
     # Cancel the order
     order.status = "cancelled"
     db.commit()
+    announce_status(db, order.order_id, order.status)
 
     # Ask user for feedback → store order_id in context for next step
-    return f"Your order {order_id} has been cancelled. Could you tell me why you cancelled it?"
+    return render("cancelled", locale, order_id=order_id)
 
 
 # -------------------------------------------------------
@@ -75,6 +103,7 @@ def handle_cancel_feedback(body: dict, db: Session):
 
     contexts = body.get("queryResult", {}).get("outputContexts", []) or []
     order_id = None
+    locale = locale_of(body)
 
     for ctx in contexts:
         ctx_params = ctx.get("parameters", {}) or {}
@@ -82,11 +111,11 @@ def handle_cancel_feedback(body: dict, db: Session):
             order_id = ctx_params.get("order_id")
 
     if not order_id:
-        return "Thank you for your feedback."
+        return render("feedback_thanks", locale)
 
     # Save feedback
     fb = Cancel_Feedback(order_id=order_id, feedback=feedback)
     db.add(fb)
     db.commit()
 
-    return "Thank you for your feedback. We appreciate it!"
+    return render("feedback_saved", locale)
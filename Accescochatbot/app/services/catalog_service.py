@@ -0,0 +1,259 @@
+# app/services/catalog_service.py
+"""
+Bulk product catalog sync.
+
+A feed is CSV with a header row, or NDJSON with one product per line. Both
+use the fields name, price and available (optional, default true). Products
+are matched by name.
+
+Syncs run one at a time: a lock in this process and, on Postgres, a
+transaction-level advisory lock shared by every worker and the CLI. Without
+it, two overlapping syncs would both see a new product as missing and both
+insert it.
+
+sync_catalog() streams the feed and compares each row's (price, available)
+with the current table, keeping only rows that are new or changed. With
+full=True the feed is the whole catalog, and products missing from it are
+marked unavailable. The changes are then applied in one transaction:
+
+  - Postgres: COPY into a temporary staging table, then one UPDATE ... FROM
+    and one INSERT ... SELECT.
+  - Anything else (SQLite for local runs): batched executemany.
+
+Afterwards every callback registered with on_catalog_change() runs, so
+in-process product caches can drop what they hold.
+
+    python -m Accescochatbot.app.services.catalog_service feed.csv [--full]
+"""
+import argparse
+import csv
+import io
+import math
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+import orjson
+from sqlalchemy import bindparam, func, insert, select, text, update
+from sqlalchemy.orm import Session
+
+from Accescochatbot.app.database import SessionLocal
+from Accescochatbot.app.models.products import Products
+
+FEED_FORMATS = ("csv", "ndjson")
+TRUE_VALUES = {"1", "true", "t", "yes", "y"}
+
+FeedRow = Tuple[str, float, bool]              # name, price, available
+Change = Tuple[str, Optional[float], bool]     # price None: keep the current price
+
+_listeners: List[Callable[[], None]] = []
+_sync_lock = threading.Lock()  # The endpoint runs syncs in the threadpool
+
+
+@dataclass
+class SyncResult:
+    rows: int = 0            # Feed rows read
+    inserted: int = 0
+    updated: int = 0
+    removed: int = 0         # Marked unavailable by a full sync
+    unchanged: int = 0
+    seconds: float = 0.0
+
+
+def on_catalog_change(callback: Callable[[], None]) -> Callable[[], None]:
+    """Registers callback() to run after a sync changes products. Usable as a decorator."""
+    _listeners.append(callback)
+    return callback
+
+
+# -------------------------------------------------------------
+# Feed parsing
+# -------------------------------------------------------------
+def _feed_row(row: dict, line: int) -> FeedRow:
+    try:
+        name = str(row["name"]).strip()
+        price = float(row["price"])
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Feed line {line}: bad or missing name/price ({e})") from None
+    if not name:
+        raise ValueError(f"Feed line {line}: empty product name")
+    if not math.isfinite(price) or price < 0:
+        raise ValueError(f"Feed line {line}: price must be a non-negative number, got {row['price']!r}")
+
+    available = row.get("available")
+    if available is None or available == "":
+        available = True
+    elif isinstance(available, str):
+        available = available.strip().lower() in TRUE_VALUES
+    return name, price, bool(available)
+
+
+def read_feed(stream: TextIO, fmt: str = "csv") -> Iterator[FeedRow]:
+    """(name, price, available) for each product in a CSV or NDJSON text stream."""
+    if fmt == "ndjson":
+        for line, text in enumerate(stream, 1):
+            if text.strip():
+                try:
+                    row = orjson.loads(text)
+                except orjson.JSONDecodeError as e:
+                    raise ValueError(f"Feed line {line}: invalid JSON ({e})") from None
+                yield _feed_row(row, line)
+    elif fmt == "csv":
+        for line, row in enumerate(csv.DictReader(stream), 2):
+            yield _feed_row(row, line)
+    else:
+        raise ValueError(f"Unknown feed format {fmt!r}; expected one of {FEED_FORMATS}")
+
+
+# -------------------------------------------------------------
+# Diff
+# -------------------------------------------------------------
+def load_current(db: Session) -> Dict[str, Tuple[float, bool]]:
+    """name -> (price, available) for every product; the diff's view of the table."""
+    rows = db.execute(select(Products.name, Products.price, Products.available))
+    return {name: (price, bool(available)) for name, price, available in rows}
+
+
+def diff_catalog(
+    current: Dict[str, Tuple[float, bool]], feed: Iterable[FeedRow], full: bool = False
+) -> Tuple[List[Change], List[Change], SyncResult]:
+    """
+    (inserts, updates, result) taking the table from `current` (see
+    load_current) to the feed. A name repeated in the feed keeps its last row.
+
+    The feed is read once and its rows aren't kept, only the new or changed
+    ones and the set of names seen (which a full sync needs to find missing
+    products). Memory is `current` plus those names, not the whole feed.
+    """
+    changed: Dict[str, FeedRow] = {}
+    seen = set()
+    result = SyncResult()
+    for row in feed:
+        name, price, available = row
+        result.rows += 1
+        seen.add(name)
+        if current.get(name) == (price, available):
+            changed.pop(name, None)  # A later row for the name put it back as it was
+        else:
+            changed[name] = row
+
+    inserts, updates = [], []
+    for name, price, available in changed.values():
+        (updates if name in current else inserts).append((name, price, available))
+    result.inserted, result.updated = len(inserts), len(updates)
+    result.unchanged = len(seen) - len(changed)
+
+    if full:
+        for name, (_, available) in current.items():
+            if available and name not in seen:
+                updates.append((name, None, False))
+                result.removed += 1
+    return inserts, updates, result
+
+
+# -------------------------------------------------------------
+# Apply
+# -------------------------------------------------------------
+def _apply_postgres(db: Session, inserts: List[Change], updates: List[Change]):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(inserts + updates)  # A None price is written as NULL
+    buffer.seek(0)
+
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.execute(
+            "CREATE TEMP TABLE products_staging "
+            "(name text PRIMARY KEY, price double precision, available boolean NOT NULL) ON COMMIT DROP"
+        )
+        cursor.copy_expert("COPY products_staging (name, price, available) FROM STDIN WITH (FORMAT csv)", buffer)
+        cursor.execute(
+            "UPDATE products p SET price = coalesce(s.price, p.price), available = s.available, "
+            "updated_at = now() AT TIME ZONE 'utc' "
+            "FROM products_staging s WHERE p.name = s.name"
+        )
+        cursor.execute(
+            "INSERT INTO products (name, price, available, updated_at) "
+            "SELECT s.name, s.price, s.available, now() AT TIME ZONE 'utc' FROM products_staging s "
+            "WHERE s.price IS NOT NULL AND NOT EXISTS (SELECT 1 FROM products p WHERE p.name = s.name)"
+        )
+    finally:
+        cursor.close()
+
+
+def _apply_generic(db: Session, inserts: List[Change], updates: List[Change]):
+    now = datetime.utcnow()
+    if inserts:
+        db.execute(
+            insert(Products),
+            [{"name": n, "price": p, "available": a, "updated_at": now} for n, p, a in inserts],
+        )
+    if updates:
+        db.execute(
+            update(Products.__table__)
+            .where(Products.name == bindparam("key"))
+            .values(
+                price=func.coalesce(bindparam("new_price"), Products.price),
+                available=bindparam("new_available"),
+                updated_at=now,
+            ),
+            [{"key": n, "new_price": p, "new_available": a} for n, p, a in updates],
+        )
+
+
+def _lock_catalog(db: Session):
+    """Postgres only: blocks until no other sync holds the catalog, until commit/rollback."""
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text("SELECT pg_advisory_xact_lock(hashtext(:key))"), {"key": "catalog_sync"})
+
+
+def sync_catalog(db: Session, stream: TextIO, fmt: str = "csv", full: bool = False) -> SyncResult:
+    """Brings products in line with the feed in one transaction. Raises ValueError on a bad feed."""
+    start = time.perf_counter()
+    with _sync_lock:
+        try:
+            _lock_catalog(db)  # Before load_current, so the diff sees the previous sync's rows
+            inserts, updates, result = diff_catalog(load_current(db), read_feed(stream, fmt), full)
+
+            if inserts or updates:
+                if db.get_bind().dialect.name == "postgresql":
+                    _apply_postgres(db, inserts, updates)
+                else:
+                    _apply_generic(db, inserts, updates)
+            db.commit()
+        except BaseException:
+            db.rollback()  # Releases the advisory lock
+            raise
+
+    if inserts or updates:
+        for callback in _listeners:
+            callback()
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync the products table from a CSV/NDJSON feed.")
+    parser.add_argument("feed", help="Feed file, or - for stdin")
+    parser.add_argument("--format", choices=FEED_FORMATS, help="Default: from the file extension, else csv")
+    parser.add_argument("--full", action="store_true", help="Mark products missing from the feed unavailable")
+    args = parser.parse_args()
+
+    fmt = args.format or ("ndjson" if args.feed.endswith((".ndjson", ".jsonl")) else "csv")
+    stream = sys.stdin if args.feed == "-" else open(args.feed, encoding="utf-8", newline="")
+    db = SessionLocal()
+    try:
+        result = sync_catalog(db, stream, fmt, args.full)
+    finally:
+        db.close()
+        stream.close()
+    print(
+        f"{result.rows} rows: {result.inserted} inserted, {result.updated} updated, "
+        f"{result.removed} marked unavailable, {result.unchanged} unchanged in {result.seconds:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
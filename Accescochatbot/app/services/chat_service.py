@@ -0,0 +1,205 @@
+# app/services/chat_service.py
+"""
+Turns for the /chat endpoint (routers/chat.py).
+
+Each utterance goes to the local matcher (intent_matcher.match) first. A
+confident match is answered here without leaving the process. Webhook
+intents get a Dialogflow-shaped request and go through the same
+dispatch_intent() as /webhook, so the order and cancel handlers don't know
+the difference. Anything below settings.CHAT_CONFIDENCE goes to Dialogflow's
+detectIntent, and if Dialogflow isn't configured the fallback template is
+the reply.
+
+What Dialogflow keeps in contexts is kept here in a ChatState per chat
+session, stored in `chat_sessions` so any worker can take the next turn.
+Turns for one session run one at a time in a worker (SESSION_LOCKS), and
+the state is saved with an upsert, so two workers starting the same session
+don't collide on its row.
+
+Dialogflow only sees the turns passed to it, so a follow-up it has to
+resolve (an EatFeast dish is a Dialogflow entity, not a product) needs the
+context its own intent set. "Order from <platform>" is therefore always
+sent to Dialogflow when it is configured; the platform is noted here too,
+so later items the matcher knows still stay local.
+"""
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from Accescochatbot.app.config import settings
+from Accescochatbot.app.models.chat_sessions import ChatSessions
+from Accescochatbot.app.routers.webhook import dispatch_intent
+from Accescochatbot.app.services import dialogflow_client
+from Accescochatbot.app.services import intent_matcher as im
+from Accescochatbot.app.services.cancel_service import CANCEL_CONTEXT
+from Accescochatbot.app.services.product_service import handle_product_queries
+from Accescochatbot.app.services.venture_service import VENTURE_DETAILS, venture_descriptions
+from Accescochatbot.app.utils.concurrency import SESSION_LOCKS
+from Accescochatbot.app.utils.messages import locale_of, render
+
+STATE_FIELDS = {f.name for f in fields(im.ChatState)}
+DIALOGFLOW_FIRST = {im.ORDER_START}  # Sent to Dialogflow when configured, so it sets its contexts
+
+
+@dataclass
+class ChatReply:
+    reply: str
+    source: str          # "local" or "dialogflow"
+    intent: Optional[str]
+    confidence: float
+
+
+# -------------------------------------------------------------
+# Session state (chat_sessions table)
+# -------------------------------------------------------------
+def _load_state(db: Session, session_id: str) -> im.ChatState:
+    row = db.get(ChatSessions, session_id)
+    cutoff = datetime.utcnow() - timedelta(minutes=settings.CHAT_SESSION_TTL_MINUTES)
+    if row is None or row.updated_at < cutoff:
+        return im.ChatState()
+    return im.ChatState(**{k: v for k, v in (row.state or {}).items() if k in STATE_FIELDS})
+
+
+def _save_state(db: Session, session_id: str, state: im.ChatState):
+    # An upsert, not SELECT-then-INSERT: two workers may start the same session at once
+    insert = postgresql.insert if db.get_bind().dialect.name == "postgresql" else sqlite.insert
+    values = {"state": asdict(state), "updated_at": datetime.utcnow()}
+    db.execute(
+        insert(ChatSessions)
+        .values(session_id=session_id, **values)
+        .on_conflict_do_update(index_elements=[ChatSessions.session_id], set_=values)
+    )
+    db.commit()
+
+
+async def _catalog(read_db: Session) -> im.CatalogIndex:
+    return im.cached_catalog() or await run_in_threadpool(im.load_catalog, read_db)
+
+
+# -------------------------------------------------------------
+# Webhook intents
+# -------------------------------------------------------------
+def _webhook_body(session_id: str, locale: str, intent: str, params: dict, contexts: list) -> dict:
+    """The request Dialogflow would have sent /webhook for this turn."""
+    return {
+        "session": f"local/sessions/{session_id}",
+        "queryResult": {
+            "intent": {"displayName": intent},
+            "parameters": params,
+            "outputContexts": contexts,
+            "languageCode": locale,
+        },
+    }
+
+
+def _display_name(result: im.Match) -> str:
+    if result.intent == im.ADD_ITEM:
+        return f"order {result.platform.lower()} - custom"
+    if result.intent == im.CONFIRM:
+        return f"order {result.platform.lower()} - custom - no"
+    return result.intent
+
+
+def _order_context(order_id: str) -> list:
+    return [{"name": CANCEL_CONTEXT, "parameters": {"order_id": order_id}}]
+
+
+def _context_order_id(contexts: list, name: str) -> Optional[str]:
+    """The order_id of the output context called `name` ("<session>/contexts/<name>"), if set."""
+    for ctx in contexts or []:
+        if ctx.get("name", "").split("/")[-1] == name:
+            return (ctx.get("parameters") or {}).get("order_id")
+    return None
+
+
+async def _run_webhook_intent(
+    result: im.Match, state: im.ChatState, session_id: str, locale: str, db: Session, read_db: Session
+) -> str:
+    contexts = []
+    if result.intent in (im.ADD_ITEM, im.CONFIRM):
+        contexts = state.contexts
+    elif result.intent == im.CANCEL_YES:
+        contexts = _order_context(state.cancel_order_id)
+    elif result.intent == im.CANCEL_FEEDBACK:
+        contexts = _order_context(state.feedback_order_id)
+
+    body = _webhook_body(session_id, locale, _display_name(result), result.params, contexts)
+    response = await dispatch_intent(body, db, read_db)
+    reply = response.get("fulfillmentText", "")
+
+    # ---------------- What the next turn expects ----------------
+    if result.intent == im.ADD_ITEM:
+        state.platform = result.platform
+        state.contexts = response.get("outputContexts") or state.contexts
+    elif result.intent == im.CONFIRM:
+        state.platform, state.contexts = None, []
+    elif result.intent == im.CANCEL:
+        # Set only when the handler asked the user to confirm
+        state.cancel_order_id = _context_order_id(response.get("outputContexts"), CANCEL_CONTEXT)
+    elif result.intent == im.CANCEL_YES:
+        state.feedback_order_id, state.cancel_order_id = state.cancel_order_id, None
+    elif result.intent == im.CANCEL_FEEDBACK:
+        state.feedback_order_id = None
+    return reply
+
+
+# -------------------------------------------------------------
+# Local-only intents
+# -------------------------------------------------------------
+async def _run_local_intent(result: im.Match, state: im.ChatState, locale: str, read_db: Session) -> str:
+    if result.intent == im.WELCOME:
+        return render("welcome", locale)
+    if result.intent == im.ORDER_START:
+        state.platform = result.platform
+        return render("order_start", locale, platform=result.platform)
+    if result.intent == im.CANCEL_NO:
+        state.cancel_order_id = None
+        return render("cancel_kept", locale, order_id=result.params["order_id"])
+    if result.intent == im.PRODUCT_INFO:
+        body = _webhook_body("", locale, result.intent, result.params, [])
+        return await run_in_threadpool(handle_product_queries, body, read_db)
+    # VENTURE_INFO
+    return venture_descriptions(result.params.get("ventures") or list(VENTURE_DETAILS), locale)
+
+
+# -------------------------------------------------------------
+# ENTRY POINT
+# -------------------------------------------------------------
+async def chat_turn(session_id: str, text: str, locale: str, db: Session, read_db: Session) -> ChatReply:
+    locale = locale_of({"queryResult": {"languageCode": locale}})
+    # Its own key: dispatch_intent() takes SESSION_LOCKS on the bare session id
+    async with SESSION_LOCKS.hold(f"chat:{session_id}"):
+        state = await run_in_threadpool(_load_state, db, session_id)
+        result = await _answer(session_id, text, locale, state, db, read_db)
+        await run_in_threadpool(_save_state, db, session_id, state)
+    return result
+
+
+async def _answer(
+    session_id: str, text: str, locale: str, state: im.ChatState, db: Session, read_db: Session
+) -> ChatReply:
+    result = im.match(text, state, await _catalog(read_db))
+    to_dialogflow = result.confidence < settings.CHAT_CONFIDENCE or (
+        result.intent in DIALOGFLOW_FIRST and dialogflow_client.is_configured()
+    )
+
+    if to_dialogflow:
+        reply = await dialogflow_client.detect_intent(session_id, text, locale)
+        if reply is not None:
+            # Dialogflow holds this turn's follow-up now; only the order in progress stays ours
+            state.cancel_order_id = state.feedback_order_id = None
+            if result.intent == im.ORDER_START and result.confidence >= settings.CHAT_CONFIDENCE:
+                state.platform = result.platform
+            return ChatReply(reply, "dialogflow", None, result.confidence)
+        if result.confidence < settings.CHAT_CONFIDENCE:
+            return ChatReply(render("fallback", locale), "local", None, result.confidence)
+
+    if result.intent in im.LOCAL_INTENTS:
+        reply = await _run_local_intent(result, state, locale, read_db)
+    else:
+        reply = await _run_webhook_intent(result, state, session_id, locale, db, read_db)
+    return ChatReply(reply, "local", result.intent, result.confidence)
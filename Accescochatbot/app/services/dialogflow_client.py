@@ -0,0 +1,81 @@
+# app/services/dialogflow_client.py
+"""
+Dialogflow ES detectIntent over REST, for the turns the local matcher
+passes on. Dialogflow runs its own intent matching and calls /webhook for
+fulfillment as usual.
+
+Auth is DIALOGFLOW_ACCESS_TOKEN if set, else google-auth's default
+credentials when the package is installed. Without either, or if the call
+fails, detect_intent() returns None and the caller uses its own fallback
+reply.
+"""
+import logging
+from typing import Optional
+
+import httpx
+from starlette.concurrency import run_in_threadpool
+
+from Accescochatbot.app.config import settings
+
+DETECT_INTENT_URL = "https://dialogflow.googleapis.com/v2/projects/{project}/agent/sessions/{session}:detectIntent"
+SCOPES = ["https://www.googleapis.com/auth/dialogflow"]
+TIMEOUT_SECONDS = 5.0
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[httpx.AsyncClient] = None
+_credentials = None
+
+
+def is_configured() -> bool:
+    """Whether detect_intent() can reach Dialogflow: a project id plus a token or google-auth."""
+    if not settings.DIALOGFLOW_PROJECT_ID:
+        return False
+    if settings.DIALOGFLOW_ACCESS_TOKEN:
+        return True
+    try:
+        import google.auth  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _access_token() -> Optional[str]:
+    global _credentials
+    if settings.DIALOGFLOW_ACCESS_TOKEN:
+        return settings.DIALOGFLOW_ACCESS_TOKEN
+    try:
+        import google.auth
+        import google.auth.transport.requests
+    except ImportError:
+        return None
+
+    if _credentials is None:
+        _credentials, _ = google.auth.default(scopes=SCOPES)
+    if not _credentials.valid:
+        _credentials.refresh(google.auth.transport.requests.Request())
+    return _credentials.token
+
+
+async def detect_intent(session_id: str, text: str, locale: str) -> Optional[str]:
+    """Dialogflow's fulfillmentText for the utterance, or None if Dialogflow isn't reachable."""
+    global _client
+    if not settings.DIALOGFLOW_PROJECT_ID:
+        return None
+    try:
+        token = await run_in_threadpool(_access_token)
+        if not token:
+            return None
+        if _client is None:
+            _client = httpx.AsyncClient(timeout=TIMEOUT_SECONDS)
+
+        response = await _client.post(
+            DETECT_INTENT_URL.format(project=settings.DIALOGFLOW_PROJECT_ID, session=session_id),
+            json={"queryInput": {"text": {"text": text, "languageCode": locale}}},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        response.raise_for_status()
+        return response.json().get("queryResult", {}).get("fulfillmentText")
+    except Exception as e:  # Network, auth and malformed replies all end in the local fallback
+        logger.warning("Dialogflow detectIntent failed: %s", e)
+        return None
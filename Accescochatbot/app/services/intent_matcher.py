@@ -0,0 +1,336 @@
+# app/services/intent_matcher.py
+"""
+Local intent matcher for the /chat endpoint.
+
+Each utterance goes through three steps, all precompiled at import:
+
+  1. Entities are pulled out and replaced by placeholders: order ids
+     (<order_id>), catalog products (<item>, with the number in front as
+     its quantity), platforms (<platform>), other ventures (<venture>) and
+     numbers (<num>).
+  2. Regex rules handle the follow-up turns the conversation state expects:
+     "yes"/"no" to a cancellation, anything as cancel feedback, and "no" or
+     "that's all" to finish an order.
+  3. Otherwise a multinomial naive Bayes model over word 1-2 grams, trained
+     on EXAMPLES, picks the intent.
+
+The confidence is the class posterior scaled by the share of the
+utterance's tokens the model knows, so off-topic text scores low. Matches
+below the caller's threshold (or missing a required entity) get
+confidence 0 and go to Dialogflow instead.
+
+Intent names are the Dialogflow display names the webhook dispatches on,
+plus a few that only exist here (LOCAL_INTENTS).
+
+    python -m Accescochatbot.app.services.intent_matcher "track order EX1A2B3C4D"
+"""
+import math
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from Accescochatbot.app.models.products import Products
+from Accescochatbot.app.services.catalog_service import on_catalog_change
+from Accescochatbot.app.services.venture_service import VENTURE_DETAILS
+
+# -------------------------------------------------------------
+# Intents
+# -------------------------------------------------------------
+TRACK = "track order"
+CANCEL = "cancel order"
+CANCEL_YES = "cancel order - yes"
+CANCEL_FEEDBACK = "cancel order - yes - confirm"
+CANCEL_NO = "cancel order - no"
+ADD_ITEM = "add item"            # Becomes "order <platform> - custom"
+CONFIRM = "confirm order"        # Becomes "order <platform> - custom - no"
+ORDER_START = "order start"
+PRODUCT_INFO = "product info"
+VENTURE_INFO = "venture info"
+WELCOME = "welcome"
+
+LOCAL_INTENTS = {CANCEL_NO, ORDER_START, PRODUCT_INFO, VENTURE_INFO, WELCOME}
+
+PLATFORMS = {"eatfeast": "EatFeast", "gromart": "GroMart"}
+ITEM_PARAMS = {"EatFeast": "eatfeast-food-items", "GroMart": "gromart-grocery"}
+
+EXAMPLES = {
+    TRACK: [
+        "track my order", "track order <order_id>", "track <order_id>", "where is my order",
+        "where is order <order_id>", "order status", "status of my order <order_id>",
+        "what is the status of <order_id>", "check my order status", "has my order arrived yet",
+        "when will my order <order_id> arrive", "i want to track my order",
+    ],
+    CANCEL: [
+        "cancel my order", "cancel order <order_id>", "cancel <order_id>", "i want to cancel my order",
+        "please cancel order <order_id>", "i dont want my order anymore", "stop my order <order_id>",
+        "can you cancel the order", "cancel the order please",
+    ],
+    ADD_ITEM: [
+        "<num> <item>", "<item>", "<item> and <item>", "<num> <item> and <num> <item>", "add <num> <item>",
+        "add <item>", "i want <num> <item>", "i would like <item>", "also <num> <item>", "give me <num> <item>",
+        "get me <item> and <item>", "<num> <item> please", "add <item> to my cart", "and <num> <item>",
+        "i need <num> <item>", "put <num> <item> in my order",
+    ],
+    ORDER_START: [
+        "i want to order from <platform>", "order from <platform>", "order food", "i want to order food",
+        "buy groceries", "i want to buy groceries", "order groceries", "open <platform>",
+        "start an order on <platform>", "i want to order something", "place an order on <platform>",
+        "<platform> order", "shop on <platform>",
+    ],
+    PRODUCT_INFO: [
+        "how much is <item>", "what is the price of <item>", "price of <item>", "is <item> available",
+        "do you have <item>", "how much does <item> cost", "what does <item> cost", "<item> price",
+        "is <item> in stock",
+    ],
+    VENTURE_INFO: [
+        "what is <platform>", "what is <venture>", "tell me about <venture>", "tell me about <platform>",
+        "what does <venture> do", "info about <venture>", "what are your ventures",
+        "what services do you offer", "tell me about your companies", "what is <platform> and <venture>",
+    ],
+    WELCOME: [
+        "hi", "hello", "hey", "hey there", "good morning", "good evening", "hi there", "hello bot",
+        "start", "what can you do", "help",
+    ],
+}
+
+# -------------------------------------------------------------
+# Entity patterns
+# -------------------------------------------------------------
+ORDER_ID_RE = re.compile(r"\b(EX[0-9A-F]{8}|[0-9A-F]{8}-[0-9A-F])\b", re.IGNORECASE)
+TOKEN_RE = re.compile(r"<[a-z_]+>|[a-z0-9]+(?:'[a-z]+)?")
+YES_RE = re.compile(r"^\s*(yes|yeah|yep|yup|sure|ok|okay|confirm|please do|do it)\b", re.IGNORECASE)
+NO_RE = re.compile(
+    r"^\s*(no|nope|nah|that'?s (all|it)|nothing( else)?|done|i'?m done|finish|place (the )?order)\b", re.IGNORECASE
+)
+NUMBER_WORDS = {
+    "a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10, "dozen": 12,
+}
+PLATFORM_TOKENS = {
+    ("eatfeast",): "EatFeast", ("eat", "feast"): "EatFeast",
+    ("gromart",): "GroMart", ("gro", "mart"): "GroMart",
+}
+VENTURE_TOKENS = {tuple(name.lower().split()): name for name in VENTURE_DETAILS if name.lower() not in PLATFORMS}
+
+LAPLACE = 0.5
+MAX_PHRASE_WORDS = 5
+
+
+@dataclass
+class Match:
+    intent: str
+    confidence: float
+    params: Dict = field(default_factory=dict)
+    platform: Optional[str] = None
+
+
+@dataclass
+class ChatState:
+    """What the conversation is waiting for; the local stand-in for Dialogflow contexts."""
+    platform: Optional[str] = None           # Ordering from this platform until confirmed
+    cancel_order_id: Optional[str] = None    # Asked "are you sure?" about this order
+    feedback_order_id: Optional[str] = None  # Asked why this order was cancelled
+    contexts: List[dict] = field(default_factory=list)  # Last add-item outputContexts (the cart ref)
+
+
+# -------------------------------------------------------------
+# Catalog
+# -------------------------------------------------------------
+class CatalogIndex:
+    """Product names by lowercase token tuple, with simple plurals ("apples" -> Apple)."""
+
+    def __init__(self, names: Iterable[str]):
+        self.phrases: Dict[Tuple[str, ...], str] = {}
+        for name in names:
+            tokens = tuple(TOKEN_RE.findall(name.lower()))
+            if not tokens or len(tokens) > MAX_PHRASE_WORDS:
+                continue
+            for last in (tokens[-1], tokens[-1] + "s", tokens[-1] + "es"):
+                self.phrases.setdefault(tokens[:-1] + (last,), name)
+        self.longest = max((len(p) for p in self.phrases), default=0)
+
+
+CATALOG_TTL_SECONDS = 60  # Other workers' syncs show up within this
+_catalog: Optional[CatalogIndex] = None
+_catalog_loaded = 0.0
+
+
+@on_catalog_change
+def _drop_catalog():
+    global _catalog
+    _catalog = None
+
+
+def cached_catalog() -> Optional[CatalogIndex]:
+    """The catalog index if it is loaded and fresh, else None (call load_catalog)."""
+    if _catalog is not None and time.monotonic() - _catalog_loaded < CATALOG_TTL_SECONDS:
+        return _catalog
+    return None
+
+
+def load_catalog(db: Session) -> CatalogIndex:
+    global _catalog, _catalog_loaded
+    _catalog = CatalogIndex(db.execute(select(Products.name)).scalars())
+    _catalog_loaded = time.monotonic()
+    return _catalog
+
+
+# -------------------------------------------------------------
+# Entity extraction
+# -------------------------------------------------------------
+def _lookup(tokens: List[str], i: int, table: Dict[Tuple[str, ...], str], longest: int):
+    """(value, length) of the longest phrase in `table` starting at tokens[i], else (None, 0)."""
+    for n in range(min(longest, len(tokens) - i), 0, -1):
+        value = table.get(tuple(tokens[i:i + n]))
+        if value is not None:
+            return value, n
+    return None, 0
+
+
+def extract(text: str, catalog: Optional[CatalogIndex]) -> Tuple[List[str], Dict]:
+    """(tokens with entities replaced by placeholders, entities found)."""
+    order_ids = [m.upper() for m in ORDER_ID_RE.findall(text)]
+    raw = TOKEN_RE.findall(ORDER_ID_RE.sub(" <order_id> ", text).lower())
+    tokens, items, qtys, platforms, ventures = [], [], [], [], []
+    number = 1
+    i = 0
+    while i < len(raw):
+        token = raw[i]
+        item, n = _lookup(raw, i, catalog.phrases, catalog.longest) if catalog else (None, 0)
+        if item:
+            items.append(item)
+            qtys.append(number if tokens and tokens[-1] == "<num>" else 1)
+            tokens.append("<item>")
+            i += n
+            continue
+        platform, n = _lookup(raw, i, PLATFORM_TOKENS, 2)
+        if platform:
+            platforms.append(platform)
+            tokens.append("<platform>")
+            i += n
+            continue
+        venture, n = _lookup(raw, i, VENTURE_TOKENS, 2)
+        if venture:
+            ventures.append(venture)
+            tokens.append("<venture>")
+            i += n
+            continue
+        # "a"/"an" only count as a quantity right before a product
+        is_number = token.isdigit() or (token in NUMBER_WORDS and token not in ("a", "an"))
+        if not is_number and token in ("a", "an") and catalog:
+            is_number = _lookup(raw, i + 1, catalog.phrases, catalog.longest)[0] is not None
+        if is_number:
+            number = int(token) if token.isdigit() else NUMBER_WORDS[token]
+            tokens.append("<num>")
+        else:
+            tokens.append(token)
+        i += 1
+
+    entities = {"order_ids": order_ids, "items": items, "qtys": qtys, "platforms": platforms, "ventures": ventures}
+    return tokens, entities
+
+
+# -------------------------------------------------------------
+# Classifier
+# -------------------------------------------------------------
+def _features(tokens: List[str]) -> List[str]:
+    padded = ["^"] + tokens + ["$"]
+    return tokens + [f"{a} {b}" for a, b in zip(padded, padded[1:])]
+
+
+class NgramClassifier:
+    """Multinomial naive Bayes over word unigrams and bigrams."""
+
+    def __init__(self, examples: Dict[str, List[str]]):
+        self.labels = list(examples)
+        counts = {label: {} for label in self.labels}
+        for label, utterances in examples.items():
+            for utterance in utterances:
+                for f in _features(TOKEN_RE.findall(utterance.lower())):
+                    counts[label][f] = counts[label].get(f, 0) + 1
+
+        vocabulary = {f for c in counts.values() for f in c}
+        self.words = {f for f in vocabulary if " " not in f}
+        total = sum(len(u) for u in examples.values())
+        self.priors = [math.log(len(examples[label]) / total) for label in self.labels]
+        # feature -> log P(feature | label) for every label, so scoring is one lookup per feature
+        self.weights: Dict[str, List[float]] = {}
+        for f in vocabulary:
+            row = []
+            for label in self.labels:
+                seen = sum(counts[label].values())
+                row.append(math.log((counts[label].get(f, 0) + LAPLACE) / (seen + LAPLACE * len(vocabulary))))
+            self.weights[f] = row
+
+    def classify(self, tokens: List[str]) -> Tuple[str, float]:
+        """(label, confidence) for placeholder-substituted tokens."""
+        if not tokens:
+            return self.labels[0], 0.0
+        scores = list(self.priors)
+        for f in _features(tokens):
+            row = self.weights.get(f)
+            if row is not None:
+                for k, w in enumerate(row):
+                    scores[k] += w
+        best = max(range(len(scores)), key=scores.__getitem__)
+        top = scores[best]
+        posterior = 1.0 / sum(math.exp(s - top) for s in scores)
+        known = sum(1 for t in tokens if t in self.words) / len(tokens)
+        return self.labels[best], posterior * known
+
+
+CLASSIFIER = NgramClassifier(EXAMPLES)
+
+
+# -------------------------------------------------------------
+# Matching
+# -------------------------------------------------------------
+def match(text: str, state: ChatState, catalog: Optional[CatalogIndex] = None) -> Match:
+    # ---------------- Follow-ups the state is waiting for ----------------
+    if state.feedback_order_id:
+        return Match(CANCEL_FEEDBACK, 1.0, {"feedback": text.strip()})
+    if state.cancel_order_id:
+        if YES_RE.match(text):
+            return Match(CANCEL_YES, 1.0)
+        if NO_RE.match(text):
+            return Match(CANCEL_NO, 1.0, {"order_id": state.cancel_order_id})
+    if state.platform and NO_RE.match(text):
+        return Match(CONFIRM, 1.0, platform=state.platform)
+
+    # ---------------- Classifier ----------------
+    tokens, entities = extract(text, catalog)
+    intent, confidence = CLASSIFIER.classify(tokens)
+    order_id = entities["order_ids"][0] if entities["order_ids"] else None
+    platform = entities["platforms"][0] if entities["platforms"] else state.platform
+
+    if intent in (TRACK, CANCEL):
+        return Match(intent, confidence, {"order_id": order_id} if order_id else {})
+    if intent == ADD_ITEM:
+        if not entities["items"] or not platform:
+            return Match(intent, 0.0)  # Dialogflow knows the menu and which order this belongs to
+        return Match(intent, confidence, {ITEM_PARAMS[platform]: entities["items"], "number": entities["qtys"]}, platform)
+    if intent == ORDER_START:
+        return Match(intent, confidence if entities["platforms"] else 0.0, platform=platform)
+    if intent == PRODUCT_INFO:
+        if not entities["items"]:
+            return Match(intent, 0.0)
+        return Match(intent, confidence, {"product": entities["items"][0]})
+    if intent == VENTURE_INFO:
+        return Match(intent, confidence, {"ventures": entities["platforms"] + entities["ventures"]})
+    return Match(intent, confidence)
+
+
+def main():
+    state = ChatState(platform="GroMart")
+    for text in sys.argv[1:] or ["track order EX1A2B3C4D", "hello", "what is calciq", "what's the weather"]:
+        result = match(text, state)
+        print(f"{text!r}: {result.intent} ({result.confidence:.2f}) {result.params}")
+
+
+if __name__ == "__main__":
+    main()
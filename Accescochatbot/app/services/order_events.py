@@ -0,0 +1,191 @@
+# app/services/order_events.py
+"""
+Order status push.
+
+Handlers call announce_status() after committing a status change. Clients
+follow one order through GET /orders/{order_id}/events (routers/orders.py),
+which reads from an OrderStatusHub queue.
+
+On Postgres, announce_status() sends NOTIFY order_status. Each worker keeps
+a single LISTEN connection (start_listener, run from the app lifespan),
+which hands every notification to its hub, and the hub fans out to every
+subscriber of that order in the worker. Other databases have no
+cross-process channel, so announce_status() publishes to this worker's hub
+only. That is enough for local runs with one worker.
+
+If the LISTEN connection can't be opened or drops, the listener logs it and
+reconnects with backoff, then resends the current status of every followed
+order (subscribers ignore repeats). The app keeps serving meanwhile.
+"""
+import asyncio
+from typing import Dict, Optional, Set
+
+import orjson
+import psycopg2
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from Accescochatbot.app.database import SessionLocal, engine
+from Accescochatbot.app.services.archive_service import find_order
+
+CHANNEL = "order_status"
+SUBSCRIBER_QUEUE_SIZE = 16  # Status events per subscriber before the oldest are dropped
+
+
+class OrderStatusHub:
+    """In-process pub/sub keyed by order id. Queues live on the event loop passed to start()."""
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def start(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+
+    def add_subscriber(self, order_id: str) -> asyncio.Queue:
+        """A queue that receives status events ({"order_id", "status"}) for one order."""
+        queue = asyncio.Queue(SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.setdefault(order_id, set()).add(queue)
+        return queue
+
+    def remove_subscriber(self, order_id: str, queue: asyncio.Queue):
+        queues = self._subscribers.get(order_id, set())
+        queues.discard(queue)
+        if not queues:
+            self._subscribers.pop(order_id, None)
+
+    def deliver(self, event: dict):
+        """Fans an event out to its order's subscribers. Call on the hub's loop."""
+        for queue in self._subscribers.get(event.get("order_id"), ()):
+            if queue.full():
+                queue.get_nowait()  # A slow reader only needs the latest status
+            queue.put_nowait(event)
+
+    def publish(self, event: dict):
+        """deliver() from any thread (handlers run in the threadpool)."""
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self.deliver, event)
+
+    def order_ids(self):
+        """Orders with at least one subscriber."""
+        return self._subscribers.keys()
+
+    def subscriber_count(self) -> int:
+        return sum(len(q) for q in self._subscribers.values())
+
+
+ORDER_STATUS_HUB = OrderStatusHub()
+
+
+def _uses_notify(db: Session) -> bool:
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def announce_status(db: Session, order_id: str, status: str):
+    """Tells subscribers that order_id is now `status`. Call after the change is committed."""
+    event = {"order_id": order_id, "status": status}
+    if _uses_notify(db):
+        db.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": CHANNEL, "payload": orjson.dumps(event).decode()},
+        )
+        db.commit()
+    else:
+        ORDER_STATUS_HUB.publish(event)
+
+
+# -------------------------------------------------------------
+# Postgres LISTEN connection
+# -------------------------------------------------------------
+RECONNECT_MAX_SECONDS = 30  # Backoff cap while the database is unreachable
+
+
+def _connect():
+    """A raw autocommit connection LISTENing on CHANNEL: (pool connection, driver connection)."""
+    connection = engine.raw_connection()
+    raw = connection.driver_connection
+    raw.autocommit = True
+    with raw.cursor() as cursor:
+        cursor.execute(f"LISTEN {CHANNEL}")
+    return connection, raw
+
+
+def _current_statuses(order_ids):
+    """{"order_id", "status"} events for orders that are still around, to resend after a reconnect."""
+    db = SessionLocal(use_replica=True)
+    try:
+        orders = [find_order(db, order_id) for order_id in order_ids]
+        return [{"order_id": o.order_id, "status": o.status} for o in orders if o is not None]
+    finally:
+        db.close()
+
+
+async def _listen(loop: asyncio.AbstractEventLoop, hub: OrderStatusHub):
+    """Keeps a LISTEN connection open, reconnecting with backoff whenever it fails or drops."""
+    delay = 1
+    resync = False  # Set once a connection was lost or never made
+    while True:
+        try:
+            connection, raw = await loop.run_in_executor(None, _connect)
+        except Exception as e:  # Unreachable at startup or during an outage; the app keeps serving
+            print(f"{CHANNEL} LISTEN connection failed ({e}); retrying in {delay}s")
+            resync = True
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RECONNECT_MAX_SECONDS)
+            continue
+
+        delay = 1
+        if resync:
+            # Notifications sent while we were away are gone; resend what subscribers follow
+            try:
+                events = await loop.run_in_executor(None, _current_statuses, list(hub.order_ids()))
+            except Exception as e:
+                print(f"Could not resend order statuses after reconnecting: {e}")
+                events = []
+            for event in events:
+                hub.deliver(event)
+            resync = False
+
+        lost = asyncio.Event()
+        fd = raw.fileno()
+
+        def on_readable():
+            try:
+                raw.poll()
+            except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+                print(f"{CHANNEL} LISTEN connection lost ({e}); reconnecting")
+                loop.remove_reader(fd)
+                lost.set()
+                return
+            while raw.notifies:
+                notify = raw.notifies.pop(0)
+                try:
+                    hub.deliver(orjson.loads(notify.payload))
+                except orjson.JSONDecodeError:
+                    print(f"Ignoring malformed {CHANNEL} payload: {notify.payload!r}")
+
+        loop.add_reader(fd, on_readable)
+        try:
+            await lost.wait()
+            resync = True
+        finally:
+            loop.remove_reader(fd)
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+
+def start_listener(loop: asyncio.AbstractEventLoop, hub: OrderStatusHub = ORDER_STATUS_HUB):
+    """
+    Starts the hub and, on Postgres, a task keeping this worker's LISTEN
+    connection open; its socket is polled by the event loop. Never raises
+    if the database is down: the task logs and retries. Returns a function
+    that stops it.
+    """
+    hub.start(loop)
+    if engine.dialect.name != "postgresql":
+        return lambda: None
+
+    task = loop.create_task(_listen(loop, hub))
+    return task.cancel
@@ -1,6 +1,12 @@
 # app/services/order_service.py
 from sqlalchemy.orm import Session
 from Accescochatbot.app.models.orders import Orders
+from Accescochatbot.app.services.archive_service import find_order
+from Accescochatbot.app.services.order_events import announce_status
+from Accescochatbot.app.services.pricing_service import PRICE_BOOK, price_cart
+from Accescochatbot.app.utils.messages import locale_of, render, render_items, render_item_rows
+from Accescochatbot.app.utils.cart_ref import CartContext, encode_cart_ref, read_cart_context
+from Accescochatbot.app.utils.concurrency import lock_session, retry_on_conflict
 from datetime import datetime
 import uuid
 from typing import Union, List, Tuple, Dict, Any
@@ -9,9 +15,15 @@ from typing import Union, List, Tuple, Dict, Any
 # -------------------------------------------------------------
 # Helpers
 # -------------------------------------------------------------
-def generate_order_id() -> str:
-    """Short readable order id"""
-    return str(uuid.uuid4())[:10].upper()
+def generate_order_id(db: Session) -> str:
+    """
+    Short readable order id, not used by any order yet. `orders` is
+    partitioned, so the database can't enforce unique order ids itself.
+    """
+    while True:
+        order_id = str(uuid.uuid4())[:10].upper()
+        if find_order(db, order_id) is None:
+            return order_id
 
 
 def _find_order_context_name(platform: str) -> str:
@@ -24,9 +36,21 @@ def _find_order_context_name(platform: str) -> str:
     return ""
 
 
+def _cart_context(body: dict, context_name: str, order: Orders) -> dict:
+    """The order context pointing at this cart and its current version."""
+    return {
+        "name": f"{body['session']}/contexts/{context_name}",
+        "lifespanCount": 10,
+        "parameters": {
+            "cart_ref": encode_cart_ref(order.order_id, order.version),
+        },
+    }
+
+
 # -------------------------------------------------------------
 # ADD ITEM
 # -------------------------------------------------------------
+@retry_on_conflict
 def handle_add_item(
     body: dict,
     db: Session,
@@ -37,6 +61,7 @@ def handle_add_item(
     query = body.get("queryResult", {}) or {}
     params = query.get("parameters", {}) or {}
     output_contexts = query.get("outputContexts", []) or []
+    locale = locale_of(body)
 
     # ---------------- 1) Extract NEW items ----------------
     new_items: List[str] = []
@@ -64,9 +89,23 @@ def handle_add_item(
     while len(new_qtys) < len(new_items):
         new_qtys.append(1)
 
-    # ---------------- 3) Extract OLD context items ----------------
-    ctx_items: List[str] = []
-    ctx_qtys: List[Any] = []
+    if not new_items:
+        return None, {
+            "fulfillmentText": render("items_not_understood", locale)
+        }
+
+    # ---------------- 2b) Leave out unavailable items ----------------
+    new_lines = [{"item": it, "quantity": qt} for it, qt in zip(new_items, new_qtys)]
+    quote = price_cart(db, new_lines)
+    unavailable_text = ""
+    if quote.unavailable:
+        unavailable_text = render("items_unavailable", locale, items=", ".join(quote.unavailable))
+        new_lines = quote.kept
+        if not new_lines:
+            return None, {"fulfillmentText": unavailable_text}
+
+    # ---------------- 3) Read the cart context ----------------
+    cart = CartContext()
 
     order_context_name = _find_order_context_name(platform).lower()
 
@@ -77,36 +116,12 @@ def handle_add_item(
             ctx_name_last == order_context_name
             or (platform.lower() == "gromart" and "gromart" in ctx_name_last)
         ):
-            ctx_params = ctx.get("parameters", {}) or {}
-            raw_items = ctx_params.get("items_list") or []
-            raw_qtys = ctx_params.get("qty_list") or []
-
-            if isinstance(raw_items, list):
-                ctx_items = [str(x) for x in raw_items]
-            else:
-                ctx_items = [str(raw_items)]
-
-            if isinstance(raw_qtys, list):
-                ctx_qtys = raw_qtys.copy()
-            else:
-                ctx_qtys = [raw_qtys]
-
+            cart = read_cart_context(ctx.get("parameters", {}) or {})
             break
 
-    while len(ctx_qtys) < len(ctx_items):
-        ctx_qtys.append(1)
-
-    # ---------------- 4) Merge NEW + OLD ----------------
-    all_items = ctx_items + new_items
-    all_qtys = ctx_qtys + new_qtys
-
-    if not all_items:
-        return None, {
-            "fulfillmentText": "I couldn't understand the items. Please repeat."
-        }
-
-    # ---------------- 5) Save to DB ----------------
+    # ---------------- 4) Load the server-side cart ----------------
     session_id = body.get("session", "").split("/")[-1]
+    lock_session(db, session_id)
 
     order = (
         db.query(Orders)
@@ -115,9 +130,29 @@ def handle_add_item(
         .first()
     )
 
+    if order and cart.order_id == order.order_id and cart.version != order.version:
+        # The context predates the cart's last change (another tab, a retried
+        # request): show the current cart instead of adding to one the user hasn't seen
+        return order.order_id, {
+            "fulfillmentText": render(
+                "cart_changed", locale, platform=platform, items=render_item_rows(order.items or [], locale)
+            ),
+            "outputContexts": [_cart_context(body, order_context_name, order)],
+        }
+
+    if order:
+        old_lines = list(order.items or [])
+    else:
+        # Sessions from before cart refs carry the whole cart in the context;
+        # with a ref (to a confirmed/expired cart) or no context it's empty
+        old_lines = [{"item": it, "quantity": qt} for it, qt in zip(cart.items, cart.qtys)]
+
+    # ---------------- 5) Merge NEW + OLD and save ----------------
+    all_lines = old_lines + new_lines
+
     if not order:
         order = Orders(
-            order_id=generate_order_id(),
+            order_id=generate_order_id(db),
             platform=platform,
             session_id=session_id,
             items=[],
@@ -126,26 +161,22 @@ def handle_add_item(
         )
         db.add(order)
 
-    order.items = [
-        {"item": it, "quantity": qt}
-        for it, qt in zip(all_items, all_qtys)
-    ]
+    order.items = all_lines  # Bumps order.version; a concurrent write makes this raise StaleDataError
     db.commit()
 
     # ---------------- 6) Write back DF context ----------------
-    out_ctx = {
-        "name": f"{body['session']}/contexts/{order_context_name}",
-        "lifespanCount": 10,
-        "parameters": {
-            "items_list": all_items,
-            "qty_list": all_qtys,
-        },
-    }
-
-    added_text = ", ".join([f"{q} {i}" for i, q in zip(all_qtys, all_items)])
+    out_ctx = _cart_context(body, order_context_name, order)
+
+    # Only this turn's items, so the reply doesn't grow with the cart either
+    added_text = render_item_rows(new_lines, locale, "added_item_quantity")
+    total = PRICE_BOOK.price_cart(all_lines).total
+    reply = render(
+        "items_added" if total is not None else "items_added_unpriced", locale,
+        items=added_text, platform=platform, count=len(all_lines), total=total,
+    )
 
     return order.order_id, {
-        "fulfillmentText": f"Added {added_text} to your {platform} order. Anything else?",
+        "fulfillmentText": f"{unavailable_text} {reply}" if unavailable_text else reply,
         "outputContexts": [out_ctx],
     }
 
@@ -153,8 +184,11 @@ def handle_add_item(
 # -------------------------------------------------------------
 # CONFIRM ORDER
 # -------------------------------------------------------------
+@retry_on_conflict
 def handle_confirm_order(body: dict, db: Session, platform: str) -> str:
     session_id = body.get("session", "").split("/")[-1]
+    lock_session(db, session_id)
+    locale = locale_of(body)
 
     order = (
         db.query(Orders)
@@ -168,12 +202,27 @@ def handle_confirm_order(body: dict, db: Session, platform: str) -> str:
     )
 
     if not order:
-        return "I couldn't find your order. Please try ordering again."
+        return render("pending_order_not_found", locale)
+
+    # Price at today's prices; items that went unavailable since they were added drop out
+    quote = price_cart(db, order.items or [])
+    unavailable_text = ""
+    if quote.unavailable:
+        unavailable_text = render("items_unavailable", locale, items=", ".join(quote.unavailable))
+        if not quote.kept:
+            return unavailable_text
+        order.items = quote.kept
 
     order.status = "confirmed"
+    order.total = quote.total  # None if any item has no listed price
     db.commit()
+    announce_status(db, order.order_id, order.status)
 
-    return f"Your {platform} order {order.order_id} has been confirmed! 🎉"
+    reply = render(
+        "order_confirmed" if order.total is not None else "order_confirmed_unpriced", locale,
+        platform=platform, order_id=order.order_id, total=order.total,
+    )
+    return f"{unavailable_text} {reply}" if unavailable_text else reply
 
 # ------------------------------------------------------
 # TRACK ORDER (by order_id OR by user session)
@@ -186,29 +235,34 @@ def handle_track_order(body: dict, db: Session) -> str:
 
     params = body.get("queryResult", {}).get("parameters", {}) or {}
     order_id = params.get("order_id")
+    locale = locale_of(body)
 
     if not order_id:
-        return "I couldn't find an order ID. Please provide a valid order ID."
+        return render("track_missing_id", locale)
 
-    # Fetch the order from DB
-    order = db.query(Orders).filter(Orders.order_id == order_id).first()
+    # Fetch the order from DB (recent orders, then the archive)
+    order = find_order(db, order_id)
 
     if not order:
-        return f"No order found with ID {order_id}. Please check the ID and try again."
+        return render("track_not_found", locale, order_id=order_id)
 
     # Build readable items list
-    items_str = ", ".join(
-        [f"{item['quantity']} {item['item']}" for item in order.items]
-    )
+    items_str = render_item_rows(order.items, locale)
+
+    # Format timestamp: "2026-01-05 19:42" (naive UTC; isoformat is much cheaper than strftime)
+    created_time = order.created_at.isoformat(" ", "minutes")
 
-    # Format timestamp
-    created_time = order.created_at.strftime("%Y-%m-%d %H:%M")
+    # Stored at confirm; a pending cart is priced at today's prices
+    total = order.total if order.total is not None else price_cart(db, order.items or []).total
 
     # Response
-    return (
-        f"Here is the status for your {order.platform} order {order.order_id}:\n"
-        f"📌 status: {order.status}\n"
-        f"🛒 Items: {items_str}\n"
-        f"⏱️ Created at: {created_time}"
+    return render(
+        "track_status" if total is not None else "track_status_unpriced", locale,
+        platform=order.platform,
+        order_id=order.order_id,
+        status=order.status,
+        items=items_str,
+        total=total,
+        created_at=created_time,
     )
 
@@ -0,0 +1,166 @@
+# app/services/pricing_service.py
+"""
+Cart pricing from an in-memory price map.
+
+PRICE_BOOK holds every product's price and availability, keyed by
+lowercase name. It is loaded from `products` in one query and then
+refreshed by version: at most every PRICE_CHECK_SECONDS, one aggregate
+query reads (count, max(updated_at)) of the table, and the map is reloaded
+only if that changed. A catalog sync in this process (catalog_service)
+marks the map stale, so the next lookup checks at once.
+
+price_cart() prices a whole cart in one pass over its lines. A line's
+price is the map's current price, looked up by exact name and then by the
+singular of a plural ("Apples" -> "Apple"). Carts store only item names and
+quantities, so prices are looked up again until confirm stores the total.
+A cart with any item the catalog doesn't know (EatFeast dishes are
+Dialogflow entities, not products) has no total: CartQuote.total is None.
+
+    python -m Accescochatbot.app.services.pricing_service "2 Apple" "1 Milk"
+"""
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from Accescochatbot.app.config import settings
+from Accescochatbot.app.database import SessionLocal
+from Accescochatbot.app.models.products import Products
+from Accescochatbot.app.services.catalog_service import on_catalog_change
+
+MIN_SINGULAR = 3  # Shortest name a plural is trimmed down to
+
+
+class Price(NamedTuple):
+    name: str          # Catalog spelling
+    price: float
+    available: bool
+
+
+@dataclass
+class CartQuote:
+    total: Optional[float] = 0.0                           # Available lines; None if any is unknown
+    lines: List[dict] = field(default_factory=list)        # {"item", "quantity", "unit_price", "line_total"}
+    unavailable: List[str] = field(default_factory=list)   # In the catalog but not available
+    unknown: List[str] = field(default_factory=list)       # Not in the catalog; left unpriced
+    kept: List[dict] = field(default_factory=list)         # The input lines minus the unavailable ones
+
+
+def _quantity(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 1.0
+
+
+def _singulars(key: str) -> List[str]:
+    """Names a plural may stand for: "apples" -> "apple", "tomatoes" -> "tomatoe", "tomato"."""
+    if not key.endswith("s") or key.endswith("ss"):  # "glass" isn't a plural
+        return []
+    singulars = [key[:-1]]
+    if key.endswith("es"):
+        singulars.append(key[:-2])
+    return [s for s in singulars if len(s) >= MIN_SINGULAR]  # "gas" isn't "g" or "ga"
+
+
+def _lookup(prices: Dict[str, Price], item) -> Optional[Price]:
+    key = str(item).strip().lower()
+    price = prices.get(key)
+    if price is None:
+        price = next((prices[s] for s in _singulars(key) if s in prices), None)
+    return price
+
+
+class PriceBook:
+    """Product name -> Price, shared by the handler threads."""
+
+    def __init__(self, check_seconds: float = settings.PRICE_CHECK_SECONDS):
+        self.check_seconds = check_seconds
+        self.prices: Dict[str, Price] = {}
+        self.version: Optional[Tuple] = None   # (count, max updated_at) the map was loaded at
+        self.loads = 0
+        self._checked = 0.0
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        """Makes the next refresh() check the table's version right away."""
+        self._checked = 0.0
+
+    def refresh(self, db: Session, force: bool = False):
+        """Reloads the map if the products table changed since it was loaded."""
+        if not force and time.monotonic() - self._checked < self.check_seconds:
+            return
+        with self._lock:
+            if not force and time.monotonic() - self._checked < self.check_seconds:
+                return  # Another thread checked while we waited
+            version = tuple(db.execute(select(func.count(), func.max(Products.updated_at))).one())
+            if force or version != self.version:
+                rows = db.execute(select(Products.name, Products.price, Products.available))
+                self.prices = {name.lower(): Price(name, price, bool(available)) for name, price, available in rows}
+                self.version = version
+                self.loads += 1
+            self._checked = time.monotonic()
+
+    def lookup(self, item: str) -> Optional[Price]:
+        return _lookup(self.prices, item)
+
+    def price_cart(self, lines: Iterable[dict]) -> CartQuote:
+        """Prices {"item", "quantity"} cart lines in one pass; no queries."""
+        prices = self.prices  # One consistent snapshot even if a refresh swaps the map
+        quote = CartQuote()
+        for line in lines:
+            item = line.get("item")
+            price = _lookup(prices, item)
+            if price is None:
+                quote.unknown.append(str(item))
+                quote.kept.append(line)
+                continue
+            if not price.available:
+                quote.unavailable.append(price.name)
+                continue
+            quote.kept.append(line)
+            line_total = round(price.price * _quantity(line.get("quantity")), 2)
+            quote.lines.append(
+                {"item": item, "quantity": line.get("quantity"), "unit_price": price.price, "line_total": line_total}
+            )
+            quote.total += line_total
+        quote.total = round(quote.total, 2) if not quote.unknown else None
+        return quote
+
+
+PRICE_BOOK = PriceBook()
+
+
+@on_catalog_change
+def _catalog_changed():
+    PRICE_BOOK.invalidate()
+
+
+def price_cart(db: Session, lines: Iterable[dict], book: PriceBook = PRICE_BOOK) -> CartQuote:
+    """Refreshes the price book if needed (at most one aggregate query) and prices the cart."""
+    book.refresh(db)
+    return book.price_cart(lines)
+
+
+def main():
+    lines = []
+    for arg in sys.argv[1:] or ["1 Apple"]:
+        quantity, _, item = arg.partition(" ")
+        lines.append({"item": item, "quantity": quantity})
+    db = SessionLocal(use_replica=True)
+    try:
+        quote = price_cart(db, lines)
+    finally:
+        db.close()
+    for line in quote.lines:
+        print(f"{line['quantity']} x {line['item']} @ {line['unit_price']} = {line['line_total']}")
+    total = "n/a" if quote.total is None else f"{quote.total:.2f}"
+    print(f"Total: {total}  unavailable: {quote.unavailable}  unknown: {quote.unknown}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,16 @@
 from sqlalchemy.orm import Session
 from Accescochatbot.app.models.products import Products
+from Accescochatbot.app.utils.messages import locale_of, render
 
 def handle_product_queries(body, db: Session):
 
     # Extract parameters from Dialogflow ES
     params = body["queryResult"].get("parameters", {})
     product_name = params.get("product")
+    locale = locale_of(body)
 
     if not product_name:
-        return "Please tell me which product you're looking for."
+        return render("product_ask", locale)
 
     # ES may return list if multiple matches
     if isinstance(product_name, list):
@@ -20,8 +22,8 @@ def handle_product_queries(body, db: Session):
     ).first()
 
     if not product:
-        return f"Sorry, I couldn't find any product matching '{product_name}'."
+        return render("product_not_found", locale, product=product_name)
 
-    availability_text = "available" if product.available else "unavailable"
+    availability_text = render("available" if product.available else "unavailable", locale)
 
-    return f"{product.name} costs ₹{product.price} and is {availability_text}."
+    return render("product_info", locale, name=product.name, price=product.price, availability=availability_text)
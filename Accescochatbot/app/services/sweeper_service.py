@@ -0,0 +1,109 @@
+# app/services/sweeper_service.py
+"""
+Abandoned-cart sweeper.
+
+A session that adds items and never confirms leaves a pending order behind.
+expire_pending_orders() marks pending orders whose cart hasn't changed for
+CART_TTL_MINUTES as "expired" (the archival job later moves them out of
+`orders`). It works in batches of SWEEP_BATCH_SIZE, each its own
+transaction, and stops after SWEEP_MAX_BATCHES so one run stays short. Rows
+are claimed with FOR UPDATE SKIP LOCKED, so several app workers can sweep at
+once, and a cart being edited right now is skipped rather than waited on.
+
+Each run also deletes /chat conversation state idle for longer than
+CHAT_SESSION_TTL_MINUTES.
+
+Every run updates SWEEP_STATS, served at /metrics/sweeper.
+"""
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+
+from Accescochatbot.app.config import settings
+from Accescochatbot.app.database import SessionLocal
+from Accescochatbot.app.models.chat_sessions import ChatSessions
+from Accescochatbot.app.models.orders import Orders
+
+
+@dataclass
+class SweepStats:
+    runs: int = 0
+    swept: int = 0              # Orders expired, all runs
+    total_seconds: float = 0.0
+    last_swept: int = 0
+    last_batches: int = 0
+    last_seconds: float = 0.0
+    last_run_at: Optional[datetime] = None
+
+
+SWEEP_STATS = SweepStats()
+
+
+def expire_pending_orders(
+    db: Session,
+    ttl_minutes: int = settings.CART_TTL_MINUTES,
+    batch_size: int = settings.SWEEP_BATCH_SIZE,
+    max_batches: int = settings.SWEEP_MAX_BATCHES,
+    stats: SweepStats = SWEEP_STATS,
+) -> int:
+    """Expires pending orders idle for more than ttl_minutes. Returns how many expired."""
+    start = time.perf_counter()
+    now = datetime.utcnow()
+    cutoff = now - timedelta(minutes=ttl_minutes)
+    orders = Orders.__table__
+    idle = (orders.c.status == "pending", orders.c.updated_at < cutoff)
+    swept = batches = 0
+
+    while batches < max_batches:
+        batch = db.execute(
+            select(orders.c.id)
+            .where(*idle)
+            .order_by(orders.c.updated_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        ).scalars().all()
+        if not batch:
+            break
+
+        # Re-checking `idle` skips a cart that was edited after the select
+        swept += db.execute(
+            update(orders).where(orders.c.id.in_(batch), *idle).values(status="expired", updated_at=now, version=orders.c.version + 1)
+        ).rowcount
+        db.commit()
+        batches += 1
+
+        if len(batch) < batch_size:
+            break
+
+    elapsed = time.perf_counter() - start
+    stats.runs += 1
+    stats.swept += swept
+    stats.total_seconds += elapsed
+    stats.last_swept, stats.last_batches, stats.last_seconds = swept, batches, elapsed
+    stats.last_run_at = now
+    return swept
+
+
+def delete_idle_chat_sessions(db: Session, ttl_minutes: int = settings.CHAT_SESSION_TTL_MINUTES) -> int:
+    """Drops /chat conversation state nobody has used for ttl_minutes. Returns how many rows went."""
+    cutoff = datetime.utcnow() - timedelta(minutes=ttl_minutes)
+    deleted = db.execute(delete(ChatSessions).where(ChatSessions.updated_at < cutoff)).rowcount
+    db.commit()
+    return deleted
+
+
+def run_sweeper():
+    """One sweep with its own session; what the background job runs."""
+    db = SessionLocal()
+    try:
+        swept = expire_pending_orders(db)
+        if swept:
+            print(f"Expired {swept} abandoned carts in {SWEEP_STATS.last_seconds * 1000:.0f} ms")
+        delete_idle_chat_sessions(db)
+        return swept
+    finally:
+        db.close()
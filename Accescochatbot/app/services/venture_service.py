@@ -1,23 +1,26 @@
-def venture_descriptions(ventures: list):
+from Accescochatbot.app.utils.messages import DEFAULT_LOCALE, render
 
-    details = {
-        "GroMart": "GroMart is Exess’s grocery delivery service offering fast and fresh essentials.",
-        "EatFeast": "EatFeast is Exess’s premium food delivery service featuring top restaurants and diverse cuisines.",
-        "CalcIQ": "CalcIQ is Exess’s AI-powered smart calculator designed for quick and accurate computations.",
-        "RewardPlay": "RewardPlay is Exess’s interactive reward platform where users earn points by playing and engaging.",
-        "Dineout Cloud": "Dineout Cloud is Exess’s cloud-based restaurant management system for modern dining businesses.",
-        "Accesco Vault": "Accesco Vault is Exess’s secure digital vault for storing passwords, documents, and sensitive data."
-    }
+VENTURE_DETAILS = {
+    "GroMart": "GroMart is Exess’s grocery delivery service offering fast and fresh essentials.",
+    "EatFeast": "EatFeast is Exess’s premium food delivery service featuring top restaurants and diverse cuisines.",
+    "CalcIQ": "CalcIQ is Exess’s AI-powered smart calculator designed for quick and accurate computations.",
+    "RewardPlay": "RewardPlay is Exess’s interactive reward platform where users earn points by playing and engaging.",
+    "Dineout Cloud": "Dineout Cloud is Exess’s cloud-based restaurant management system for modern dining businesses.",
+    "Accesco Vault": "Accesco Vault is Exess’s secure digital vault for storing passwords, documents, and sensitive data."
+}
+
+
+def venture_descriptions(ventures: list, locale: str = DEFAULT_LOCALE):
 
     reply = []
 
     for v in ventures:
         # Match case-insensitively (GroMart = gromart = GROMART)
-        key = next((k for k in details if k.lower() == v.lower()), None)
+        key = next((k for k in VENTURE_DETAILS if k.lower() == v.lower()), None)
 
         if key:
-            reply.append(f"{key}: {details[key]}")
+            reply.append(render("venture_info", locale, name=key, description=VENTURE_DETAILS[key]))
         else:
-            reply.append(f"Sorry, I don’t have information about '{v}'. Please try asking about our available ventures.")
+            reply.append(render("venture_unknown", locale, venture=v))
 
-    return "\n\n".join(reply)
+    return render("venture_separator", locale).join(reply)
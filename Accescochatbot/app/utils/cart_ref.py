@@ -0,0 +1,50 @@
+# app/utils/cart_ref.py
+"""
+Compact cart references for Dialogflow order contexts.
+
+The cart itself lives server-side in the pending Orders row. The
+eatfeast-order / gromart-order context only carries "cart_ref":
+"<order_id>:<version>", so its size doesn't grow with the cart. The
+version is Orders.version when the context was sent; an older one means the
+cart has changed since the turn was built.
+
+Sessions started before this change still send the whole cart as
+items_list/qty_list; read_cart_context() decodes both shapes.
+"""
+from typing import Any, List, NamedTuple, Optional
+
+
+class CartContext(NamedTuple):
+    order_id: Optional[str] = None  # Set for a cart_ref context
+    version: Optional[int] = None
+    items: List[str] = []           # Set for a legacy items_list/qty_list context
+    qtys: List[Any] = []
+
+
+def encode_cart_ref(order_id: str, version: int) -> str:
+    return f"{order_id}:{version}"
+
+
+def parse_cart_ref(value: Any) -> Optional[CartContext]:
+    """"ORDERID:3" -> CartContext(order_id, 3); None if it isn't a cart ref."""
+    if not isinstance(value, str):
+        return None
+    order_id, sep, version = value.rpartition(":")
+    if not sep or not order_id or not version.isdigit():
+        return None
+    return CartContext(order_id=order_id, version=int(version))
+
+
+def read_cart_context(ctx_params: dict) -> CartContext:
+    """Decodes an order context's parameters, current (cart_ref) or legacy (items_list/qty_list)."""
+    ref = parse_cart_ref(ctx_params.get("cart_ref"))
+    if ref:
+        return ref
+
+    raw_items = ctx_params.get("items_list") or []
+    raw_qtys = ctx_params.get("qty_list") or []
+    items = [str(x) for x in raw_items] if isinstance(raw_items, list) else [str(raw_items)]
+    qtys = raw_qtys.copy() if isinstance(raw_qtys, list) else [raw_qtys]
+    while len(qtys) < len(items):
+        qtys.append(1)
+    return CartContext(items=items, qtys=qtys)
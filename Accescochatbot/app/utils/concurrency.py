@@ -0,0 +1,73 @@
+# app/utils/concurrency.py
+"""
+Keeping same-session cart writes from trampling each other.
+
+Three layers, cheapest first:
+
+  - SESSION_LOCKS: an asyncio lock per Dialogflow session, held by the
+    webhook around write handlers. Requests for one session run one at a
+    time in this worker. Different sessions never wait on each other.
+  - lock_session(): a Postgres transaction-level advisory lock on the
+    session id, for requests that land on different workers.
+  - Orders.version is SQLAlchemy's version_id_col, so an UPDATE based on a
+    stale read raises StaleDataError. Writers that don't take the session
+    lock (the sweeper, a cancel) can still cause that.
+    @retry_on_conflict re-runs the handler.
+"""
+import asyncio
+import functools
+from contextlib import asynccontextmanager
+from typing import Dict, List
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+
+CONFLICT_ATTEMPTS = 3
+
+
+class KeyedLock:
+    """asyncio locks by key, created on first use and dropped once nobody holds or awaits them."""
+
+    def __init__(self):
+        self._locks: Dict[str, List] = {}  # key -> [Lock, holders + waiters]
+
+    @asynccontextmanager
+    async def hold(self, key: str):
+        entry = self._locks.get(key)
+        if entry is None:
+            entry = self._locks[key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del self._locks[key]
+
+    def __len__(self):
+        return len(self._locks)
+
+
+SESSION_LOCKS = KeyedLock()
+
+
+def lock_session(db: Session, session_id: str):
+    """Postgres only: blocks until no other transaction holds this session, until commit/rollback."""
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text("SELECT pg_advisory_xact_lock(hashtext(:key))"), {"key": f"session:{session_id}"})
+
+
+def retry_on_conflict(handler):
+    """Re-runs handler(body, db, ...) after a rollback when its commit hits a stale version."""
+    @functools.wraps(handler)
+    def wrapper(body: dict, db: Session, *args, **kwargs):
+        for attempt in range(CONFLICT_ATTEMPTS):
+            try:
+                return handler(body, db, *args, **kwargs)
+            except StaleDataError:
+                db.rollback()
+                if attempt == CONFLICT_ATTEMPTS - 1:
+                    raise
+    return wrapper
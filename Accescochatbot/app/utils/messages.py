@@ -0,0 +1,216 @@
+# app/utils/messages.py
+"""
+Reply templates for every fulfillment message, per locale.
+
+Templates are str.format strings. They are checked and compiled to
+%-format strings at import, so a translation with a wrong placeholder fails
+at startup instead of mid-conversation. A locale only needs the keys it
+translates; the rest fall back to DEFAULT_LOCALE.
+"""
+import re
+from operator import itemgetter
+from string import Formatter
+from typing import Any, Callable, Iterable, Tuple
+
+DEFAULT_LOCALE = "en"
+
+TEMPLATES = {
+    "en": {
+        # Webhook
+        "invalid_json": "Invalid JSON received.",
+        "fallback": "Sorry, I didn't understand that.",
+
+        # Orders
+        "item_quantity": "{quantity} {item}",
+        "added_item_quantity": "{item} {quantity}",
+        "item_separator": ", ",
+        "items_not_understood": "I couldn't understand the items. Please repeat.",
+        "items_added": (
+            "Added {items} to your {platform} order ({count} items in your cart, ₹{total:.2f} so far). "
+            "Anything else?"
+        ),
+        "items_added_unpriced": (
+            "Added {items} to your {platform} order ({count} items in your cart; "
+            "some have no listed price, so there's no total yet). Anything else?"
+        ),
+        "cart_changed": (
+            "Your {platform} cart changed since your last message. It now has {items}. "
+            "What would you like to add?"
+        ),
+        "items_unavailable": "Sorry, these are currently unavailable: {items}.",
+        "pending_order_not_found": "I couldn't find your order. Please try ordering again.",
+        "order_confirmed": "Your {platform} order {order_id} has been confirmed! 🎉 Total: ₹{total:.2f}",
+        "order_confirmed_unpriced": (
+            "Your {platform} order {order_id} has been confirmed! 🎉 "
+            "Some items have no listed price, so the total isn't available."
+        ),
+        "track_missing_id": "I couldn't find an order ID. Please provide a valid order ID.",
+        "track_not_found": "No order found with ID {order_id}. Please check the ID and try again.",
+        "track_status": (
+            "Here is the status for your {platform} order {order_id}:\n"
+            "📌 status: {status}\n"
+            "🛒 Items: {items}\n"
+            "💰 Total: ₹{total:.2f}\n"
+            "⏱️ Created at: {created_at}"
+        ),
+        "track_status_unpriced": (
+            "Here is the status for your {platform} order {order_id}:\n"
+            "📌 status: {status}\n"
+            "🛒 Items: {items}\n"
+            "💰 Total: not available (some items have no listed price)\n"
+            "⏱️ Created at: {created_at}"
+        ),
+
+        "welcome": (
+            "Hi! I can take your EatFeast and GroMart orders, track or cancel an order, "
+            "and tell you about our ventures. What would you like to do?"
+        ),
+        "order_start": "Sure! What would you like to order from {platform}?",
+
+        # Cancellation
+        "cancel_ask_id": "Please tell me the Order ID you want to cancel.",
+        "cancel_not_found": "I couldn't find any order with ID {order_id}. Please check again.",
+        "cancel_confirm": "Are you sure you want to cancel order {order_id}?",
+        "cancel_unknown_order": "I couldn't identify which order to cancel. Please say the Order ID again.",
+        "cancel_order_missing": "Order {order_id} was not found in our system.",
+        "cancel_archived": "Order {order_id} is too old to cancel.",
+        "cancelled": "Your order {order_id} has been cancelled. Could you tell me why you cancelled it?",
+        "feedback_thanks": "Thank you for your feedback.",
+        "feedback_saved": "Thank you for your feedback. We appreciate it!",
+        "cancel_kept": "Okay, I won't cancel order {order_id}.",
+
+        # Products
+        "product_ask": "Please tell me which product you're looking for.",
+        "product_not_found": "Sorry, I couldn't find any product matching '{product}'.",
+        "product_info": "{name} costs ₹{price} and is {availability}.",
+        "available": "available",
+        "unavailable": "unavailable",
+
+        # Ventures
+        "venture_info": "{name}: {description}",
+        "venture_unknown": "Sorry, I don’t have information about '{venture}'. Please try asking about our available ventures.",
+        "venture_separator": "\n\n",
+    },
+}
+
+
+# -------------------------------------------------------------
+# Compilation
+# -------------------------------------------------------------
+# Templates are compiled once per locale, so rendering doesn't re-parse them:
+# a message becomes a %-format string plus an itemgetter for its fields, and
+# an item line becomes its literal pieces around {item} and {quantity}.
+_SPEC = re.compile(r"[+ ]?0?\d*(?:\.\d+)?[dfeEgGxXo]")  # Format specs % can express as-is
+_CONVERSIONS = {None: "s", "s": "s", "r": "r", "a": "a"}
+_LINE_KEYS = ("item_quantity", "added_item_quantity")
+
+
+def _fields(template: str) -> set:
+    return {name for _, name, _, _ in Formatter().parse(template) if name is not None}
+
+
+def _check_fields(template: str):
+    for _, name, spec, _ in Formatter().parse(template):
+        if name is not None and (not name.isidentifier() or "{" in (spec or "")):
+            raise ValueError(f"Template field {name!r} must be a plain name: {template!r}")
+
+
+def _compile(template: str) -> Tuple[str, Callable[[dict], tuple]]:
+    """(fmt, getter) with fmt % getter(values) == template.format(**values)."""
+    fmt, names = [], []
+    for literal, name, spec, conversion in Formatter().parse(template):
+        fmt.append(literal.replace("%", "%%"))
+        if name is None:
+            continue
+        if spec and (conversion or not _SPEC.fullmatch(spec)):
+            raise ValueError(f"Template field {name!r} has an unsupported format spec: {template!r}")
+        fmt.append("%" + (spec or _CONVERSIONS[conversion]))
+        names.append(name)
+    if len(names) > 1:
+        getter = itemgetter(*names)
+    elif names:
+        getter = lambda values, name=names[0]: (values[name],)
+    else:
+        getter = lambda values: ()
+    return "".join(fmt), getter
+
+
+def _compile_line(template: str, separator: str) -> tuple:
+    """
+    (prefix, first field, middle, second field, suffix + separator + prefix, suffix):
+    lines are first + middle + second, joined with the third piece and wrapped
+    in the prefix and suffix, so each line is a three-piece f-string.
+    """
+    parts = list(Formatter().parse(template))
+    names = [name for _, name, _, _ in parts if name is not None]
+    if sorted(names) != ["item", "quantity"] or any(spec or conversion for _, _, spec, conversion in parts):
+        raise ValueError(f"Item line must use {{item}} and {{quantity}} once each, unformatted: {template!r}")
+    literals = [literal for literal, _, _, _ in parts] + [""]
+    prefix, middle, suffix = literals[0], literals[1], "".join(literals[2:])
+    return prefix, names[0], middle, names[1], suffix + separator + prefix, suffix
+
+
+def _build(templates: dict) -> Tuple[dict, dict]:
+    """
+    (locale -> {key: (fmt, getter)}, locale -> {line key: _compile_line(...)}),
+    with missing keys filled from DEFAULT_LOCALE.
+    """
+    base = templates[DEFAULT_LOCALE]
+    tables, lines = {}, {}
+    for locale, table in templates.items():
+        for key, template in table.items():
+            if key not in base:
+                raise ValueError(f"Locale {locale!r} has unknown message {key!r}")
+            if _fields(template) != _fields(base[key]):
+                raise ValueError(f"Locale {locale!r} message {key!r} has different placeholders")
+            _check_fields(template)
+        merged = {**base, **table}
+        tables[locale] = {key: _compile(template) for key, template in merged.items()}
+        lines[locale] = {key: _compile_line(merged[key], merged["item_separator"]) for key in _LINE_KEYS}
+    return tables, lines
+
+
+_TABLES, _LINES = _build(TEMPLATES)
+
+
+# -------------------------------------------------------------
+# Rendering
+# -------------------------------------------------------------
+def locale_of(body: dict) -> str:
+    """The request's Dialogflow languageCode ("en", "en-US", ...) mapped to a known locale."""
+    code = ((body.get("queryResult", {}) or {}).get("languageCode") or DEFAULT_LOCALE).lower()
+    if code in _TABLES:
+        return code
+    code = code.split("-")[0]
+    return code if code in _TABLES else DEFAULT_LOCALE
+
+
+def render(key: str, locale: str = DEFAULT_LOCALE, **values: Any) -> str:
+    try:
+        fmt, getter = _TABLES[locale][key]
+    except KeyError:
+        fmt, getter = _TABLES[DEFAULT_LOCALE][key]
+    return fmt % getter(values)
+
+
+def render_items(items: Iterable[Tuple[Any, Any]], locale: str = DEFAULT_LOCALE, line_key: str = "item_quantity") -> str:
+    """(item, quantity) pairs as "2 Pizza, 1 Coke", each pair rendered with `line_key`."""
+    try:
+        prefix, first, middle, _, glue, suffix = _LINES[locale][line_key]
+    except KeyError:
+        prefix, first, middle, _, glue, suffix = _LINES[DEFAULT_LOCALE][line_key]
+    if first == "item":
+        lines = glue.join([f"{item}{middle}{quantity}" for item, quantity in items])
+    else:
+        lines = glue.join([f"{quantity}{middle}{item}" for item, quantity in items])
+    return f"{prefix}{lines}{suffix}" if (prefix or suffix) and lines else lines
+
+
+def render_item_rows(rows: Iterable[dict], locale: str = DEFAULT_LOCALE, line_key: str = "item_quantity") -> str:
+    """Like render_items, for stored order items ({"item": ..., "quantity": ...} dicts)."""
+    try:
+        prefix, first, middle, second, glue, suffix = _LINES[locale][line_key]
+    except KeyError:
+        prefix, first, middle, second, glue, suffix = _LINES[DEFAULT_LOCALE][line_key]
+    lines = glue.join([f"{row[first]}{middle}{row[second]}" for row in rows])
+    return f"{prefix}{lines}{suffix}" if (prefix or suffix) and lines else lines
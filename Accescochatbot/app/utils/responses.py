@@ -0,0 +1,21 @@
+# app/utils/responses.py
+import orjson
+from starlette.responses import Response
+
+
+class FastJSONResponse(Response):
+    """
+    JSON response serialized straight to bytes by orjson.
+
+    Handlers return it (not a dict) so FastAPI skips its jsonable_encoder pass;
+    the payloads are plain dicts/lists/strings, which orjson handles natively.
+    """
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+def fulfillment(text: str, **extra) -> FastJSONResponse:
+    """A Dialogflow webhook reply: fulfillmentText plus any extra fields (outputContexts, ...)."""
+    return FastJSONResponse({"fulfillmentText": text, **extra})
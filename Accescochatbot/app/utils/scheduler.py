@@ -0,0 +1,23 @@
+# app/utils/scheduler.py
+import asyncio
+from typing import Callable
+
+from starlette.concurrency import run_in_threadpool
+
+
+def run_periodically(interval_seconds: float, job: Callable, *args, name: str = "job") -> asyncio.Task:
+    """
+    Starts a background task that calls job(*args) every interval_seconds,
+    starting one interval from now. The job runs in the threadpool, so it can
+    use blocking DB sessions. Failures are printed and the loop carries on.
+    Call from inside the running event loop (e.g. a startup handler).
+    """
+    async def loop():
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await run_in_threadpool(job, *args)
+            except Exception as e:
+                print(f"Scheduled {name} failed: {e}")
+
+    return asyncio.get_running_loop().create_task(loop(), name=name)
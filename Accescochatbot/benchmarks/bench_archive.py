@@ -0,0 +1,76 @@
+"""
+Order lookup latency and hot-table size as order history accumulates, with
+and without the archival job. Uses an in-memory SQLite database: it shows
+what archival does to the hot table, not Postgres partition pruning. Run
+from the repository root:
+
+    python -m Accescochatbot.benchmarks.bench_archive --history 10000 100000
+"""
+import argparse
+import random
+import timeit
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from Accescochatbot.app.database import Base
+from Accescochatbot.app.models.orders import Orders
+from Accescochatbot.app.models.orders_archive import OrdersArchive
+from Accescochatbot.app.services.archive_service import archive_orders, find_order
+
+RECENT = 2000  # Orders from the last 30 days, the same at every history size
+ITEMS = [{"item": "Paneer Tikka", "quantity": 2}, {"item": "Cold Coffee", "quantity": 1}]
+
+
+def populate(db, history: int):
+    now = datetime.utcnow()
+    rows = []
+    for n in range(history + RECENT):
+        age = random.uniform(0, 30) if n >= history else random.uniform(120, 720)
+        rows.append({
+            "id": n + 1,
+            "order_id": f"{n:010X}",
+            "platform": "EatFeast",
+            "session_id": f"session-{n % 5000}",
+            "items": ITEMS,
+            "status": random.choice(("confirmed", "cancelled")),
+            "version": 1,
+            "created_at": now - timedelta(days=age),
+        })
+    db.execute(insert(Orders.__table__), rows)
+    db.commit()
+
+
+def lookup_us(db, order_ids, number=2000):
+    ids = iter(order_ids * (number // len(order_ids) + 1))
+    return timeit.timeit(lambda: find_order(db, next(ids)), number=number) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Order lookup latency with and without archival.")
+    parser.add_argument("--history", type=int, nargs="+", default=[0, 10000, 100000], help="Orders older than 90 days")
+    args = parser.parse_args()
+    random.seed(0)
+
+    print(f"{'history':>8} {'hot rows':>9} {'archived':>9} {'recent µs':>10} {'old µs':>8}")
+    for history in args.history:
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine, tables=[Orders.__table__, OrdersArchive.__table__])
+        db = sessionmaker(bind=engine)()
+        populate(db, history)
+        recent = [f"{n:010X}" for n in range(history, history + RECENT, 7)]
+        old = [f"{n:010X}" for n in range(0, history, max(1, history // 300))]
+
+        for label in ("before", "after"):
+            if label == "after":
+                archive_orders(db, older_than_days=90)
+            hot = db.scalar(select(func.count()).select_from(Orders))
+            archived = db.scalar(select(func.count()).select_from(OrdersArchive))
+            old_us = f"{lookup_us(db, old):>8.1f}" if old else f"{'-':>8}"
+            print(f"{history:>8} {hot:>9} {archived:>9} {lookup_us(db, recent):>10.1f} {old_us}  {label} archival")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
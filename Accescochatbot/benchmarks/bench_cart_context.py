@@ -0,0 +1,85 @@
+"""
+Webhook payload size per add-item turn as the cart grows.
+
+Plays one session that adds an item per turn through handle_add_item
+(against an in-memory SQLite database) and, for comparison, the old
+full-cart context (items_list/qty_list). Sizes are of the orjson-serialized
+reply, which is also what Dialogflow echoes back as the next request's
+outputContexts. Run from the repository root:
+
+    python -m Accescochatbot.benchmarks.bench_cart_context --turns 100
+"""
+import argparse
+import time
+
+import orjson
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from Accescochatbot.app.database import Base
+from Accescochatbot.app.models.orders import Orders
+from Accescochatbot.app.models.orders_archive import OrdersArchive
+from Accescochatbot.app.models.products import Products
+from Accescochatbot.app.services.order_service import handle_add_item
+
+SESSION = "projects/accesco/agent/sessions/3f1c9a1e-5b7d-4c55-9f0e-0d7a2b1c4e88"
+ITEMS = ["Paneer Tikka", "Butter Naan", "Masala Dosa", "Cold Coffee", "Gulab Jamun", "Basmati Rice", "Toor Dal"]
+
+
+def request(turn: int, contexts: list) -> dict:
+    return {
+        "session": SESSION,
+        "queryResult": {
+            "languageCode": "en",
+            "parameters": {"grocery-item": ITEMS[turn % len(ITEMS)], "number": turn % 5 + 1},
+            "outputContexts": contexts,
+        },
+    }
+
+
+def legacy_reply(items: list, qtys: list) -> dict:
+    """The context handle_add_item used to write: the whole cart, every turn."""
+    return {
+        "fulfillmentText": f"Added {', '.join(f'{i} {q}' for i, q in zip(items, qtys))} to your GroMart order. Anything else?",
+        "outputContexts": [{
+            "name": f"{SESSION}/contexts/gromart-order",
+            "lifespanCount": 10,
+            "parameters": {"items_list": items, "qty_list": qtys},
+        }],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Add-item payload size, cart refs vs full-cart contexts.")
+    parser.add_argument("--turns", type=int, default=100)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[Orders.__table__, OrdersArchive.__table__, Products.__table__])
+    db = sessionmaker(bind=engine)()
+
+    contexts, items, qtys = [], [], []
+    report = {1, 10, 25, 50, 100, args.turns}
+    elapsed = 0.0
+    print(f"{'cart items':>10} {'full cart B':>12} {'cart ref B':>11}")
+    for turn in range(args.turns):
+        body = request(turn, contexts)
+        start = time.perf_counter()
+        _, reply = handle_add_item(body, db, "GroMart", "grocery-item")
+        elapsed += time.perf_counter() - start
+        contexts = reply["outputContexts"]
+
+        params = body["queryResult"]["parameters"]
+        items.append(params["grocery-item"])
+        qtys.append(params["number"])
+        if turn + 1 in report:
+            old = len(orjson.dumps(legacy_reply(items, qtys)))
+            new = len(orjson.dumps(reply))
+            print(f"{turn + 1:>10} {old:>12} {new:>11}")
+
+    print(f"\nhandle_add_item: {elapsed / args.turns * 1e3:.2f} ms/turn (SQLite, in memory)")
+    print(f"last context: {contexts[0]['parameters']}")
+
+
+if __name__ == "__main__":
+    main()
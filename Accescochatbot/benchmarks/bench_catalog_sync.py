@@ -0,0 +1,78 @@
+"""
+Catalog sync throughput: sync_catalog() against the per-row ORM upsert it
+replaces (query by name, then update or add). Uses a SQLite file, so the
+sync takes the executemany path; on Postgres it COPYs into a staging table
+instead. Run from the repository root:
+
+    python -m Accescochatbot.benchmarks.bench_catalog_sync --rows 100000
+"""
+import argparse
+import io
+import os
+import random
+import tempfile
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from Accescochatbot.app.database import Base
+from Accescochatbot.app.models.products import Products
+from Accescochatbot.app.services.catalog_service import read_feed, sync_catalog
+
+
+def make_feed(rows: int, changed: float, seed: int) -> str:
+    """CSV for `rows` products; a `changed` share get a new price or availability."""
+    rng = random.Random(seed)
+    lines = ["name,price,available"]
+    for n in range(rows):
+        price = 10 + n % 500 + (rng.randint(1, 9) if rng.random() < changed else 0)
+        lines.append(f"Product {n},{price}.50,{'false' if n % 37 == 0 else 'true'}")
+    return "\n".join(lines) + "\n"
+
+
+def orm_upsert(db, feed: str):
+    for name, price, available in read_feed(io.StringIO(feed)):
+        product = db.query(Products).filter(Products.name == name).first()
+        if product:
+            product.price, product.available = price, available
+        else:
+            db.add(Products(name=name, price=price, available=available))
+    db.commit()
+
+
+def fresh_session(path: str):
+    if os.path.exists(path):
+        os.remove(path)
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine, tables=[Products.__table__])
+    return sessionmaker(bind=engine)()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Catalog sync vs per-row ORM upserts.")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--orm-rows", type=int, default=5000, help="The ORM path is timed on this many rows")
+    args = parser.parse_args()
+
+    initial, update = make_feed(args.rows, 0, 0), make_feed(args.rows, 0.05, 1)
+    path = os.path.join(tempfile.mkdtemp(), "catalog.db")
+
+    db = fresh_session(path)
+    for label, feed in (("initial load", initial), ("5% changed", update), ("no changes", update)):
+        result = sync_catalog(db, io.StringIO(feed))
+        print(f"sync  {label:<13} {result.seconds:6.2f}s  "
+              f"({result.inserted} inserted, {result.updated} updated, {result.unchanged} unchanged)")
+    db.close()
+
+    db = fresh_session(path)
+    small = "\n".join(initial.splitlines()[:args.orm_rows + 1]) + "\n"
+    start = time.perf_counter()
+    orm_upsert(db, small)
+    per_row = (time.perf_counter() - start) / args.orm_rows
+    print(f"ORM   initial load  {per_row * args.rows:6.2f}s  (extrapolated from {args.orm_rows} rows)")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
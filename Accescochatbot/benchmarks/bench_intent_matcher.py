@@ -0,0 +1,79 @@
+"""
+Local intent matcher latency per utterance.
+
+Builds a catalog index of --products synthetic product names (plus a few
+real ones the utterances mention) and times intent_matcher.match() over a
+mix of order, track, cancel, product, venture and off-topic utterances.
+Compare the p99 with a Dialogflow detectIntent round trip (typically
+100-300 ms). Run from the repository root:
+
+    python -m Accescochatbot.benchmarks.bench_intent_matcher --products 5000
+"""
+import argparse
+import random
+import time
+
+from Accescochatbot.app.services.intent_matcher import CatalogIndex, ChatState, match
+
+REAL = ["Apple", "Milk", "Brown Bread", "Paneer Tikka", "Butter Naan", "Masala Dosa", "Cold Coffee"]
+WORDS = ["organic", "fresh", "spicy", "classic", "masala", "butter", "green", "golden", "crispy", "veg",
+         "chicken", "rice", "dal", "chips", "juice", "soap", "tea", "biscuit", "paneer", "curd"]
+
+UTTERANCES = [
+    ("track order EX1A2B3C4D", ChatState()),
+    ("where is my order 61E1DEB9-2", ChatState()),
+    ("please cancel order EX0F0F0F0F", ChatState()),
+    ("yes", ChatState(cancel_order_id="EX0F0F0F0F")),
+    ("2 apples and milk", ChatState(platform="GroMart")),
+    ("add one paneer tikka and two butter naan please", ChatState(platform="EatFeast")),
+    ("that's all", ChatState(platform="GroMart")),
+    ("i want to order from eatfeast", ChatState()),
+    ("how much is cold coffee", ChatState()),
+    ("what is calciq", ChatState()),
+    ("hello", ChatState()),
+    ("what's the weather like in paris tomorrow", ChatState()),
+]
+
+
+def synthetic_catalog(n: int) -> CatalogIndex:
+    rng = random.Random(42)
+    names = {" ".join(rng.sample(WORDS, rng.randint(1, 3))).title() for _ in range(n)}
+    return CatalogIndex(list(names)[:n] + REAL)
+
+
+def percentile(samples: list, p: float) -> float:
+    return samples[min(len(samples) - 1, int(len(samples) * p))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local intent matcher latency.")
+    parser.add_argument("--products", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    catalog = synthetic_catalog(args.products)
+    print(f"Catalog index: {len(catalog.phrases)} phrases in {(time.perf_counter() - start) * 1000:.1f} ms\n")
+
+    print(f"{'utterance':<50}{'intent':<30}{'conf':>6}{'p50 µs':>10}{'p99 µs':>10}")
+    everything = []
+    for text, state in UTTERANCES:
+        result = match(text, state, catalog)
+        samples = []
+        for _ in range(args.rounds):
+            t = time.perf_counter()
+            match(text, state, catalog)
+            samples.append((time.perf_counter() - t) * 1e6)
+        samples.sort()
+        everything.extend(samples)
+        print(
+            f"{text[:48]:<50}{result.intent:<30}{result.confidence:>6.2f}"
+            f"{percentile(samples, 0.5):>10.1f}{percentile(samples, 0.99):>10.1f}"
+        )
+
+    everything.sort()
+    print(f"\nAll utterances: p50 {percentile(everything, 0.5):.1f} µs, p99 {percentile(everything, 0.99):.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Cart pricing: per-item product queries vs the in-memory price book.
+
+Prices carts of --items lines against a products table of --products rows
+(in-memory SQLite), counting the SQL statements each approach runs. The
+per-item baseline is what pricing a cart used to take: one Products lookup
+per line, like product_service does for a single product. Run from the
+repository root:
+
+    python -m Accescochatbot.benchmarks.bench_pricing --items 50
+"""
+import argparse
+import random
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from Accescochatbot.app.database import Base
+from Accescochatbot.app.models.products import Products
+from Accescochatbot.app.services.pricing_service import PriceBook, price_cart
+
+
+def per_item_total(db, lines) -> float:
+    total = 0.0
+    for line in lines:
+        product = db.query(Products).filter(Products.name == line["item"]).first()
+        if product and product.available:
+            total += product.price * line["quantity"]
+    return round(total, 2)
+
+
+def timed(fn, rounds: int):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        result = fn()
+    return result, (time.perf_counter() - start) / rounds * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cart pricing, per-item queries vs price book.")
+    parser.add_argument("--products", type=int, default=5000)
+    parser.add_argument("--items", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[Products.__table__])
+    db = sessionmaker(bind=engine)()
+    rng = random.Random(7)
+    db.add_all(
+        Products(name=f"Product {i}", price=round(rng.uniform(10, 500), 2), available=rng.random() > 0.05)
+        for i in range(args.products)
+    )
+    db.commit()
+
+    statements = [0]
+    event.listen(engine, "before_cursor_execute", lambda *a: statements.__setitem__(0, statements[0] + 1))
+
+    def count(fn):
+        statements[0] = 0
+        result = fn()
+        return result, statements[0]
+
+    lines = [{"item": f"Product {rng.randrange(args.products)}", "quantity": rng.randint(1, 5)}
+             for _ in range(args.items)]
+
+    book = PriceBook(check_seconds=30)
+    (_, cold_us), cold_queries = count(lambda: timed(lambda: price_cart(db, lines, book), 1))
+    book_always = PriceBook(check_seconds=0)
+    price_cart(db, lines, book_always)
+
+    (naive, naive_queries) = count(lambda: per_item_total(db, lines))
+    (quote, warm_queries) = count(lambda: price_cart(db, lines, book))
+    (_, check_queries) = count(lambda: price_cart(db, lines, book_always))
+    assert abs(naive - quote.total) < 0.01, (naive, quote.total)
+
+    _, naive_us = timed(lambda: per_item_total(db, lines), args.rounds)
+    _, warm_us = timed(lambda: price_cart(db, lines, book), args.rounds)
+    _, check_us = timed(lambda: price_cart(db, lines, book_always), args.rounds)
+
+    print(f"{args.items}-line cart, {args.products} products, total ₹{quote.total:.2f}\n")
+    print(f"{'approach':<40}{'queries':>8}{'µs/cart':>12}")
+    print(f"{'per-item Products query':<40}{naive_queries:>8}{naive_us:>12.1f}")
+    print(f"{'price book, first load':<40}{cold_queries:>8}{cold_us:>12.1f}")
+    print(f"{'price book, version check':<40}{check_queries:>8}{check_us:>12.1f}")
+    print(f"{'price book, within PRICE_CHECK_SECONDS':<40}{warm_queries:>8}{warm_us:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Per-request cost of building and serializing webhook replies.
+
+Compares the old path (f-string replies, dict returned through FastAPI's
+jsonable_encoder + JSONResponse) with the templates in app/utils/messages
+and FastJSONResponse. Run from the repository root:
+
+    python -m Accescochatbot.benchmarks.bench_responses
+"""
+import timeit
+from datetime import datetime
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from Accescochatbot.app.utils.messages import render, render_items, render_item_rows
+from Accescochatbot.app.utils.responses import FastJSONResponse
+
+SESSION = "projects/accesco/agent/sessions/3f1c9a1e-5b7d-4c55-9f0e-0d7a2b1c4e88"
+ITEMS = ["Paneer Tikka", "Butter Naan", "Masala Dosa", "Cold Coffee", "Gulab Jamun"]
+QTYS = [2, 4, 1, 3, 6]
+ORDER_ITEMS = [{"item": i, "quantity": q} for i, q in zip(ITEMS, QTYS)]
+CREATED = datetime(2026, 1, 5, 19, 42)
+TOTAL = 1342.5
+
+
+# -------------------------------------------------------------
+# Reply building
+# -------------------------------------------------------------
+def add_item_old():
+    added_text = ", ".join([f"{q} {i}" for i, q in zip(QTYS, ITEMS)])
+    return {
+        "fulfillmentText": (
+            f"Added {added_text} to your EatFeast order ({len(ITEMS)} items in your cart, ₹{TOTAL:.2f} so far). "
+            "Anything else?"
+        ),
+        "outputContexts": [{
+            "name": f"{SESSION}/contexts/eatfeast-order",
+            "lifespanCount": 10,
+            "parameters": {"items_list": ITEMS, "qty_list": QTYS},
+        }],
+    }
+
+
+def add_item_new():
+    return {
+        "fulfillmentText": render(
+            "items_added", items=render_items(zip(ITEMS, QTYS), line_key="added_item_quantity"), platform="EatFeast", count=len(ITEMS),
+            total=TOTAL,
+        ),
+        "outputContexts": [{
+            "name": f"{SESSION}/contexts/eatfeast-order",
+            "lifespanCount": 10,
+            "parameters": {"items_list": ITEMS, "qty_list": QTYS},
+        }],
+    }
+
+
+def track_old():
+    items_str = ", ".join([f"{item['quantity']} {item['item']}" for item in ORDER_ITEMS])
+    created_time = CREATED.strftime("%Y-%m-%d %H:%M")
+    return {"fulfillmentText": (
+        f"Here is the status for your EatFeast order 3F1C9A1E-5:\n"
+        f"📌 status: confirmed\n"
+        f"🛒 Items: {items_str}\n"
+        f"💰 Total: ₹{TOTAL:.2f}\n"
+        f"⏱️ Created at: {created_time}"
+    )}
+
+
+def track_new():
+    items_str = render_item_rows(ORDER_ITEMS)
+    return {"fulfillmentText": render(
+        "track_status",
+        platform="EatFeast", order_id="3F1C9A1E-5", status="confirmed",
+        items=items_str, total=TOTAL, created_at=CREATED.isoformat(" ", "minutes"),
+    )}
+
+
+# -------------------------------------------------------------
+# Serialization
+# -------------------------------------------------------------
+def serialize_old(payload):
+    # What FastAPI does with a returned dict: jsonable_encoder, then JSONResponse
+    return JSONResponse(jsonable_encoder(payload)).body
+
+
+def serialize_new(payload):
+    return FastJSONResponse(payload).body
+
+
+def bench(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main(number: int = 20000):
+    assert add_item_old() == add_item_new() and track_old() == track_new()
+    print(f"{'reply':<10} {'step':<10} {'old µs':>8} {'new µs':>8} {'speedup':>8}")
+    for name, old, new in (("add item", add_item_old, add_item_new), ("track", track_old, track_new)):
+        payload = old()
+        rows = (
+            ("build", old, new),
+            ("serialize", lambda: serialize_old(payload), lambda: serialize_new(payload)),
+            ("total", lambda: serialize_old(old()), lambda: serialize_new(new())),
+        )
+        for step, old_fn, new_fn in rows:
+            old_us, new_us = bench(old_fn, number), bench(new_fn, number)
+            print(f"{name:<10} {step:<10} {old_us:>8.2f} {new_us:>8.2f} {old_us / new_us:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Concurrency stress test for same-session cart writes.
+
+Fires --calls add-item webhook requests at once for each of --sessions
+Dialogflow sessions, all carrying the same (empty) context the way
+near-simultaneous turns do. Afterwards every session must have exactly one
+pending order holding all of its items. The script exits 1 and lists the
+lost updates or duplicate carts otherwise.
+
+--unlocked calls handle_add_item straight from the threadpool, skipping the
+webhook's per-session lock, to show what the lock prevents. On SQLite there
+is no advisory lock either, so only the version check is left.
+
+Uses a throwaway SQLite file unless DATABASE_URL is set. Run from the
+repository root:
+
+    python -m Accescochatbot.benchmarks.stress_add_item --sessions 50 --calls 8
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'stress.db')}")
+os.environ.setdefault("ARCHIVE_INTERVAL_MINUTES", "0")
+os.environ.setdefault("SWEEP_INTERVAL_MINUTES", "0")
+
+import httpx
+from sqlalchemy import delete
+from starlette.concurrency import run_in_threadpool
+
+from Accescochatbot.app.database import Base, SessionLocal, engine
+from Accescochatbot.app.main import app
+from Accescochatbot.app.models.orders import Orders
+from Accescochatbot.app.models.orders_archive import OrdersArchive
+from Accescochatbot.app.models.products import Products
+from Accescochatbot.app.services.order_service import handle_add_item
+
+
+def request_body(session: str, item: str) -> dict:
+    return {
+        "session": f"projects/accesco/agent/sessions/{session}",
+        "queryResult": {
+            "intent": {"displayName": "order eatfeast - custom"},
+            "parameters": {"eatfeast-food-items": item, "number": 1},
+            "outputContexts": [],
+            "languageCode": "en",
+        },
+    }
+
+
+async def via_webhook(client: httpx.AsyncClient, body: dict):
+    response = await client.post("/webhook", json=body)
+    response.raise_for_status()
+
+
+def unlocked_add_item(body: dict):
+    db = SessionLocal()
+    try:
+        handle_add_item(body=body, db=db, platform="EatFeast", item_param="eatfeast-food-items")
+    finally:
+        db.close()
+
+
+async def run(sessions: int, calls: int, unlocked: bool) -> float:
+    bodies = [request_body(f"stress-{s}", f"item-{c}") for s in range(sessions) for c in range(calls)]
+    start = time.perf_counter()
+    if unlocked:
+        results = await asyncio.gather(*(run_in_threadpool(unlocked_add_item, b) for b in bodies), return_exceptions=True)
+    else:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://stress") as client:
+            results = await asyncio.gather(*(via_webhook(client, b) for b in bodies), return_exceptions=True)
+    elapsed = time.perf_counter() - start
+
+    errors = [r for r in results if isinstance(r, Exception)]
+    if errors:
+        print(f"{len(errors)} requests failed, e.g. {errors[0]!r}")
+    return elapsed
+
+
+def check(sessions: int, calls: int) -> list:
+    problems = []
+    with SessionLocal() as db:
+        for s in range(sessions):
+            carts = db.query(Orders).filter(Orders.session_id == f"stress-{s}", Orders.status == "pending").all()
+            items = sorted(line["item"] for cart in carts for line in cart.items)
+            if len(carts) != 1:
+                problems.append(f"stress-{s}: {len(carts)} pending carts")
+            elif len(items) != calls:
+                problems.append(f"stress-{s}: {len(items)}/{calls} items kept")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent same-session add-item stress test.")
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--calls", type=int, default=8, help="Simultaneous add-item calls per session")
+    parser.add_argument("--unlocked", action="store_true", help="Skip the webhook's per-session lock")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(engine, tables=[Orders.__table__, OrdersArchive.__table__, Products.__table__])
+    with SessionLocal() as db:
+        db.execute(delete(Orders).where(Orders.session_id.like("stress-%")))
+        db.commit()
+
+    total = args.sessions * args.calls
+    elapsed = asyncio.run(run(args.sessions, args.calls, args.unlocked))
+    problems = check(args.sessions, args.calls)
+    print(f"{total} add-item calls over {args.sessions} sessions in {elapsed:.2f}s ({total / elapsed:.0f}/s)")
+    if problems:
+        print(f"{len(problems)} sessions lost updates or got duplicate carts:")
+        for problem in problems[:10]:
+            print(f"  {problem}")
+        sys.exit(1)
+    print("every session has one pending cart with all of its items")
+
+
+if __name__ == "__main__":
+    main()
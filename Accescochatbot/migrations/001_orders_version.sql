@@ -0,0 +1,3 @@
+-- Cart version for the compact cart refs in Dialogflow order contexts
+-- ("<order_id>:<version>"). Bumped on every cart change.
+ALTER TABLE orders ADD COLUMN IF NOT EXISTS version integer NOT NULL DEFAULT 0;
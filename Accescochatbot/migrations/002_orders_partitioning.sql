@@ -0,0 +1,100 @@
+-- Monthly range partitions on orders.created_at, plus orders_archive for the
+-- archival job (app/services/archive_service.py). Run once, in a quiet window:
+-- it copies the whole orders table.
+--
+-- Postgres requires the partition key in every unique constraint, so the
+-- primary key becomes (id, created_at) and order_id gets a plain index. Order
+-- ids are random, and orders_archive still enforces uniqueness for history.
+
+BEGIN;
+
+-- ---------------- Partitioned orders ----------------
+ALTER TABLE orders RENAME TO orders_unpartitioned;
+ALTER SEQUENCE orders_id_seq OWNED BY NONE;
+
+CREATE TABLE orders (
+    id integer NOT NULL DEFAULT nextval('orders_id_seq'),
+    order_id varchar NOT NULL,
+    platform varchar NOT NULL,
+    session_id varchar,
+    items json,
+    status varchar DEFAULT 'pending',
+    version integer NOT NULL DEFAULT 0,
+    created_at timestamp NOT NULL DEFAULT (now() AT TIME ZONE 'utc'),
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+-- Catches rows for months nobody created a partition for
+CREATE TABLE orders_default PARTITION OF orders DEFAULT;
+
+CREATE OR REPLACE FUNCTION orders_ensure_partition(month date) RETURNS void AS $$
+DECLARE
+    first_day date := date_trunc('month', month);
+BEGIN
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS %I PARTITION OF orders FOR VALUES FROM (%L) TO (%L)',
+        'orders_' || to_char(first_day, 'YYYY_MM'), first_day, first_day + interval '1 month'
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+-- Drops monthly partitions that end before `before` and have no rows left
+-- (everything in them was archived). Pending carts keep their month alive.
+CREATE OR REPLACE FUNCTION orders_drop_empty_partitions(before timestamp) RETURNS integer AS $$
+DECLARE
+    part record;
+    has_rows boolean;
+    dropped integer := 0;
+BEGIN
+    FOR part IN
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'orders'::regclass AND c.relname ~ '^orders_\d{4}_\d{2}$'
+    LOOP
+        CONTINUE WHEN to_date(substr(part.relname, 8), 'YYYY_MM') + interval '1 month' > before;
+        EXECUTE format('SELECT EXISTS (SELECT 1 FROM %I)', part.relname) INTO has_rows;
+        CONTINUE WHEN has_rows;
+        EXECUTE format('DROP TABLE %I', part.relname);
+        dropped := dropped + 1;
+    END LOOP;
+    RETURN dropped;
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT orders_ensure_partition(m::date)
+FROM generate_series(
+    date_trunc('month', coalesce((SELECT min(created_at) FROM orders_unpartitioned), now())),
+    date_trunc('month', now()) + interval '3 months',
+    interval '1 month'
+) AS m;
+
+INSERT INTO orders (id, order_id, platform, session_id, items, status, version, created_at)
+SELECT id, order_id, platform, session_id, items, status, version,
+       coalesce(created_at, now() AT TIME ZONE 'utc')
+FROM orders_unpartitioned;
+
+DROP TABLE orders_unpartitioned;
+ALTER SEQUENCE orders_id_seq OWNED BY orders.id;
+
+-- Lookups by id (track/cancel), the pending cart per session, and the
+-- archival scan. The partial indexes only cover rows still in play.
+CREATE INDEX ix_orders_order_id ON orders (order_id);
+CREATE INDEX ix_orders_pending_session ON orders (session_id) WHERE status = 'pending';
+CREATE INDEX ix_orders_archivable ON orders (created_at) WHERE status IN ('confirmed', 'cancelled');
+
+-- ---------------- Archive ----------------
+CREATE TABLE IF NOT EXISTS orders_archive (
+    id integer PRIMARY KEY,
+    order_id varchar NOT NULL,
+    platform varchar NOT NULL,
+    session_id varchar,
+    items json,
+    status varchar,
+    version integer NOT NULL DEFAULT 0,
+    created_at timestamp,
+    archived_at timestamp DEFAULT (now() AT TIME ZONE 'utc')
+);
+CREATE UNIQUE INDEX IF NOT EXISTS ix_orders_archive_order_id ON orders_archive (order_id);
+
+COMMIT;
@@ -0,0 +1,19 @@
+-- Last-change time for the abandoned-cart sweeper (app/services/sweeper_service.py),
+-- which marks pending orders idle past CART_TTL_MINUTES as 'expired'.
+-- Expired orders are archived like confirmed/cancelled ones.
+
+BEGIN;
+
+ALTER TABLE orders ADD COLUMN IF NOT EXISTS updated_at timestamp;
+UPDATE orders SET updated_at = created_at WHERE updated_at IS NULL;
+ALTER TABLE orders ALTER COLUMN updated_at SET DEFAULT (now() AT TIME ZONE 'utc');
+
+ALTER TABLE orders_archive ADD COLUMN IF NOT EXISTS updated_at timestamp;
+
+-- The sweeper's scan: only pending rows, oldest change first
+CREATE INDEX IF NOT EXISTS ix_orders_pending_idle ON orders (updated_at) WHERE status = 'pending';
+
+DROP INDEX IF EXISTS ix_orders_archivable;
+CREATE INDEX ix_orders_archivable ON orders (created_at) WHERE status IN ('confirmed', 'cancelled', 'expired');
+
+COMMIT;
@@ -0,0 +1,5 @@
+-- Catalog sync (app/services/catalog_service.py) matches feed rows to
+-- products by name and stamps every row it changes.
+
+ALTER TABLE products ADD COLUMN IF NOT EXISTS updated_at timestamp DEFAULT (now() AT TIME ZONE 'utc');
+CREATE INDEX IF NOT EXISTS ix_products_name ON products (name);
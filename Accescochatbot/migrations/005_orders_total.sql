@@ -0,0 +1,9 @@
+-- Cart total stored when an order is confirmed (app/services/pricing_service.py).
+-- Orders confirmed before this are priced at current prices when tracked.
+
+BEGIN;
+
+ALTER TABLE orders ADD COLUMN IF NOT EXISTS total double precision;
+ALTER TABLE orders_archive ADD COLUMN IF NOT EXISTS total double precision;
+
+COMMIT;
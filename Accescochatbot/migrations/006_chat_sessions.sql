@@ -0,0 +1,11 @@
+-- Conversation state for the /chat endpoint (app/services/chat_service.py):
+-- what the next turn is expected to answer (a cancel confirmation, feedback,
+-- more items), so any worker can take the turn. The sweeper deletes rows
+-- idle for more than CHAT_SESSION_TTL_MINUTES.
+
+CREATE TABLE IF NOT EXISTS chat_sessions (
+    session_id varchar(64) PRIMARY KEY,
+    state json NOT NULL,
+    updated_at timestamp DEFAULT (now() AT TIME ZONE 'utc')
+);
+CREATE INDEX IF NOT EXISTS ix_chat_sessions_updated_at ON chat_sessions (updated_at);
@@ -0,0 +1,101 @@
+"""
+Read-replica routing (app/database.py RoutingSession) against two SQLite
+files standing in for the primary and the replica. Run from the repository
+root:
+
+    python -m pytest Accescochatbot/tests
+"""
+import pytest
+from sqlalchemy import create_engine, event, select, text
+from sqlalchemy.orm import Session
+
+from Accescochatbot.app import database
+from Accescochatbot.app.database import Base, SessionLocal, get_db, get_read_db
+from Accescochatbot.app.models.products import Products
+
+
+@pytest.fixture
+def engines(tmp_path, monkeypatch):
+    """(primary, replica, statements per engine) with one product row each, named after its database."""
+    statements = {"primary": 0, "replica": 0}
+    built = {}
+    for name in ("primary", "replica"):
+        engine = create_engine(f"sqlite:///{tmp_path / name}.db")
+        Base.metadata.create_all(engine, tables=[Products.__table__])
+        with Session(engine) as db:
+            db.add(Products(id=1, name=name, price=1.0, available=True))
+            db.commit()
+
+        def count(*args, name=name):
+            statements[name] += 1
+
+        event.listen(engine, "before_cursor_execute", count)
+        built[name] = engine
+
+    monkeypatch.setattr(database, "engine", built["primary"])
+    monkeypatch.setattr(database, "replica_engine", built["replica"])
+    yield built["primary"], built["replica"], statements
+    for engine in built.values():
+        engine.dispose()
+
+
+def product_name(db) -> str:
+    return db.execute(select(Products.name).where(Products.id == 1)).scalar_one()
+
+
+def test_plain_reads_go_to_the_replica(engines):
+    _, _, statements = engines
+    with SessionLocal(use_replica=True) as db:
+        assert product_name(db) == "replica"
+        assert db.query(Products).count() == 1
+    assert statements == {"primary": 0, "replica": 2}
+
+
+def test_session_get_goes_to_the_replica(engines):
+    _, _, statements = engines
+    with SessionLocal(use_replica=True) as db:
+        assert db.get(Products, 1).name == "replica"
+    assert statements["primary"] == 0
+
+
+def test_flush_pins_to_the_primary(engines):
+    with SessionLocal(use_replica=True) as db:
+        assert product_name(db) == "replica"
+        db.add(Products(id=2, name="new", price=2.0, available=True))
+        db.flush()
+        assert product_name(db) == "primary"
+        assert db.get(Products, 2).name == "new"  # Reads its own write
+
+
+def test_for_update_pins_to_the_primary(engines):
+    _, _, statements = engines
+    with SessionLocal(use_replica=True) as db:
+        assert db.execute(select(Products.name).with_for_update()).scalar_one() == "primary"
+        assert product_name(db) == "primary"
+    assert statements["replica"] == 0
+
+
+def test_raw_sql_pins_to_the_primary(engines):
+    _, _, statements = engines
+    with SessionLocal(use_replica=True) as db:
+        assert db.execute(text("SELECT name FROM products")).scalar_one() == "primary"
+        assert product_name(db) == "primary"
+    assert statements["replica"] == 0
+
+
+def test_get_db_never_touches_the_replica(engines):
+    _, _, statements = engines
+    dependency = get_db()
+    db = next(dependency)
+    assert product_name(db) == "primary"
+    assert db.get(Products, 1).name == "primary"
+    assert db.query(Products).count() == 1
+    dependency.close()
+    assert statements["replica"] == 0
+
+
+def test_get_read_db_reads_the_replica(engines):
+    dependency = get_read_db()
+    db = next(dependency)
+    assert product_name(db) == "replica"
+    dependency.close()
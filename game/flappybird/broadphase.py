@@ -0,0 +1,111 @@
+"""Sorted-by-x broad phase for collision tests against the bird.
+
+The bird never moves horizontally, so the only entities that can touch it are
+the ones overlapping its hitbox's x band. A SweepList keeps entities ordered
+by their left edge; span() finds that band with two binary searches, and only
+the entities inside it get a real rect test. Pipes and coins all scroll at the
+same speed, so spawn order already is x order and the list never needs
+re-sorting; resort() covers entities that move at their own speeds.
+
+'python broadphase.py' benchmarks a span() query against testing every entity.
+"""
+from bisect import bisect_left
+from collections import deque
+from operator import attrgetter
+
+_left = attrgetter("x")
+
+class SweepList:
+    """A deque of entities kept sorted by x, each at most max_width wide."""
+    __slots__ = ("items", "max_width")
+
+    def __init__(self, max_width):
+        self.items = deque()
+        self.max_width = max_width
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+    def __bool__(self):
+        return bool(self.items)
+
+    def append(self, entity):
+        """Adds an entity; O(1) when it spawns right of everything else (the usual case)."""
+        items = self.items
+        items.append(entity)
+        if len(items) > 1 and items[-2].x > entity.x:
+            self.resort()
+
+    def popleft(self):
+        return self.items.popleft()
+
+    def resort(self):
+        """Insertion sort: O(n) for the nearly sorted lists that per-tick motion produces."""
+        items = self.items
+        for i in range(1, len(items)):
+            entity = items[i]
+            j = i - 1
+            while j >= 0 and items[j].x > entity.x:
+                items[j + 1] = items[j]
+                j -= 1
+            items[j + 1] = entity
+
+    def span(self, left, right):
+        """(lo, hi) index range of the entities that can overlap the x band [left, right)."""
+        items = self.items
+        lo = bisect_left(items, left - self.max_width, key=_left)
+        hi = bisect_left(items, right, lo, key=_left)
+        return lo, hi
+
+# --- Benchmark ---
+
+def benchmark(counts, queries=20000):
+    """Times finding the entities near the bird with span() vs. scanning all of them."""
+    import random
+    import time
+
+    from flappy_sim import BIRD_X, BIRD_WIDTH, COIN_SIZE, SCREEN_WIDTH, colliderect
+
+    class Box:
+        __slots__ = ("x", "y", "w", "h")
+
+        def __init__(self, x, y, w, h):
+            self.x, self.y, self.w, self.h = x, y, w, h
+
+    rng = random.Random(0)
+    hx, hy, hw, hh = BIRD_X + 5, 300, BIRD_WIDTH - 10, 30
+    print(f"{'entities':>9} {'brute us/query':>15} {'sweep us/query':>15} {'speedup':>8}")
+    for count in counts:
+        boxes = sorted((Box(rng.uniform(-COIN_SIZE, SCREEN_WIDTH), rng.uniform(0, 570), COIN_SIZE, COIN_SIZE)
+                        for _ in range(count)), key=_left)
+        index = SweepList(COIN_SIZE)
+        for box in boxes:
+            index.append(box)
+
+        start = time.perf_counter()
+        for _ in range(queries):
+            brute = [b for b in boxes if colliderect(hx, hy, hw, hh, b.x, b.y, b.w, b.h)]
+        brute_us = (time.perf_counter() - start) / queries * 1e6
+
+        start = time.perf_counter()
+        for _ in range(queries):
+            lo, hi = index.span(hx, hx + hw)
+            swept = []
+            for i in range(lo, hi):
+                b = index[i]
+                if colliderect(hx, hy, hw, hh, b.x, b.y, b.w, b.h):
+                    swept.append(b)
+        sweep_us = (time.perf_counter() - start) / queries * 1e6
+
+        assert swept == brute
+        print(f"{count:>9} {brute_us:>15.2f} {sweep_us:>15.2f} {brute_us / sweep_us:>7.1f}x")
+
+if __name__ == "__main__":
+    import sys
+    benchmark([int(n) for n in sys.argv[1:]] or [10, 100, 300, 1000])
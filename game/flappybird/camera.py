@@ -0,0 +1,124 @@
+"""Threaded webcam capture for the face-cam mode.
+
+A producer thread reads the camera, mirrors, resizes and converts each frame
+to RGB into preallocated NumPy buffers. The UI thread only ever copies the
+newest finished frame into a persistent pygame surface with
+surfarray.blit_array; frames the UI didn't get to are simply overwritten
+(latest frame wins), so a slow camera never stalls drawing or input.
+
+FileSource stands in for a camera with a video or image file, so the face-cam
+screen can be exercised without hardware (FLAPPY_CAMERA=face.mp4).
+"""
+import os
+import threading
+import time
+
+import cv2
+import numpy as np
+import pygame
+
+class CameraSource:
+    """A real camera through cv2.VideoCapture."""
+    def __init__(self, index=0):
+        self.cap = cv2.VideoCapture(index)
+
+    def read(self):
+        ok, frame = self.cap.read()
+        return frame if ok else None
+
+    def release(self):
+        self.cap.release()
+
+class FileSource:
+    """Plays a video (looping) or repeats a still image at `fps`, like a camera would."""
+    def __init__(self, path, fps=30, loop=True):
+        self.interval = 1.0 / fps
+        self.loop = loop
+        self.next_time = time.perf_counter()
+        self.still = cv2.imread(path) if os.path.splitext(path)[1].lower() in (".png", ".jpg", ".jpeg", ".bmp") else None
+        self.cap = None if self.still is not None else cv2.VideoCapture(path)
+
+    def read(self):
+        # Pace like a camera: read() blocks until the next frame is due
+        delay = self.next_time - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        self.next_time = max(self.next_time + self.interval, time.perf_counter())
+
+        if self.still is not None:
+            return self.still
+        ok, frame = self.cap.read()
+        if not ok and self.loop:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ok, frame = self.cap.read()
+        return frame if ok else None
+
+    def release(self):
+        if self.cap is not None:
+            self.cap.release()
+
+def open_source(spec):
+    """A camera index (int or digit string) opens a camera; anything else is a file path."""
+    if isinstance(spec, int) or str(spec).isdigit():
+        return CameraSource(int(spec))
+    return FileSource(spec)
+
+class CaptureEngine:
+    """Producer thread + double-buffered RGB frames, consumed by blit_latest()."""
+    def __init__(self, source, size, mirror=True):
+        self.source = source
+        self.size = size
+        self.mirror = mirror
+        w, h = size
+        # Producer-only scratch buffers, then a back/front pair of finished RGB frames
+        self._scaled = np.empty((h, w, 3), dtype=np.uint8)
+        self._flipped = np.empty((h, w, 3), dtype=np.uint8)
+        self._back = np.empty((h, w, 3), dtype=np.uint8)
+        self._front = np.empty((h, w, 3), dtype=np.uint8)
+        self._lock = threading.Lock()
+        self._seq = 0 # Finished frames so far
+        self._shown = 0 # Last frame copied by blit_latest
+        self._running = False
+        self.failed = False # The source stopped producing frames
+        self._thread = threading.Thread(target=self._run, name="camera-capture", daemon=True)
+
+    def start(self):
+        self._running = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._running = False
+        self._thread.join(timeout=2)
+        self.source.release()
+
+    def _run(self):
+        while self._running:
+            frame = self.source.read()
+            if frame is None:
+                self.failed = True
+                return
+            cv2.resize(frame, self.size, dst=self._scaled)
+            src = self._scaled
+            if self.mirror:
+                cv2.flip(src, 1, dst=self._flipped)
+                src = self._flipped
+            cv2.cvtColor(src, cv2.COLOR_BGR2RGB, dst=self._back)
+            with self._lock:
+                self._back, self._front = self._front, self._back
+                self._seq += 1
+
+    def blit_latest(self, surface):
+        """Copies the newest frame into `surface` if there is one it hasn't shown. True if it did."""
+        with self._lock:
+            if self._seq == self._shown:
+                return False
+            self._shown = self._seq
+            # surfarray is (x, y); the transposed view avoids a copy
+            pygame.surfarray.blit_array(surface, self._front.transpose(1, 0, 2))
+        return True
+
+    def snapshot(self):
+        """A copy of the newest RGB frame (h, w, 3), or None before the first frame."""
+        with self._lock:
+            return self._front.copy() if self._seq else None
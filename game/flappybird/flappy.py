@@ -1,15 +1,21 @@
+import time
+START_TIME = time.perf_counter() # Cold-start reference point, before any heavy import
+
 import pygame
-import random
 import sys
-import cv2
-import numpy as np
 import os
-import json 
+import gc
+import functools
+import threading
+
+from save_store import SaveStore
+from skin_assets import CATALOG_FILE, ImageCache, SkinAssets, load_catalog
+from flappy_sim import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, COIN_RADIUS, BIRD_WIDTH, BIRD_HEIGHT, World, FixedTimestep, lerp
+from render_backend import create_display
+import replay
+from profiler import FrameProfiler, NULL_PROFILER
 
 # --- Constants & Swiggy-like Theme ---
-SCREEN_WIDTH = 400
-SCREEN_HEIGHT = 600
-FPS = 60
 
 # Brand Colors (Swiggy Style)
 # Using Tuples (R, G, B) to prevent "Invalid Color" errors
@@ -28,73 +34,104 @@ PIPE_BODY_COLOR = (60, 60, 70)
 PIPE_HIGHLIGHT = (80, 80, 90)
 
 # --- Bird Definitions & Assets ---
-BIRD_IMAGES = {} # Will store loaded pygame images
-
-BIRD_SHOP_DATA = [
-    {"id": "classic", "name": "Goldfinch", "price": 0, "color": (255, 215, 0), "image": "bird_classic.png"},
-    {"id": "eagle",   "name": "Bald Eagle","price": 15, "color": (139, 69, 19), "image": "bird_eagle.jpg"},
-    {"id": "dragon",  "name": "Wyvern",    "price": 30, "color": (34, 139, 34), "image": "bird_dragon.png"},
-    {"id": "phoenix", "name": "Phoenix",   "price": 50, "color": (255, 69, 0), "image": "bird_phoenix.png"},
-    {"id": "owl",     "name": "Snowy Owl", "price": 75, "color": (240, 240, 240), "image": "bird_owl.png"},
-    {"id": "penguin", "name": "Penguin",   "price": 100,"color": (30, 30, 30), "image": "bird_penguin.png"},
-]
-
-# Game Physics
-GRAVITY = 0.25
-BIRD_JUMP = -6
-PIPE_SPEED = 3
-PIPE_FREQUENCY = 1500
+# The skin catalog is data (skins.json); images load lazily through SKIN_ASSETS.
+BIRD_SHOP_DATA = load_catalog(CATALOG_FILE)
+SKIN_ASSETS = None # SkinAssets, set up by load_bird_images()
+
+# Game Physics lives in flappy_sim.py; the simulation runs at a fixed tick.
+RENDER_FPS = FPS    # Render cap, independent of the simulation rate (0 = uncapped)
+MENU_FPS = 30       # Frame cap for menus while something animates (video background)
+IDLE_WAIT_MS = 1000 # Longest a static menu sleeps in event.wait before re-checking
+PIPE_CAP_HEIGHT = 25
+PIPE_CAP_OVERHANG = 6
+
+# --- Display ---
+# The game scene draws through a render_backend display: software blits by
+# default, SDL2 textures with --gpu (falling back to software if unavailable).
+RENDERER = "texture" if "--gpu" in sys.argv else "software"
+DISPLAY = None # Set up in main(); menus draw on DISPLAY.screen
+
+# --- Profiling ---
+# F3 in game (or --profile) switches the frame profiler on and off. While off,
+# PROFILER is the no-op NULL_PROFILER; the recording is dumped at exit.
+PROFILER = NULL_PROFILER
+PROFILE_LOG = None # The FrameProfiler used this session, if any
+PROFILE_PREFIX = "profile" # Dumped to profile.csv and profile.trace.json
+
+def toggle_profiler():
+    global PROFILER, PROFILE_LOG
+    if PROFILER.enabled:
+        PROFILER = NULL_PROFILER
+        return
+    if PROFILE_LOG is None:
+        PROFILE_LOG = FrameProfiler()
+    PROFILE_LOG.resume()
+    PROFILER = PROFILE_LOG
 
 # --- Data Management ---
 SAVE_FILE = "accesco_save.json"
+SAVE_STORE = None # SaveStore set up by load_data(); writes happen on its background thread
 
 def load_data():
-    if os.path.exists(SAVE_FILE):
-        try:
-            with open(SAVE_FILE, 'r') as f:
-                return json.load(f)
-        except:
-            pass
-    return {"coins": 0, "unlocked": [0], "current": 0}
+    global SAVE_STORE
+    SAVE_STORE = SaveStore(SAVE_FILE)
+    return SAVE_STORE.data
 
 def save_data(data):
+    """Queues the save for the background writer; never blocks on disk."""
+    SAVE_STORE.save(data)
+
+def keep_replay(world):
+    """Queues a game's replay for the save writer so the coins it earned can be verified later (replay.py verify)."""
+    SAVE_STORE.write_later(write_replay, replay.record(world))
+
+def write_replay(rec):
     try:
-        with open(SAVE_FILE, 'w') as f:
-            json.dump(data, f)
-    except:
-        print("Could not save game data.")
+        replay.save(rec)
+    except OSError as e:
+        print(f"Could not save replay: {e}")
 
 # --- Helper Functions ---
+def import_cv():
+    """OpenCV and NumPy are slow to import; only the face cam and video background need them."""
+    import cv2
+    import numpy as np
+    return cv2, np
+
 def load_sound(name):
     if os.path.exists(name):
         return pygame.mixer.Sound(name)
     return None
 
 def load_coin_image(image_path, size):
-    if not os.path.exists(image_path):
-        return None
-    try:
-        img = pygame.image.load(image_path).convert_alpha()
-        img = pygame.transform.smoothscale(img, (size, size))
-        return img
-    except Exception as e:
-        return None
+    return ImageCache().load_scaled(image_path, (size, size))
 
 def load_bird_images():
-    """Loads all bird images from disk."""
-    for bird_data in BIRD_SHOP_DATA:
-        bird_id = bird_data["id"]
-        image_path = bird_data["image"]
-        if os.path.exists(image_path):
-            try:
-                img = pygame.image.load(image_path).convert_alpha()
-                # Scale images to a standard size
-                BIRD_IMAGES[bird_id] = pygame.transform.smoothscale(img, (50, 40))
-            except Exception as e:
-                print(f"Error loading image for {bird_id}: {e}")
-                BIRD_IMAGES[bird_id] = None # Fallback
-        else:
-            BIRD_IMAGES[bird_id] = None
+    """Sets up the skin asset manager. Images are decoded on first use, not here."""
+    global SKIN_ASSETS
+    SKIN_ASSETS = SkinAssets(BIRD_SHOP_DATA)
+
+@functools.lru_cache(maxsize=None)
+def get_font(name, size, bold=False):
+    """SysFont lookups are slow; share one Font per (name, size, bold)."""
+    return pygame.font.SysFont(name, size, bold=bold)
+
+def wait_for_events(clock, animating):
+    """Menu pacing: tick at MENU_FPS while animating, otherwise sleep until input arrives."""
+    if animating:
+        clock.tick(MENU_FPS)
+        return pygame.event.get()
+    event = pygame.event.wait(IDLE_WAIT_MS)
+    events = [] if event.type == pygame.NOEVENT else [event]
+    events.extend(pygame.event.get())
+    return events
+
+def update_hover(buttons, pos):
+    """Re-checks hover on every button; True if any of them changed."""
+    changed = False
+    for btn in buttons:
+        changed |= btn.check_hover(pos)
+    return changed
 
 def draw_rounded_rect(surface, color, rect, radius=10):
     """Helper to draw rounded rectangles."""
@@ -108,47 +145,71 @@ class Button:
         self.action = action_code
         self.color = color
         self.text_color = text_color
-        self.font = pygame.font.SysFont('Verdana', font_size, bold=True)
+        self.font = get_font('Verdana', font_size, bold=True)
         self.is_hovered = False
-
-    def draw(self, screen):
+        self._text_cache = (None, None, None) # (text, color, rendered surface)
+
+    def render_text(self):
+        """The label surface, re-rendered only when text or color changes."""
+        text, color, surf = self._text_cache
+        if text != self.text or color != self.text_color:
+            surf = self.font.render(self.text, True, self.text_color)
+            self._text_cache = (self.text, self.text_color, surf)
+        return surf
+
+    def draw(self, screen, offset=(0, 0)):
+        rect = self.rect.move(offset)
         # Hover effect: darken slightly
         draw_color = list(self.color)
         if self.is_hovered:
             draw_color = [max(0, c - 30) for c in draw_color]
         
         # Shadow
-        shadow_rect = self.rect.move(0, 2)
+        shadow_rect = rect.move(0, 2)
         draw_rounded_rect(screen, (200, 200, 200), shadow_rect, radius=8)
         
         # Body
-        draw_rounded_rect(screen, draw_color, self.rect, radius=8)
+        draw_rounded_rect(screen, draw_color, rect, radius=8)
         
         # Text
-        text_surf = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surf.get_rect(center=self.rect.center)
+        text_surf = self.render_text()
+        text_rect = text_surf.get_rect(center=rect.center)
         screen.blit(text_surf, text_rect)
 
     def check_hover(self, pos):
-        self.is_hovered = self.rect.collidepoint(pos)
+        """Updates the hover state; returns True if it changed (the button needs a redraw)."""
+        was_hovered = self.is_hovered
+        self.is_hovered = bool(self.rect.collidepoint(pos))
+        return self.is_hovered != was_hovered
 
     def is_clicked(self, pos):
         return self.rect.collidepoint(pos)
 
 class ProductCard:
-    """A Swiggy-style item card for the shop."""
+    """A Swiggy-style item card for the shop.
+
+    The card is baked into its own surface and re-baked only when its
+    unlocked/equipped/hover state changes; every other frame is one blit.
+    """
     def __init__(self, x, y, width, height, bird_data, is_unlocked, is_equipped):
         self.rect = pygame.Rect(x, y, width, height)
         self.data = bird_data
+        self.font_name = get_font('Verdana', 14, bold=True)
+        self.font_price = get_font('Verdana', 12)
+        self.surface = None
+        self.baked_state = None
+        self.set_state(is_unlocked, is_equipped)
+
+    def set_state(self, is_unlocked, is_equipped):
+        if self.surface and (is_unlocked, is_equipped) == (self.is_unlocked, self.is_equipped):
+            return # Unchanged: keep the button (and its hover state) and the baked surface
         self.is_unlocked = is_unlocked
         self.is_equipped = is_equipped
-        self.font_name = pygame.font.SysFont('Verdana', 14, bold=True)
-        self.font_price = pygame.font.SysFont('Verdana', 12)
         
         # Action Button (Buy or Equip)
         btn_w, btn_h = 80, 30
-        btn_x = x + width - btn_w - 10
-        btn_y = y + (height - btn_h) // 2
+        btn_x = self.rect.x + self.rect.width - btn_w - 10
+        btn_y = self.rect.y + (self.rect.height - btn_h) // 2
         
         if self.is_equipped:
             self.btn = Button(btn_x, btn_y, btn_w, btn_h, "EQUIPPED", "NONE", color=THEME_BG, text_color=TEXT_GRAY, font_size=10)
@@ -157,157 +218,151 @@ class ProductCard:
         else:
             self.btn = Button(btn_x, btn_y, btn_w, btn_h, "ADD", "BUY", color=WHITE, text_color=THEME_GREEN, font_size=14)
 
-    def draw(self, screen):
+    def bake(self):
+        surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        local = surface.get_rect()
+        offset = (-self.rect.x, -self.rect.y)
+
         # Card Background
-        draw_rounded_rect(screen, THEME_CARD_BG, self.rect, radius=12)
+        draw_rounded_rect(surface, THEME_CARD_BG, local, radius=12)
         
         # Preview Icon
-        cx, cy = self.rect.x + 40, self.rect.centery
-        bird_id = self.data['id']
-        bird_img = BIRD_IMAGES.get(bird_id)
-        
-        if bird_img:
-            # Scale down for preview
-            preview_img = pygame.transform.smoothscale(bird_img, (40, 32))
-            preview_rect = preview_img.get_rect(center=(cx, cy))
-            screen.blit(preview_img, preview_rect)
+        cx, cy = 40, local.centery
+        thumb = SKIN_ASSETS.thumb(self.data['id'])
+        if thumb:
+            surface.blit(thumb, thumb.get_rect(center=(cx, cy)))
         else:
             # Fallback preview
-            pygame.draw.circle(screen, self.data['color'], (cx, cy), 20)
+            pygame.draw.circle(surface, self.data['color'], (cx, cy), 20)
         
         # Text Info
-        text_x = self.rect.x + 80
+        text_x = 80
         name_surf = self.font_name.render(self.data['name'], True, TEXT_DARK)
-        screen.blit(name_surf, (text_x, self.rect.y + 15))
+        surface.blit(name_surf, (text_x, 15))
         
         if not self.is_unlocked:
             price_surf = self.font_price.render(f"₹{self.data['price']} Coins", True, TEXT_GRAY)
-            screen.blit(price_surf, (text_x, self.rect.y + 35))
+            surface.blit(price_surf, (text_x, 35))
         else:
             status = "Owned"
             status_surf = self.font_price.render(status, True, TEXT_GRAY)
-            screen.blit(status_surf, (text_x, self.rect.y + 35))
+            surface.blit(status_surf, (text_x, 35))
 
         # Button Border if "ADD" style
         if self.btn.text == "ADD":
-            pygame.draw.rect(screen, THEME_GREEN, self.btn.rect, 1, border_radius=8)
+            pygame.draw.rect(surface, THEME_GREEN, self.btn.rect.move(offset), 1, border_radius=8)
             
-        self.btn.draw(screen)
-
-# --- Classes ---
-
-class Coin:
-    def __init__(self, x, y, image=None):
-        self.x = x
-        self.y = y
-        self.radius = 15
-        self.diameter = self.radius * 2
-        self.rect = pygame.Rect(self.x - self.radius, self.y - self.radius, self.diameter, self.diameter)
-        self.collected = False
-        self.animation_offset = 0
-        self.image = image
-
-    def move(self):
-        self.x -= PIPE_SPEED
-        self.rect.x = int(self.x - self.radius)
-        self.animation_offset += 0.1
-        self.rect.y = int(self.y - self.radius + np.sin(self.animation_offset) * 5)
-
-    def draw(self, screen):
-        if not self.collected:
-            if self.image:
-                screen.blit(self.image, self.rect)
-            else:
-                pygame.draw.circle(screen, (218, 165, 32), self.rect.center, self.radius)
-                pygame.draw.circle(screen, GOLD, self.rect.center, self.radius - 2)
-                pygame.draw.circle(screen, WHITE, (self.rect.centerx - 5, self.rect.centery - 5), 3)
-                pygame.draw.circle(screen, THEME_BRAND, self.rect.center, self.radius, 1)
-
-class Bird:
+        self.btn.draw(surface, offset)
+        return surface
+
+    def draw(self, screen, scroll=0):
+        state = (self.is_unlocked, self.is_equipped, self.btn.is_hovered)
+        if state != self.baked_state:
+            self.surface = self.bake()
+            self.baked_state = state
+        screen.blit(self.surface, self.rect.move(0, -scroll))
+
+# --- Game Rendering ---
+# The game logic lives in flappy_sim.World; these draw its state onto a
+# render_backend display (or any Surface). Everything is pre-rendered into
+# sprites once and then only blitted, so the texture backend uploads each
+# sprite a single time.
+
+class BirdSprite:
+    """How the player's bird looks: a captured face, a shop skin, or a plain color block."""
     def __init__(self, face_image=None, bird_data=None):
-        self.x = 50
-        self.y = SCREEN_HEIGHT // 2
-        self.velocity = 0
-        self.width = 50 
-        self.height = 40
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        
         self.face_image = face_image 
         self.bird_data = bird_data if bird_data else BIRD_SHOP_DATA[0]
         self.type = self.bird_data['id']
-        self.image = BIRD_IMAGES.get(self.type)
+        self.image = SKIN_ASSETS.sprite(self.type)
+        self.surface, self.offset = self.render()
 
-    def jump(self):
-        self.velocity = BIRD_JUMP
-
-    def move(self):
-        self.velocity += GRAVITY
-        self.y += self.velocity
-        self.rect.y = int(self.y)
-
-    def draw(self, screen):
+    def render(self):
+        """The bird as one image, and where it sits relative to the bird's position."""
         if self.face_image:
-            # Face Mode
-            screen.blit(self.face_image, self.rect)
-            pygame.draw.circle(screen, WHITE, self.rect.center, self.width//2, 2)
-        elif self.image:
+            # Face Mode: the ring is wider than the bird is tall, so pad above and below it
+            pad = BIRD_WIDTH // 2 - BIRD_HEIGHT // 2
+            surf = pygame.Surface((BIRD_WIDTH, BIRD_HEIGHT + 2 * pad), pygame.SRCALPHA)
+            surf.blit(self.face_image, (0, pad))
+            pygame.draw.circle(surf, WHITE, (BIRD_WIDTH // 2, pad + BIRD_HEIGHT // 2), BIRD_WIDTH // 2, 2)
+            return surf, (0, -pad)
+        if self.image:
             # Image Mode
-            screen.blit(self.image, self.rect)
-        else:
-            # Fallback if image failed to load (simple rect)
-            pygame.draw.rect(screen, self.bird_data['color'], self.rect)
-
-class Pipe:
-    def __init__(self, coin_image=None):
-        self.gap = 170 
-        self.width = 70
-        self.cap_height = 25 
-        self.cap_overhang = 6 
-        self.x = SCREEN_WIDTH
-        self.height = random.randint(100, SCREEN_HEIGHT - self.gap - 100)
-        
-        self.top_rect = pygame.Rect(self.x, 0, self.width, self.height)
-        self.bottom_rect = pygame.Rect(self.x, self.height + self.gap, self.width, SCREEN_HEIGHT - (self.height + self.gap))
-        
-        self.passed = False
-        self.has_coin = random.choice([True, False])
-        self.coin = None
-        if self.has_coin:
-            coin_y = self.height + (self.gap // 2)
-            self.coin = Coin(self.x + self.width//2, coin_y, coin_image)
-
-    def move(self):
-        self.x -= PIPE_SPEED
-        self.top_rect.x = self.x
-        self.bottom_rect.x = self.x
-        if self.coin:
-            self.coin.move()
-
-    def draw_pillar(self, screen, rect, is_top_pipe):
-        pygame.draw.rect(screen, PIPE_BODY_COLOR, rect)
-        highlight_rect = pygame.Rect(rect.x + 5, rect.y, 10, rect.height)
-        pygame.draw.rect(screen, PIPE_HIGHLIGHT, highlight_rect)
-        pygame.draw.rect(screen, THEME_BRAND, rect, 2)
-        
-        cap_width = self.width + (self.cap_overhang * 2)
-        cap_x = rect.x - self.cap_overhang
-        cap_y = rect.bottom - self.cap_height if is_top_pipe else rect.top
-        cap_rect = pygame.Rect(cap_x, cap_y, cap_width, self.cap_height)
-        
-        pygame.draw.rect(screen, THEME_BRAND, cap_rect)
-        pygame.draw.line(screen, (255, 160, 80), (cap_rect.left, cap_rect.top), (cap_rect.right, cap_rect.top), 2)
-        pygame.draw.rect(screen, BLACK, cap_rect, 1)
-
-    def draw(self, screen):
-        self.draw_pillar(screen, self.top_rect, is_top_pipe=True)
-        self.draw_pillar(screen, self.bottom_rect, is_top_pipe=False)
-        if self.coin and not self.coin.collected:
-            self.coin.draw(screen)
+            return self.image, (0, 0)
+        # Fallback if image failed to load (simple rect)
+        surf = pygame.Surface((BIRD_WIDTH, BIRD_HEIGHT))
+        surf.fill(self.bird_data['color'])
+        return surf, (0, 0)
+
+    def draw(self, screen, bird, alpha=1.0):
+        y = int(lerp(bird.prev_y, bird.y, alpha))
+        screen.blit(self.surface, (bird.x + self.offset[0], y + self.offset[1]))
+
+@functools.lru_cache(maxsize=4)
+def coin_sprite(image=None):
+    """The coin image, or the drawn coin if it didn't load."""
+    if image:
+        return image
+    size = COIN_RADIUS * 2
+    surf = pygame.Surface((size, size), pygame.SRCALPHA)
+    center = (COIN_RADIUS, COIN_RADIUS)
+    pygame.draw.circle(surf, (218, 165, 32), center, COIN_RADIUS)
+    pygame.draw.circle(surf, GOLD, center, COIN_RADIUS - 2)
+    pygame.draw.circle(surf, WHITE, (COIN_RADIUS - 5, COIN_RADIUS - 5), 3)
+    pygame.draw.circle(surf, THEME_BRAND, center, COIN_RADIUS, 1)
+    return surf
+
+def draw_coin(screen, coin, image=None, alpha=1.0):
+    if not coin.collected:
+        x = int(lerp(coin.prev_x, coin.rect_x, alpha))
+        y = int(lerp(coin.prev_y, coin.rect_y, alpha))
+        screen.blit(coin_sprite(image), (x, y))
+
+def draw_pillar(screen, rect, is_top_pipe):
+    pygame.draw.rect(screen, PIPE_BODY_COLOR, rect)
+    highlight_rect = pygame.Rect(rect.x + 5, rect.y, 10, rect.height)
+    pygame.draw.rect(screen, PIPE_HIGHLIGHT, highlight_rect)
+    pygame.draw.rect(screen, THEME_BRAND, rect, 2)
+    
+    cap_width = rect.width + (PIPE_CAP_OVERHANG * 2)
+    cap_x = rect.x - PIPE_CAP_OVERHANG
+    cap_y = rect.bottom - PIPE_CAP_HEIGHT if is_top_pipe else rect.top
+    cap_rect = pygame.Rect(cap_x, cap_y, cap_width, PIPE_CAP_HEIGHT)
+    
+    pygame.draw.rect(screen, THEME_BRAND, cap_rect)
+    pygame.draw.line(screen, (255, 160, 80), (cap_rect.left, cap_rect.top), (cap_rect.right, cap_rect.top), 2)
+    pygame.draw.rect(screen, BLACK, cap_rect, 1)
+
+@functools.lru_cache(maxsize=64)
+def pillar_sprite(width, height, is_top_pipe):
+    """A pillar drawn once per size; its cap overhangs PIPE_CAP_OVERHANG past the left edge."""
+    # One extra column: the cap's highlight line includes its right end point
+    surf = pygame.Surface((width + 2 * PIPE_CAP_OVERHANG + 1, height), pygame.SRCALPHA)
+    draw_pillar(surf, pygame.Rect(PIPE_CAP_OVERHANG, 0, width, height), is_top_pipe)
+    return surf
+
+def draw_pipe(screen, pipe, coin_image=None, alpha=1.0):
+    x = int(lerp(pipe.prev_x, pipe.x, alpha)) - PIPE_CAP_OVERHANG
+    screen.blit(pillar_sprite(pipe.width, pipe.height, True), (x, 0))
+    screen.blit(pillar_sprite(pipe.width, SCREEN_HEIGHT - pipe.bottom_y, False), (x, pipe.bottom_y))
+    if pipe.coin:
+        draw_coin(screen, pipe.coin, coin_image, alpha)
+
+def draw_world(screen, world, bird_sprite, coin_image=None, alpha=1.0):
+    """Draws the world interpolated `alpha` of the way between its last two ticks."""
+    bird_sprite.draw(screen, world.bird, alpha)
+    PROFILER.lap("bird")
+    for pipe in world.pipes:
+        draw_pipe(screen, pipe, coin_image, alpha)
+    PROFILER.lap("pipes")
 
 # --- Video & Background ---
 BACKGROUND_IMAGE = None
+VIDEO_FRAME = None # Every video frame is copied into this one surface (streamed by the display)
 
 def get_video_frame(cap):
+    global VIDEO_FRAME
+    cv2, np = import_cv()
     ret, frame = cap.read()
     if not ret:
         cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
@@ -316,8 +371,10 @@ def get_video_frame(cap):
 
     frame = cv2.resize(frame, (SCREEN_WIDTH, SCREEN_HEIGHT))
     frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    frame = np.transpose(frame, (1, 0, 2))
-    return pygame.surfarray.make_surface(frame)
+    if VIDEO_FRAME is None:
+        VIDEO_FRAME = DISPLAY.stream(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)))
+    pygame.surfarray.blit_array(VIDEO_FRAME, np.transpose(frame, (1, 0, 2)))
+    return VIDEO_FRAME
 
 def load_background_image():
     global BACKGROUND_IMAGE
@@ -328,28 +385,39 @@ def load_background_image():
         except Exception as e:
             print(f"Error loading background image: {e}")
 
-def draw_header(screen):
-    """Draws the clean white Swiggy-like header."""
+@functools.lru_cache(maxsize=None)
+def header_sprite():
+    """The clean white Swiggy-like header, drawn once."""
+    surf = pygame.Surface((SCREEN_WIDTH, 62), pygame.SRCALPHA)
     header_rect = pygame.Rect(0, 0, SCREEN_WIDTH, 60)
-    pygame.draw.rect(screen, WHITE, header_rect)
+    pygame.draw.rect(surf, WHITE, header_rect)
     # Bottom Shadow
-    pygame.draw.line(screen, (220, 220, 220), (0, 60), (SCREEN_WIDTH, 60), 2)
+    pygame.draw.line(surf, (220, 220, 220), (0, 60), (SCREEN_WIDTH, 60), 2)
     
-    font_brand = pygame.font.SysFont('Verdana', 22, bold=True)
+    font_brand = get_font('Verdana', 22, bold=True)
     brand_text = font_brand.render("ACCESCO", True, THEME_BRAND)
     
-    font_sub = pygame.font.SysFont('Arial', 12)
+    font_sub = get_font('Arial', 12)
     sub_text = font_sub.render("FOOD | FASHION", True, TEXT_GRAY)
     
-    screen.blit(brand_text, (20, 10))
-    screen.blit(sub_text, (20, 38))
+    surf.blit(brand_text, (20, 10))
+    surf.blit(sub_text, (20, 38))
+    return surf
+
+def draw_header(screen):
+    screen.blit(header_sprite(), (0, 0))
+
+@functools.lru_cache(maxsize=None)
+def video_tint():
+    """Light wash over the video background so the UI stays readable."""
+    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+    overlay.fill((255, 255, 255, 30)) 
+    return overlay
 
 def draw_background(screen, video_surface=None):
     if video_surface:
         screen.blit(video_surface, (0, 0))
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((255, 255, 255, 30)) 
-        screen.blit(overlay, (0,0))
+        screen.blit(video_tint(), (0,0))
     elif BACKGROUND_IMAGE:
         screen.blit(BACKGROUND_IMAGE, (0, 0))
     else:
@@ -358,8 +426,10 @@ def draw_background(screen, video_surface=None):
     draw_header(screen)
 
 def capture_face(screen):
-    cap = cv2.VideoCapture(0)
-    font = pygame.font.SysFont('Verdana', 16)
+    cv2, np = import_cv()
+    from camera import CaptureEngine, open_source
+    engine = CaptureEngine(open_source(CAMERA_SOURCE), (SCREEN_WIDTH, SCREEN_HEIGHT)).start()
+    font = get_font('Verdana', 16)
     clock = pygame.time.Clock()
     box_size = 200
     box_x = (SCREEN_WIDTH - box_size) // 2
@@ -368,16 +438,11 @@ def capture_face(screen):
     radius = box_size // 2
     
     btn_capture = Button(SCREEN_WIDTH//2 - 60, SCREEN_HEIGHT - 100, 120, 50, "CAPTURE", "CAPTURE")
+    # Camera frames are copied into this one surface; black until the first frame arrives
+    cam_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
 
-    while True:
-        ret, frame = cap.read()
-        if not ret: break
-        
-        frame = cv2.flip(frame, 1) 
-        frame = cv2.resize(frame, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        frame_display = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        frame_transposed = np.transpose(frame_display, (1, 0, 2))
-        cam_surface = pygame.surfarray.make_surface(frame_transposed)
+    while not engine.failed:
+        engine.blit_latest(cam_surface)
         
         screen.blit(cam_surface, (0,0))
         pygame.draw.circle(screen, WHITE, center_point, radius, 3)
@@ -393,37 +458,39 @@ def capture_face(screen):
         btn_capture.check_hover(mouse_pos)
         btn_capture.draw(screen)
         
-        pygame.display.update()
+        DISPLAY.show_screen()
         clock.tick(30)
         
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                cap.release(); pygame.quit(); sys.exit()
+                engine.stop(); pygame.quit(); sys.exit()
             
             clicked = False
             if event.type == pygame.MOUSEBUTTONDOWN and btn_capture.is_clicked(event.pos): clicked = True
             if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE: clicked = True
                 
-            if clicked:
+            frame = engine.snapshot() if clicked else None
+            if frame is not None:
+                # The ROI and circular mask are only cut here, once, from the RGB frame
                 face_roi = frame[box_y:box_y+box_size, box_x:box_x+box_size]
-                face_rgba = cv2.cvtColor(face_roi, cv2.COLOR_BGR2RGBA)
+                face_rgba = cv2.cvtColor(face_roi, cv2.COLOR_RGB2RGBA)
                 mask = np.zeros((box_size, box_size), dtype=np.uint8)
                 cv2.circle(mask, (box_size//2, box_size//2), box_size//2, 255, -1)
                 face_rgba[:, :, 3] = mask
                 face_rgba = np.ascontiguousarray(face_rgba)
                 final_bird_surface = pygame.image.frombuffer(face_rgba, (box_size, box_size), 'RGBA')
                 final_bird_surface = pygame.transform.smoothscale(final_bird_surface, (40, 40))
-                cap.release()
+                engine.stop()
                 return final_bird_surface
-    cap.release()
+    engine.stop()
     return None
 
 def shop_menu(screen, game_data):
-    """Handles the Shop UI with Swiggy-style vertical list."""
+    """Handles the Shop UI with a Swiggy-style scrolling vertical list."""
     clock = pygame.time.Clock()
-    font_coins = pygame.font.SysFont('Verdana', 14, bold=True)
+    font_coins = get_font('Verdana', 14, bold=True)
     
-    # Create Cards
+    # Create Cards (positions are in list coordinates; the list scrolls under list_rect)
     cards = []
     card_height = 70
     start_y = 110
@@ -433,73 +500,102 @@ def shop_menu(screen, game_data):
         cards.append(ProductCard(20, start_y + (i * (card_height + 15)), SCREEN_WIDTH - 40, card_height, bird_info, is_unlocked, is_equipped))
     
     btn_back = Button(20, SCREEN_HEIGHT - 60, SCREEN_WIDTH - 40, 45, "BACK TO MENU", "BACK")
+    list_rect = pygame.Rect(0, 100, SCREEN_WIDTH, SCREEN_HEIGHT - 70 - 100)
+    content_bottom = cards[-1].rect.bottom + 10 if cards else 0
+    max_scroll = max(0, content_bottom - list_rect.bottom)
+    scroll = 0
 
-    while True:
-        screen.fill(THEME_BG)
-        draw_header(screen)
-        
-        # Sub-header
-        sub_head_rect = pygame.Rect(0, 60, SCREEN_WIDTH, 40)
-        pygame.draw.rect(screen, WHITE, sub_head_rect)
-        coin_text = font_coins.render(f"WALLET: ₹{game_data['coins']}", True, THEME_BRAND)
-        screen.blit(coin_text, (20, 70))
-        
-        shop_title = font_coins.render("BIRD SHOP", True, TEXT_DARK)
-        screen.blit(shop_title, (SCREEN_WIDTH - 120, 70))
+    def list_pos(pos):
+        """Screen position -> list position; off-list positions map nowhere."""
+        return (pos[0], pos[1] + scroll) if list_rect.collidepoint(pos) else (-1, -1)
 
-        # Draw Cards
-        mouse_pos = pygame.mouse.get_pos()
-        for card in cards:
-            card.btn.check_hover(mouse_pos)
-            card.draw(screen)
+    def update_all_hover(pos):
+        changed = update_hover([card.btn for card in cards], list_pos(pos))
+        return btn_back.check_hover(pos) | changed
+
+    update_all_hover(pygame.mouse.get_pos())
+    needs_redraw = True
+
+    while True:
+        if needs_redraw:
+            needs_redraw = False
+            screen.fill(THEME_BG)
+            draw_header(screen)
             
-        btn_back.check_hover(mouse_pos)
-        btn_back.draw(screen)
-        
-        pygame.display.update()
+            # Sub-header
+            sub_head_rect = pygame.Rect(0, 60, SCREEN_WIDTH, 40)
+            pygame.draw.rect(screen, WHITE, sub_head_rect)
+            coin_text = font_coins.render(f"WALLET: ₹{game_data['coins']}", True, THEME_BRAND)
+            screen.blit(coin_text, (20, 70))
+            
+            shop_title = font_coins.render("BIRD SHOP", True, TEXT_DARK)
+            screen.blit(shop_title, (SCREEN_WIDTH - 120, 70))
+
+            # Draw only the cards scrolled into view
+            screen.set_clip(list_rect)
+            first = max(0, (list_rect.top + scroll - start_y) // (card_height + 15))
+            for card in cards[first:]:
+                if card.rect.top - scroll >= list_rect.bottom:
+                    break
+                card.draw(screen, scroll)
+            screen.set_clip(None)
+                
+            btn_back.draw(screen)
+            
+            DISPLAY.show_screen()
         
-        for event in pygame.event.get():
+        # Nothing in the shop animates, so sleep until there is input
+        for event in wait_for_events(clock, animating=False):
             if event.type == pygame.QUIT:
                 pygame.quit(); sys.exit()
+
+            if event.type == pygame.MOUSEMOTION:
+                needs_redraw |= update_all_hover(event.pos)
+            elif event.type == pygame.MOUSEWHEEL:
+                new_scroll = min(max_scroll, max(0, scroll - event.y * 40))
+                if new_scroll != scroll:
+                    scroll = new_scroll
+                    update_all_hover(pygame.mouse.get_pos())
+                    needs_redraw = True
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWSHOWN):
+                needs_redraw = True
                 
-            if event.type == pygame.MOUSEBUTTONDOWN:
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 if btn_back.is_clicked(event.pos):
                     return game_data
                 
+                click_pos = list_pos(event.pos)
                 for i, card in enumerate(cards):
-                    if card.btn.is_clicked(event.pos):
+                    if card.btn.is_clicked(click_pos):
                         bird_info = card.data
                         if card.is_unlocked:
                             # Equip
                             game_data['current'] = i
                             save_data(game_data)
-                            # Update UI
-                            for c in cards: c.is_equipped = False
-                            card.is_equipped = True
-                            card.btn.text = "EQUIPPED"
-                            card.btn.color = THEME_BG
-                            card.btn.text_color = TEXT_GRAY
                         elif game_data['coins'] >= bird_info['price']:
                             # Buy
                             game_data['coins'] -= bird_info['price']
                             game_data['unlocked'].append(i)
                             game_data['current'] = i
                             save_data(game_data)
-                            # Update UI logic to unlocked state
-                            card.is_unlocked = True
-                            card.is_equipped = True
-                            # Reset others
-                            for c in cards: 
-                                if c != card: c.is_equipped = False
-                            card.btn.text = "EQUIPPED"
-                            card.btn.color = THEME_BG
-                            card.btn.text_color = TEXT_GRAY
+                        else:
+                            break
+                        # Update UI: only cards whose state changed get re-baked
+                        for j, c in enumerate(cards):
+                            c.set_state(j in game_data['unlocked'], j == game_data['current'])
+                        card.btn.check_hover(click_pos)
+                        needs_redraw = True
+                        break
 
 # --- State Machine Functions ---
 
-def show_main_menu(screen, bg_cap, game_data):
-    font_hero = pygame.font.SysFont('Verdana', 24, bold=True)
-    font_sub = pygame.font.SysFont('Verdana', 14)
+# Which sound plays for each World.step() event
+SIM_EVENT_SOUNDS = {"crash": "crash", "score": "score", "coin": "collect"}
+
+def show_main_menu(screen, assets, game_data):
+    global FIRST_FRAME_TIME
+    font_hero = get_font('Verdana', 24, bold=True)
+    font_sub = get_font('Verdana', 14)
     
     # Menu Cards (Like Swiggy Categories)
     cx = SCREEN_WIDTH // 2
@@ -511,68 +607,114 @@ def show_main_menu(screen, bg_cap, game_data):
     btn_shop = Button(20, 320, (SCREEN_WIDTH - 50)//2, 80, "SHOP", "SHOP", color=WHITE, text_color=TEXT_DARK)
     btn_capture = Button(20 + (SCREEN_WIDTH - 50)//2 + 10, 320, (SCREEN_WIDTH - 50)//2, 80, "FACE CAM", "CAPTURE", color=WHITE, text_color=TEXT_DARK)
     
+    buttons = [btn_start, btn_shop, btn_capture]
+    update_hover(buttons, pygame.mouse.get_pos())
+    clock = pygame.time.Clock()
+    needs_redraw = True
+    
     while True:
+        # A video background is the only thing that animates; without it, redraw on input only
+        bg_cap = assets.bg_cap # Appears once the background loader has opened it
         video_surf = get_video_frame(bg_cap) if bg_cap else None
-        draw_background(screen, video_surf)
-        
-        # Welcome Text overlay
-        if not video_surf:
-            welcome = font_hero.render("Hungry for Game?", True, TEXT_DARK)
-            sub = font_sub.render("Order up some fun!", True, TEXT_GRAY)
-            screen.blit(welcome, (20, 100))
-            screen.blit(sub, (20, 135))
-        
-        # Draw Buttons
-        mouse_pos = pygame.mouse.get_pos()
-        for btn in [btn_start, btn_shop, btn_capture]:
-            btn.check_hover(mouse_pos)
-            btn.draw(screen)
-        
-        # Floating Coin Balance
-        coin_pill_rect = pygame.Rect(20, SCREEN_HEIGHT - 60, 120, 40)
-        draw_rounded_rect(screen, WHITE, coin_pill_rect, radius=20)
-        coin_txt = font_sub.render(f"₹ {game_data['coins']}", True, THEME_BRAND)
-        screen.blit(coin_txt, (40, SCREEN_HEIGHT - 50))
-        
-        pygame.display.update()
+        if video_surf or needs_redraw:
+            needs_redraw = False
+            draw_background(screen, video_surf)
+            
+            # Welcome Text overlay
+            if not video_surf:
+                welcome = font_hero.render("Hungry for Game?", True, TEXT_DARK)
+                sub = font_sub.render("Order up some fun!", True, TEXT_GRAY)
+                screen.blit(welcome, (20, 100))
+                screen.blit(sub, (20, 135))
+            
+            # Draw Buttons
+            for btn in buttons:
+                btn.draw(screen)
+            
+            # Floating Coin Balance
+            coin_pill_rect = pygame.Rect(20, SCREEN_HEIGHT - 60, 120, 40)
+            draw_rounded_rect(screen, WHITE, coin_pill_rect, radius=20)
+            coin_txt = font_sub.render(f"₹ {game_data['coins']}", True, THEME_BRAND)
+            screen.blit(coin_txt, (40, SCREEN_HEIGHT - 50))
+            
+            DISPLAY.show_screen()
+            if FIRST_FRAME_TIME is None:
+                FIRST_FRAME_TIME = time.perf_counter()
         
-        for event in pygame.event.get():
+        for event in wait_for_events(clock, animating=bg_cap is not None):
             if event.type == pygame.QUIT:
                 return "QUIT"
+            if event.type == pygame.MOUSEMOTION:
+                needs_redraw |= update_hover(buttons, event.pos)
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWSHOWN, ASSETS_READY):
+                needs_redraw = True
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if btn_start.is_clicked(event.pos): return "START"
                 if btn_capture.is_clicked(event.pos): return "CAPTURE"
                 if btn_shop.is_clicked(event.pos): return "SHOP"
 
-def run_game_loop(screen, bg_cap, game_data, bird_image, sounds, coin_image):
-    current_bird_data = BIRD_SHOP_DATA[game_data['current']]
-    bird = Bird(bird_image, current_bird_data)
-    pipes = []
-    score = 0
-    collected_in_run = 0
+GAME_OVER_CARD = pygame.Rect(20, 150, SCREEN_WIDTH - 40, 340)
+
+@functools.lru_cache(maxsize=8)
+def hud_sprite(score):
+    """The HUD score pill, re-rendered only when the score changes."""
+    score_surface = get_font('Verdana', 16, bold=True).render(f"Score: {score}", True, THEME_BRAND)
+    surf = pygame.Surface((max(100, 10 + score_surface.get_width()), 30), pygame.SRCALPHA)
+    draw_rounded_rect(surf, WHITE, pygame.Rect(0, 0, 100, 30), 15)
+    surf.blit(score_surface, (10, 5))
+    return surf
+
+def game_over_sprite(world, buttons):
+    """The game over card with its buttons, drawn as one image positioned at GAME_OVER_CARD."""
+    card_rect = GAME_OVER_CARD
+    surf = pygame.Surface(card_rect.size, pygame.SRCALPHA)
+    draw_rounded_rect(surf, WHITE, surf.get_rect(), 15)
     
-    clock = pygame.time.Clock()
-    SPAWNPIPE = pygame.USEREVENT
-    pygame.time.set_timer(SPAWNPIPE, PIPE_FREQUENCY)
+    go_font = get_font('Verdana', 24, bold=True)
+    txt_font = get_font('Verdana', 16)
+    
+    go_surf = go_font.render("Game Over", True, TEXT_DARK)
+    surf.blit(go_surf, (card_rect.width//2 - go_surf.get_width()//2, 180 - card_rect.y))
     
-    font_ui = pygame.font.SysFont('Verdana', 16, bold=True)
+    score_txt = txt_font.render(f"Score: {world.score}", True, TEXT_GRAY)
+    coin_txt = txt_font.render(f"Earned: ₹{world.coins}", True, THEME_BRAND)
     
-    game_active = True
+    surf.blit(score_txt, (card_rect.width//2 - score_txt.get_width()//2, 230 - card_rect.y))
+    surf.blit(coin_txt, (card_rect.width//2 - coin_txt.get_width()//2, 260 - card_rect.y))
+    
+    for btn in buttons:
+        btn.draw(surf, (-card_rect.x, -card_rect.y))
+    return surf
+
+def run_game_loop(display, bg_cap, game_data, bird_image, sounds, coin_image):
+    current_bird_data = BIRD_SHOP_DATA[game_data['current']]
+    bird_sprite = BirdSprite(bird_image, current_bird_data)
+    world = World()
+    
+    clock = pygame.time.Clock()
+    timestep = FixedTimestep()
     
     # Game Over Buttons
     btn_restart = Button(20, 360, SCREEN_WIDTH - 40, 50, "TRY AGAIN", "RESTART")
     btn_menu = Button(20, 420, SCREEN_WIDTH - 40, 50, "MAIN MENU", "MENU", color=WHITE, text_color=THEME_BRAND)
+    card = None # Game over card sprite, redrawn when a button's hover state changes
     
     while True:
+        frame_ms = clock.tick(RENDER_FPS)
+        prof = PROFILER
+        prof.lap("wait")
+        prof.end_frame()
         mouse_pos = pygame.mouse.get_pos()
         
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                if world.active and world.steps:
+                    keep_replay(world)
                 return "QUIT"
             
             if event.type == pygame.MOUSEBUTTONDOWN:
-                if game_active:
-                    bird.jump()
+                if world.active:
+                    world.jump()
                     if sounds['jump']: sounds['jump'].play()
                 else:
                     if btn_restart.is_clicked(event.pos): return "RESTART"
@@ -580,122 +722,142 @@ def run_game_loop(screen, bg_cap, game_data, bird_image, sounds, coin_image):
             
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
-                    if game_active:
-                        bird.jump()
+                    if world.active:
+                        world.jump()
                         if sounds['jump']: sounds['jump'].play()
                     else:
                         return "RESTART"
+                elif event.key == pygame.K_F3:
+                    toggle_profiler()
+                    prof = PROFILER
+        prof.lap("events")
+
+        # Update Logic (fixed steps, however long the last frame took)
+        steps = timestep.advance(frame_ms)
+        while steps > 0 and world.active:
+            steps -= 1
+            for sim_event in world.step():
+                if sim_event == "coin":
+                    game_data['coins'] += 1
+                    save_data(game_data)
+                elif sim_event == "crash":
+                    keep_replay(world)
+                if sounds[SIM_EVENT_SOUNDS[sim_event]]: sounds[SIM_EVENT_SOUNDS[sim_event]].play()
+        prof.lap("sim")
 
-            if event.type == SPAWNPIPE and game_active:
-                pipes.append(Pipe(coin_image))
-
-        # Update Logic
         video_surf = get_video_frame(bg_cap) if bg_cap else None
-        draw_background(screen, video_surf)
-
-        if game_active:
-            bird.move()
-            bird.draw(screen)
-
-            if bird.y >= SCREEN_HEIGHT or bird.y <= 0:
-                game_active = False
-                if sounds['crash']: sounds['crash'].play()
+        prof.lap("video")
+        draw_background(display, video_surf)
+        prof.lap("background")
 
-            for pipe in pipes:
-                pipe.move()
-                pipe.draw(screen)
-
-                collision_rect = bird.rect.inflate(-10, -10)
-                if collision_rect.colliderect(pipe.top_rect) or collision_rect.colliderect(pipe.bottom_rect):
-                    game_active = False
-                    if sounds['crash']: sounds['crash'].play()
-
-                if not pipe.passed and bird.x > pipe.x + pipe.width:
-                    score += 1
-                    pipe.passed = True
-                    if sounds['score']: sounds['score'].play()
-                
-                if pipe.coin and not pipe.coin.collected:
-                    if collision_rect.colliderect(pipe.coin.rect):
-                        pipe.coin.collected = True
-                        game_data['coins'] += 1
-                        collected_in_run += 1
-                        if sounds['collect']: sounds['collect'].play()
-                        save_data(game_data)
-            
-            if len(pipes) > 0 and pipes[0].x < -pipes[0].width:
-                pipes.pop(0)
+        if world.active:
+            draw_world(display, world, bird_sprite, coin_image, timestep.alpha)
             
             # HUD - Swiggy style Pill
-            hud_rect = pygame.Rect(SCREEN_WIDTH - 120, 70, 100, 30)
-            draw_rounded_rect(screen, WHITE, hud_rect, 15)
-            score_surface = font_ui.render(f"Score: {int(score)}", True, THEME_BRAND)
-            screen.blit(score_surface, (SCREEN_WIDTH - 110, 75))
+            display.blit(hud_sprite(world.score), (SCREEN_WIDTH - 120, 70))
+            prof.lap("hud")
 
         else:
             # GAME OVER CARD
-            card_rect = pygame.Rect(20, 150, SCREEN_WIDTH - 40, 340)
-            draw_rounded_rect(screen, WHITE, card_rect, 15)
-            
-            go_font = pygame.font.SysFont('Verdana', 24, bold=True)
-            txt_font = pygame.font.SysFont('Verdana', 16)
-            
-            go_surf = go_font.render("Game Over", True, TEXT_DARK)
-            screen.blit(go_surf, (card_rect.centerx - go_surf.get_width()//2, 180))
-            
-            score_txt = txt_font.render(f"Score: {score}", True, TEXT_GRAY)
-            coin_txt = txt_font.render(f"Earned: ₹{collected_in_run}", True, THEME_BRAND)
-            
-            screen.blit(score_txt, (card_rect.centerx - score_txt.get_width()//2, 230))
-            screen.blit(coin_txt, (card_rect.centerx - coin_txt.get_width()//2, 260))
-            
-            # Draw Buttons
-            btn_restart.check_hover(mouse_pos)
-            btn_menu.check_hover(mouse_pos)
-            btn_restart.draw(screen)
-            btn_menu.draw(screen)
+            if update_hover((btn_restart, btn_menu), mouse_pos) or card is None:
+                card = game_over_sprite(world, (btn_restart, btn_menu))
+            display.blit(card, GAME_OVER_CARD.topleft)
+            prof.lap("game over")
+
+        prof.draw_overlay(display)
+        prof.lap("profiler")
+        display.present()
+        prof.lap("display")
+
+# --- Startup ---
+ASSETS_READY = pygame.event.custom_type() # Posted by AssetLoader when everything is loaded
+FIRST_FRAME_TIME = None # When the first menu frame reached the screen
+VIDEO_PATH = 'backgroud.mp4'
+CAMERA_SOURCE = os.environ.get("FLAPPY_CAMERA", "0") # Camera index, or a video/image file standing in for one
+MUSIC_PATH = 'music.mp3'
+
+class AssetLoader:
+    """Loads audio, images and the video background on a background thread.
+
+    Until each asset arrives the game runs with a placeholder: silent sounds
+    (None), the drawn coin, and the plain theme background.
+    """
+    def __init__(self):
+        self.sounds = {'jump': None, 'score': None, 'crash': None, 'collect': None}
+        self.coin_image = None
+        self.bg_cap = None
+        self.ready_time = None
+        self.thread = threading.Thread(target=self.load, name="asset-loader", daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def wait(self):
+        self.thread.join()
+
+    def load(self):
+        for name in self.sounds:
+            self.sounds[name] = load_sound(f"{name}.wav")
+
+        # --- Background Music ---
+        if os.path.exists(MUSIC_PATH):
+            pygame.mixer.music.load(MUSIC_PATH)
+            pygame.mixer.music.set_volume(0.5) 
+            pygame.mixer.music.play(-1) 
+        else:
+            print(f"Warning: {MUSIC_PATH} not found.")
 
-        pygame.display.update()
-        clock.tick(FPS)
+        self.coin_image = load_coin_image("coin.jpg", 30)
+        load_background_image()
+        self.bg_cap = open_video_background()
+
+        self.ready_time = time.perf_counter()
+        pygame.event.post(pygame.event.Event(ASSETS_READY))
+
+def open_video_background():
+    if not os.path.exists(VIDEO_PATH):
+        return None
+    cv2, _ = import_cv()
+    return cv2.VideoCapture(VIDEO_PATH)
+
+def report_startup(assets):
+    """Prints the cold-start timings tracked by --startup-timing."""
+    print(f"Cold start: first frame {(FIRST_FRAME_TIME - START_TIME) * 1000:.0f} ms, "
+          f"assets ready {(assets.ready_time - START_TIME) * 1000:.0f} ms after launch")
 
 def main():
+    startup_timing = "--startup-timing" in sys.argv # Print cold-start timings and exit
+    if "--profile" in sys.argv:
+        toggle_profiler() # Record from the first frame; F3 toggles it in game either way
+    global DISPLAY
     pygame.init()
     pygame.mixer.init()
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-    pygame.display.set_caption("ACCESCO Flappy Game")
+    DISPLAY = create_display(RENDERER, (SCREEN_WIDTH, SCREEN_HEIGHT), caption="ACCESCO Flappy Game")
+    screen = DISPLAY.screen
     
-    # Load initial assets
+    # Only what the first menu frame needs is loaded here; the rest streams in behind it
     game_data = load_data()
-    load_bird_images() # Load all bird images at start
-    load_background_image() # Load background image at start
-
-    sounds = {
-        'jump': load_sound("jump.wav"),
-        'score': load_sound("score.wav"),
-        'crash': load_sound("crash.wav"),
-        'collect': load_sound("collect.wav")
-    }
-
-    # --- Background Music ---
-    music_path = 'music.mp3'
-    if os.path.exists(music_path):
-        pygame.mixer.music.load(music_path)
-        pygame.mixer.music.set_volume(0.5) 
-        pygame.mixer.music.play(-1) 
-    else:
-        print(f"Warning: {music_path} not found.")
-    
-    video_path = 'backgroud.mp4'
-    bg_cap = cv2.VideoCapture(video_path) if os.path.exists(video_path) else None
+    load_bird_images() # Skin catalog; images load on first use
+    assets = AssetLoader().start()
     
     bird_image = None
-    coin_image = load_coin_image("coin.jpg", 30)
+    
+    if startup_timing:
+        pygame.event.post(pygame.event.Event(pygame.QUIT)) # Draw the first menu frame, then leave
     
     app_state = "MENU"
+    frozen = False
     
     while True:
+        if assets.ready_time and not frozen:
+            # Startup objects live for the whole session; keep the GC from rescanning them mid-game
+            gc.collect()
+            gc.freeze()
+            frozen = True
+
         if app_state == "MENU":
-            action = show_main_menu(screen, bg_cap, game_data)
+            action = show_main_menu(screen, assets, game_data)
             if action == "QUIT": break
             elif action == "START": app_state = "GAME"
             elif action == "SHOP": app_state = "SHOP"
@@ -706,17 +868,24 @@ def main():
             app_state = "MENU" 
             
         elif app_state == "CAPTURE":
-            if bg_cap: bg_cap.release()
+            assets.wait() # The loader may still be opening the video capture
+            if assets.bg_cap: assets.bg_cap.release()
             bird_image = capture_face(screen)
-            if os.path.exists(video_path): bg_cap = cv2.VideoCapture(video_path)
+            assets.bg_cap = open_video_background()
             app_state = "MENU"
             
         elif app_state == "GAME":
-            result = run_game_loop(screen, bg_cap, game_data, bird_image, sounds, coin_image)
+            result = run_game_loop(DISPLAY, assets.bg_cap, game_data, bird_image, assets.sounds, assets.coin_image)
             if result == "QUIT": break
             elif result == "MENU": app_state = "MENU"
             elif result == "RESTART": pass 
 
+    if startup_timing:
+        assets.wait()
+        report_startup(assets)
+    if PROFILE_LOG:
+        print("Frame profile written to {} and {}".format(*PROFILE_LOG.dump(PROFILE_PREFIX)))
+    SAVE_STORE.close()
     pygame.quit()
     sys.exit()
 
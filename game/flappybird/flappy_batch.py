@@ -0,0 +1,239 @@
+"""Vectorized Flappy: N independent games stepped together with NumPy.
+
+Every environment starts at the same tick and uses the same Physics, so pipes
+spawn and scroll in lockstep: pipe x positions are shared, while pipe heights,
+coins, the bird and the scores are per-environment arrays. Pipes live in a
+fixed ring of slots. Collisions are the flappy_sim rect tests written as array
+comparisons, so a batch plays out exactly like N flappy_sim.World games fed
+the same pipe draws and inputs ('python flappy_batch.py --verify' checks it).
+"""
+import argparse
+import time
+
+import numpy as np
+
+from flappy_sim import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, BIRD_X, BIRD_WIDTH, BIRD_HEIGHT, HITBOX_INSET,
+    PIPE_WIDTH, PIPE_MARGIN, COIN_RADIUS, COIN_SIZE, COIN_BOB, DEFAULT_PHYSICS, World,
+)
+
+# Hitbox geometry is the same for every environment
+HIT_X = BIRD_X + HITBOX_INSET
+HIT_W = BIRD_WIDTH - 2 * HITBOX_INSET
+HIT_H = BIRD_HEIGHT - 2 * HITBOX_INSET
+
+class BatchWorld:
+    """N games in structure-of-arrays form, advanced one tick at a time by step()."""
+    def __init__(self, n, seed=None, physics=DEFAULT_PHYSICS, record_spawns=False):
+        self.n = n
+        self.physics = physics
+        self.spawn_steps = physics.spawn_steps
+        self.rng = np.random.default_rng(seed)
+
+        # Birds
+        self.bird_y = np.full(n, float(SCREEN_HEIGHT // 2))
+        self.velocity = np.zeros(n)
+        self.active = np.ones(n, dtype=bool)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.coins = np.zeros(n, dtype=np.int64)
+        self.crash_step = np.zeros(n, dtype=np.int64) # Tick each game ended on (0 while still running)
+        self.steps = 0
+        self.spawn_timer = 0
+
+        # Pipe ring: enough slots for every pipe that can be on screen at once
+        slots = physics.max_live_pipes
+        self.slots = slots
+        self.next_slot = 0
+        self.pipe_x = np.zeros(slots)
+        self.pipe_live = np.zeros(slots, dtype=bool)
+        self.pipe_height = np.zeros((n, slots), dtype=np.int64)
+        self.passed = np.zeros((n, slots), dtype=bool)
+        self.coin_x = np.zeros(slots)
+        self.coin_anim = np.zeros(slots)
+        self.coin_y = np.zeros((n, slots), dtype=np.int64)
+        self.has_coin = np.zeros((n, slots), dtype=bool) # Spawned with a coin that is still uncollected
+
+        # (heights, has_coin) per spawn, for replaying the batch through scalar Worlds
+        self.spawns = [] if record_spawns else None
+
+    def _spawn(self):
+        physics = self.physics
+        slot = self.next_slot
+        self.next_slot = (slot + 1) % self.slots
+        heights = self.rng.integers(PIPE_MARGIN, SCREEN_HEIGHT - physics.gap - PIPE_MARGIN + 1, self.n)
+        coins = self.rng.random(self.n) < 0.5
+        if self.spawns is not None:
+            self.spawns.append((heights, coins))
+
+        self.pipe_x[slot] = SCREEN_WIDTH
+        self.pipe_live[slot] = True
+        self.pipe_height[:, slot] = heights
+        self.passed[:, slot] = False
+        self.coin_x[slot] = SCREEN_WIDTH + PIPE_WIDTH // 2
+        self.coin_anim[slot] = 0
+        self.coin_y[:, slot] = heights + physics.gap // 2
+        self.has_coin[:, slot] = coins
+
+    def jump(self, mask):
+        """Flaps every still-active environment where mask is True."""
+        self.velocity[mask & self.active] = self.physics.bird_jump
+
+    def step(self):
+        """Advances every active environment by one tick."""
+        physics = self.physics
+        self.steps += 1
+        self.spawn_timer += 1
+        if self.spawn_timer >= self.spawn_steps:
+            self.spawn_timer = 0
+            self._spawn()
+
+        # Finished games keep their final state; everything below is masked by `act`
+        act = self.active.copy()
+        moving = act.astype(float)
+        self.velocity += physics.gravity * moving
+        self.bird_y += self.velocity * moving
+        crashed = (self.bird_y >= SCREEN_HEIGHT) | (self.bird_y <= 0)
+        hit_y = np.trunc(self.bird_y).astype(np.int64) + HITBOX_INSET
+
+        live = self.pipe_live
+        self.pipe_x[live] -= physics.pipe_speed
+        self.coin_x[live] -= physics.pipe_speed
+        self.coin_anim[live] += 0.1
+        act_live = act[:, None] & live
+
+        # Pipe collisions: only slots overlapping the hitbox in x, then top/bottom rect tests in y
+        px = np.trunc(self.pipe_x).astype(np.int64)
+        x_overlap = live & (px < HIT_X + HIT_W) & (HIT_X < px + PIPE_WIDTH)
+        if x_overlap.any():
+            height = self.pipe_height[:, x_overlap]
+            bottom_y = height + physics.gap
+            y = hit_y[:, None]
+            hit_top = (y < height) & (0 < y + HIT_H)
+            hit_bottom = (y < SCREEN_HEIGHT) & (bottom_y < y + HIT_H) & (bottom_y < SCREEN_HEIGHT)
+            crashed |= (hit_top | hit_bottom).any(axis=1)
+
+        # Scoring
+        cleared = act_live & ~self.passed & (BIRD_X > self.pipe_x + PIPE_WIDTH)
+        self.passed |= cleared
+        self.score += cleared.sum(axis=1)
+
+        # Coin pickup
+        coin_rx = np.trunc(self.coin_x - COIN_RADIUS).astype(np.int64)
+        coin_overlap = live & (coin_rx < HIT_X + HIT_W) & (HIT_X < coin_rx + COIN_SIZE)
+        if coin_overlap.any():
+            bob = np.sin(self.coin_anim[coin_overlap]) * COIN_BOB
+            coin_ry = np.trunc(self.coin_y[:, coin_overlap] - COIN_RADIUS + bob).astype(np.int64)
+            y = hit_y[:, None]
+            grabbed = (self.has_coin[:, coin_overlap] & act[:, None]
+                       & (y < coin_ry + COIN_SIZE) & (coin_ry < y + HIT_H))
+            self.has_coin[:, coin_overlap] &= ~grabbed
+            self.coins += grabbed.sum(axis=1)
+
+        # Despawn pipes that scrolled off the left edge
+        self.pipe_live &= ~(self.pipe_x < -PIPE_WIDTH)
+
+        self.crash_step[act & crashed] = self.steps
+        self.active = act & ~crashed
+
+    def next_pipe_slot(self):
+        """Slot of the nearest pipe the birds haven't cleared yet, or None."""
+        ahead = self.pipe_live & (self.pipe_x + PIPE_WIDTH >= BIRD_X)
+        if not ahead.any():
+            return None
+        candidates = np.flatnonzero(ahead)
+        return candidates[np.argmin(self.pipe_x[candidates])]
+
+def batch_gap_policy(batch):
+    """flappy_sim.gap_policy for every environment at once."""
+    slot = batch.next_pipe_slot()
+    if slot is None:
+        target = SCREEN_HEIGHT // 2
+    else:
+        target = batch.pipe_height[:, slot] + batch.physics.gap // 2
+    return (batch.velocity > 0) & (batch.bird_y + BIRD_HEIGHT // 2 > target + 10)
+
+def run_batch(batch, policy=batch_gap_policy, max_steps=20000):
+    """Steps until every environment has crashed or max_steps pass."""
+    while batch.active.any() and batch.steps < max_steps:
+        batch.jump(policy(batch))
+        batch.step()
+    return batch
+
+# --- Equivalence Check ---
+
+class _ReplayRng:
+    """Feeds one environment's recorded spawn draws to a flappy_sim.World."""
+    def __init__(self, spawns, env):
+        self.draws = iter([(int(h[env]), bool(c[env])) for h, c in spawns])
+        self.coin = False
+
+    def randint(self, lo, hi):
+        height, self.coin = next(self.draws)
+        return height
+
+    def random(self):
+        return 0.0 if self.coin else 1.0
+
+def verify(n=64, steps=3000, seed=0, physics=DEFAULT_PHYSICS):
+    """Plays a batch and the same games through scalar Worlds, comparing every tick.
+
+    Returns the number of mismatching environments (0 means equivalent).
+    """
+    from flappy_sim import gap_policy
+
+    batch = BatchWorld(n, seed, physics, record_spawns=True)
+    worlds = [World(0, physics) for _ in range(n)]
+    mismatched = set()
+    for _ in range(steps):
+        jumps = batch_gap_policy(batch)
+        batch.jump(jumps)
+        for i, world in enumerate(worlds):
+            if world.active and gap_policy(world) != bool(jumps[i]):
+                mismatched.add(i)
+            if jumps[i]:
+                world.jump()
+        spawned = len(batch.spawns)
+        batch.step()
+        for i, world in enumerate(worlds):
+            if len(batch.spawns) != spawned:
+                world.rng = _ReplayRng(batch.spawns[-1:], i)
+            world.step()
+            if (world.active != batch.active[i] or world.score != batch.score[i]
+                    or world.coins != batch.coins[i] or world.bird.y != batch.bird_y[i]):
+                mismatched.add(i)
+        if not batch.active.any():
+            break
+    return len(mismatched)
+
+# --- Benchmark ---
+
+def benchmark(sizes, steps=1000, seed=0):
+    """Prints environment-steps per second for each batch size."""
+    print(f"{'N':>8} {'steps/s':>12} {'env-steps/s':>14}")
+    for n in sizes:
+        batch = BatchWorld(n, seed)
+        start = time.perf_counter()
+        for _ in range(steps):
+            batch.jump(batch_gap_policy(batch))
+            batch.step()
+        elapsed = time.perf_counter() - start
+        print(f"{n:>8} {steps / elapsed:>12,.0f} {n * steps / elapsed:>14,.0f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Vectorized Flappy simulator.")
+    parser.add_argument("--bench", type=int, nargs="*", default=None, metavar="N",
+                        help="Benchmark steps/sec for these batch sizes")
+    parser.add_argument("--verify", type=int, default=None, metavar="N",
+                        help="Check N batched games against scalar flappy_sim Worlds")
+    parser.add_argument("--steps", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.verify:
+        bad = verify(args.verify, args.steps, args.seed)
+        print(f"{args.verify - bad}/{args.verify} environments match the scalar simulation")
+        raise SystemExit(1 if bad else 0)
+    benchmark(args.bench or [1, 10, 100, 1000, 10000], args.steps, args.seed)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+"""Headless Flappy simulation: bird physics, pipe generation, collisions, scoring and coins.
+
+Nothing here touches pygame or a display. A World is driven by a seeded RNG and
+advanced in fixed ticks, so the same seed and the same jump inputs always play
+out the same game. flappy.py renders a World; tools can step one as fast as
+Python allows.
+"""
+import math
+import random
+from collections import deque
+from dataclasses import dataclass
+
+from broadphase import SweepList
+
+# --- Playfield ---
+SCREEN_WIDTH = 400
+SCREEN_HEIGHT = 600
+FPS = 60
+
+# --- Game Physics (per simulation tick) ---
+GRAVITY = 0.25
+BIRD_JUMP = -6
+PIPE_SPEED = 3
+PIPE_GAP = 170
+PIPE_FREQUENCY = 1500 # ms of simulation time between pipes
+
+# --- Simulation Timing ---
+SIM_STEP_MS = 1000 / FPS
+MAX_FRAME_MS = 250  # Clamp long hitches so the simulation doesn't spiral trying to catch up
+
+# --- Entity Geometry ---
+BIRD_X = 50
+BIRD_WIDTH = 50
+BIRD_HEIGHT = 40
+HITBOX_INSET = 5 # Same as Rect.inflate(-10, -10) on the bird rect
+PIPE_WIDTH = 70
+PIPE_MARGIN = 100 # Minimum pipe length above and below the gap
+COIN_RADIUS = 15
+COIN_SIZE = COIN_RADIUS * 2
+COIN_BOB = 5
+
+
+@dataclass(frozen=True)
+class Physics:
+    """The tunable constants of a game. Defaults match the shipped game."""
+    gravity: float = GRAVITY
+    bird_jump: float = BIRD_JUMP
+    pipe_speed: float = PIPE_SPEED
+    gap: int = PIPE_GAP
+    pipe_frequency: int = PIPE_FREQUENCY
+
+    @property
+    def spawn_steps(self):
+        """Simulation ticks between pipe spawns."""
+        return max(1, round(self.pipe_frequency / SIM_STEP_MS))
+
+    @property
+    def max_live_pipes(self):
+        """Upper bound on pipes alive at once: a pipe lives for its scroll across the screen."""
+        travel = SCREEN_WIDTH + PIPE_WIDTH
+        return math.ceil(travel / (max(self.pipe_speed, 1e-9) * self.spawn_steps)) + 2
+
+DEFAULT_PHYSICS = Physics()
+
+def colliderect(ax, ay, aw, ah, bx, by, bw, bh):
+    """pygame.Rect.colliderect on plain ints: edges touching is not a hit, empty rects never hit."""
+    return (aw > 0 and ah > 0 and bw > 0 and bh > 0
+            and ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah)
+
+class Coin:
+    __slots__ = ("x", "y", "rect_x", "rect_y", "prev_x", "prev_y", "collected", "animation_offset")
+
+    def __init__(self, x=0, y=0):
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        self.x = x
+        self.y = y
+        # Top-left of the coin's rect, as drawn and collided
+        self.rect_x = int(x - COIN_RADIUS)
+        self.rect_y = int(y - COIN_RADIUS)
+        self.prev_x = self.rect_x
+        self.prev_y = self.rect_y
+        self.collected = False
+        self.animation_offset = 0
+
+    def move(self, speed):
+        self.prev_x = self.rect_x
+        self.prev_y = self.rect_y
+        self.x -= speed
+        self.rect_x = int(self.x - COIN_RADIUS)
+        self.animation_offset += 0.1
+        self.rect_y = int(self.y - COIN_RADIUS + math.sin(self.animation_offset) * COIN_BOB)
+
+class Bird:
+    __slots__ = ("x", "y", "prev_y", "velocity", "width", "height")
+
+    def __init__(self):
+        self.x = BIRD_X
+        self.y = SCREEN_HEIGHT // 2
+        self.prev_y = self.y
+        self.velocity = 0
+        self.width = BIRD_WIDTH
+        self.height = BIRD_HEIGHT
+
+    def jump(self, velocity=BIRD_JUMP):
+        self.velocity = velocity
+
+    def move(self, gravity=GRAVITY):
+        self.prev_y = self.y
+        self.velocity += gravity
+        self.y += self.velocity
+
+class Pipe:
+    """A pipe pair. Pooled: each Pipe owns one Coin for life and reset() re-rolls both."""
+    __slots__ = ("gap", "width", "x", "prev_x", "height", "passed", "coin", "own_coin")
+
+    def __init__(self, rng=None, gap=PIPE_GAP):
+        self.width = PIPE_WIDTH
+        self.own_coin = Coin()
+        self.coin = None
+        if rng is not None:
+            self.reset(rng, gap)
+
+    def reset(self, rng, gap=PIPE_GAP):
+        self.gap = gap
+        self.x = SCREEN_WIDTH
+        self.prev_x = self.x
+        self.height = rng.randint(PIPE_MARGIN, SCREEN_HEIGHT - gap - PIPE_MARGIN)
+        self.passed = False
+        self.coin = None
+        if rng.random() < 0.5:
+            self.coin = self.own_coin
+            self.coin.reset(self.x + self.width // 2, self.height + gap // 2)
+        return self
+
+    @property
+    def bottom_y(self):
+        return self.height + self.gap
+
+    def move(self, speed):
+        self.prev_x = self.x
+        self.x -= speed
+        if self.coin:
+            self.coin.move(speed)
+
+class EntityPool:
+    """Fixed-capacity free list: acquire() hands back a released instance instead of allocating."""
+    __slots__ = ("factory", "free")
+
+    def __init__(self, factory, capacity):
+        self.factory = factory
+        self.free = deque((factory() for _ in range(capacity)), maxlen=capacity)
+
+    def acquire(self):
+        # Only allocates if more entities are alive than the pool was sized for
+        return self.free.pop() if self.free else self.factory()
+
+    def release(self, entity):
+        self.free.append(entity)
+
+class World:
+    """One game, advanced in fixed SIM_STEP_MS ticks independent of any render rate."""
+    def __init__(self, seed=None, physics=DEFAULT_PHYSICS):
+        self.seed = random.randrange(2**32) if seed is None else seed
+        self.rng = random.Random(self.seed)
+        self.physics = physics
+        self.spawn_steps = physics.spawn_steps
+        self.bird = Bird()
+        # Live pipes, oldest (leftmost) first. Pipes only ever leave from the left, so despawning is popleft()
+        self.pipes = SweepList(PIPE_WIDTH)
+        self.pipe_pool = EntityPool(Pipe, physics.max_live_pipes)
+        self.events = [] # Reused by every step() so the game loop doesn't allocate
+        self.score = 0
+        self.coins = 0
+        self.active = True
+        self.steps = 0
+        self.spawn_timer = 0 # Pipes spawn on simulation time, not wall-clock time
+        self.jumps = [] # Tick (self.steps) each jump was applied before, for replays
+
+    def jump(self):
+        if self.active:
+            self.bird.jump(self.physics.bird_jump)
+            # Several jumps between two ticks have the same effect as one
+            if not self.jumps or self.jumps[-1] != self.steps:
+                self.jumps.append(self.steps)
+
+    def step(self):
+        """Advances one tick. Returns the events ("crash", "score", "coin") it produced.
+
+        The returned list is reused by the next step(); read it before stepping again.
+        """
+        events = self.events
+        events.clear()
+        if not self.active:
+            return events
+        physics = self.physics
+        self.steps += 1
+
+        self.spawn_timer += 1
+        if self.spawn_timer >= self.spawn_steps:
+            self.spawn_timer = 0
+            self.pipes.append(self.pipe_pool.acquire().reset(self.rng, physics.gap))
+
+        bird = self.bird
+        bird.move(physics.gravity)
+        crashed = bird.y >= SCREEN_HEIGHT or bird.y <= 0
+
+        # Bird hitbox, shrunk like Rect.inflate(-10, -10)
+        hx = bird.x + HITBOX_INSET
+        hy = int(bird.y) + HITBOX_INSET
+        hw = bird.width - 2 * HITBOX_INSET
+        hh = bird.height - 2 * HITBOX_INSET
+        speed = physics.pipe_speed
+        pipes = self.pipes
+        items = pipes.items # The underlying deque, for cheap iteration and indexing
+        for pipe in items:
+            pipe.move(speed)
+
+        # Scoring: pipes clear the bird in x order, so stop at the first one still ahead of it
+        for pipe in items:
+            if bird.x <= pipe.x + pipe.width:
+                break
+            if not pipe.passed:
+                self.score += 1
+                pipe.passed = True
+                events.append("score")
+
+        # Broad phase: only pipes (and their coins) in the hitbox's x band get rect tests
+        lo, hi = pipes.span(hx, hx + hw)
+        for i in range(lo, hi):
+            pipe = items[i]
+            px = int(pipe.x)
+            if px < hx + hw and hx < px + pipe.width:
+                bottom_y = pipe.height + pipe.gap
+                if (colliderect(hx, hy, hw, hh, px, 0, pipe.width, pipe.height)
+                        or colliderect(hx, hy, hw, hh, px, bottom_y, pipe.width, SCREEN_HEIGHT - bottom_y)):
+                    crashed = True
+
+            coin = pipe.coin
+            if coin and not coin.collected:
+                if colliderect(hx, hy, hw, hh, coin.rect_x, coin.rect_y, COIN_SIZE, COIN_SIZE):
+                    coin.collected = True
+                    self.coins += 1
+                    events.append("coin")
+
+        while items and items[0].x < -items[0].width:
+            self.pipe_pool.release(pipes.popleft())
+
+        if crashed:
+            self.active = False
+            events.append("crash")
+        return events
+
+    def run(self, policy, max_steps):
+        """Steps until the bird crashes or max_steps pass. policy(world) returns True to jump."""
+        while self.active and self.steps < max_steps:
+            if policy(self):
+                self.jump()
+            self.step()
+        return self
+
+class FixedTimestep:
+    """Accumulates real frame time and hands it out as whole simulation steps."""
+    def __init__(self, step_ms=SIM_STEP_MS, max_frame_ms=MAX_FRAME_MS):
+        self.step_ms = step_ms
+        self.max_frame_ms = max_frame_ms
+        self.accumulator = 0.0
+
+    def advance(self, frame_ms):
+        """Adds a frame's elapsed time and returns how many steps to simulate."""
+        self.accumulator += min(frame_ms, self.max_frame_ms)
+        steps = int(self.accumulator // self.step_ms)
+        self.accumulator -= steps * self.step_ms
+        return steps
+
+    @property
+    def alpha(self):
+        """Fraction of a step left over, used to interpolate rendering."""
+        return self.accumulator / self.step_ms
+
+def lerp(a, b, alpha):
+    return a + (b - a) * alpha
+
+def gap_policy(world):
+    """A simple scripted player: flap when falling below the middle of the next gap."""
+    bird = world.bird
+    target = SCREEN_HEIGHT // 2
+    for pipe in world.pipes:
+        if pipe.x + pipe.width >= bird.x:
+            target = pipe.height + pipe.gap // 2
+            break
+    return bird.velocity > 0 and bird.y + bird.height // 2 > target + 10
+
+def main():
+    """Plays seeded games with gap_policy and reports scores and simulation speed."""
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Run headless Flappy games.")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the first game; game i uses seed + i")
+    parser.add_argument("--max-steps", type=int, default=20000)
+    args = parser.parse_args()
+
+    scores, coins, steps = [], [], 0
+    start = time.perf_counter()
+    for i in range(args.games):
+        world = World(args.seed + i).run(gap_policy, args.max_steps)
+        scores.append(world.score)
+        coins.append(world.coins)
+        steps += world.steps
+    elapsed = time.perf_counter() - start
+
+    print(f"games: {args.games}  steps: {steps}  time: {elapsed:.2f}s  ({steps / elapsed / 1000:.0f} steps/ms)")
+    print(f"score mean {sum(scores) / len(scores):.1f}  max {max(scores)}  coins mean {sum(coins) / len(coins):.1f}")
+
+if __name__ == "__main__":
+    main()
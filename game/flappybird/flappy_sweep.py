@@ -0,0 +1,188 @@
+"""Parameter sweeps over the Flappy physics constants, for game balancing.
+
+Each parameter set plays a batch of games with the scripted gap policy in
+flappy_batch, and parameter sets fan out over a process pool in chunks.
+Rows stream to CSV as results come in (or Parquet, if pyarrow is installed).
+
+    python flappy_sweep.py grid --gravity 0.2 0.25 0.3 --gap 150 170 -o sweep.csv
+    python flappy_sweep.py random --samples 500 --gravity 0.15:0.4 --gap 130:220 -o sweep.parquet
+"""
+import argparse
+import csv
+import itertools
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from flappy_sim import Physics, DEFAULT_PHYSICS
+from flappy_batch import BatchWorld, run_batch
+
+# Sweepable parameters: CLI flag -> Physics field
+PARAMETERS = {
+    "gravity": "gravity",
+    "jump": "bird_jump",
+    "speed": "pipe_speed",
+    "gap": "gap",
+    "frequency": "pipe_frequency",
+}
+INT_FIELDS = {"gap", "pipe_frequency"}
+PERCENTILES = (10, 25, 50, 75, 90, 99)
+
+COLUMNS = (
+    list(PARAMETERS.values())
+    + ["games", "score_mean", "score_std"] + [f"score_p{p}" for p in PERCENTILES]
+    + ["score_max", "coins_mean", "coins_per_game_p50", "coins_per_1k_steps", "steps_mean", "timeouts"]
+)
+
+def evaluate(params, games, seed, max_steps):
+    """Plays `games` games with one parameter set and summarizes them as a result row."""
+    physics = Physics(**params)
+    batch = run_batch(BatchWorld(games, seed, physics), max_steps=max_steps)
+    score = batch.score
+    # A finished game's length is the tick it crashed on; games still alive ran max_steps
+    steps = np.where(batch.active, batch.steps, batch.crash_step)
+    row = dict(params)
+    row.update(
+        games=games,
+        score_mean=float(score.mean()),
+        score_std=float(score.std()),
+        score_max=int(score.max()),
+        coins_mean=float(batch.coins.mean()),
+        coins_per_game_p50=float(np.percentile(batch.coins, 50)),
+        coins_per_1k_steps=float(batch.coins.sum() * 1000 / max(int(steps.sum()), 1)),
+        steps_mean=float(steps.mean()),
+        timeouts=int(batch.active.sum()),
+    )
+    for p, value in zip(PERCENTILES, np.percentile(score, PERCENTILES)):
+        row[f"score_p{p}"] = float(value)
+    return row
+
+def _evaluate_chunk(chunk, games, seed, max_steps):
+    return [evaluate(params, games, seed, max_steps) for params in chunk]
+
+# --- Parameter Spaces ---
+
+def grid_space(values):
+    """Every combination of the given values; unswept parameters keep their defaults."""
+    fields = list(values)
+    for combo in itertools.product(*(values[f] for f in fields)):
+        yield dict(_defaults(), **dict(zip(fields, combo)))
+
+def random_space(ranges, samples, seed):
+    """`samples` uniform draws from the given (low, high) ranges."""
+    rng = random.Random(seed)
+    for _ in range(samples):
+        params = _defaults()
+        for field, (low, high) in ranges.items():
+            params[field] = rng.randint(int(low), int(high)) if field in INT_FIELDS else rng.uniform(low, high)
+        yield params
+
+def _defaults():
+    return {field: getattr(DEFAULT_PHYSICS, field) for field in PARAMETERS.values()}
+
+def chunked(iterable, size):
+    it = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+# --- Output ---
+
+class CsvSink:
+    def __init__(self, path):
+        self.file = open(path, "w", newline="") if path != "-" else sys.stdout
+        self.writer = csv.DictWriter(self.file, fieldnames=COLUMNS)
+        self.writer.writeheader()
+
+    def write(self, rows):
+        self.writer.writerows(rows)
+        self.file.flush()
+
+    def close(self):
+        if self.file is not sys.stdout:
+            self.file.close()
+
+class ParquetSink:
+    """Appends each batch of rows as a row group, so results still stream."""
+    def __init__(self, path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SystemExit("Parquet output needs pyarrow (pip install pyarrow); use a .csv path instead.")
+        self.pa = pa
+        self.writer = None
+        self.pq = pq
+        self.path = path
+
+    def write(self, rows):
+        table = self.pa.Table.from_pylist(rows)
+        if self.writer is None:
+            self.writer = self.pq.ParquetWriter(self.path, table.schema)
+        self.writer.write_table(table)
+
+    def close(self):
+        if self.writer:
+            self.writer.close()
+
+def open_sink(path):
+    return ParquetSink(path) if path.endswith(".parquet") else CsvSink(path)
+
+# --- CLI ---
+
+def _parse_range(text):
+    low, _, high = text.partition(":")
+    return float(low), float(high or low)
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Sweep Flappy physics constants with a scripted player.")
+    sub = parser.add_subparsers(dest="mode", required=True)
+
+    grid = sub.add_parser("grid", help="Every combination of the listed values")
+    rand = sub.add_parser("random", help="Uniform random samples from LOW:HIGH ranges")
+    rand.add_argument("--samples", type=int, default=100)
+    for flag in PARAMETERS:
+        grid.add_argument(f"--{flag}", type=float, nargs="+")
+        rand.add_argument(f"--{flag}", type=_parse_range, metavar="LOW:HIGH")
+
+    for p in (grid, rand):
+        p.add_argument("-o", "--output", default="sweep.csv", help=".csv or .parquet path, '-' for stdout CSV")
+        p.add_argument("--games", type=int, default=256, help="Games per parameter set")
+        p.add_argument("--max-steps", type=int, default=20000, help="Tick limit per game")
+        p.add_argument("--seed", type=int, default=0)
+        p.add_argument("--workers", type=int, default=os.cpu_count())
+        p.add_argument("--chunk", type=int, default=4, help="Parameter sets per task")
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    swept = {PARAMETERS[flag]: getattr(args, flag) for flag in PARAMETERS if getattr(args, flag) is not None}
+    if args.mode == "grid":
+        swept = {f: [int(v) if f in INT_FIELDS else v for v in values] for f, values in swept.items()}
+        space = grid_space(swept)
+    else:
+        space = random_space(swept, args.samples, args.seed)
+
+    sink = open_sink(args.output)
+    done = 0
+    try:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            tasks = chunked(space, args.chunk)
+            results = pool.map(_evaluate_chunk, tasks,
+                               itertools.repeat(args.games), itertools.repeat(args.seed),
+                               itertools.repeat(args.max_steps))
+            for rows in results:
+                sink.write(rows)
+                done += len(rows)
+                print(f"\r{done} parameter sets done", end="", file=sys.stderr)
+    finally:
+        sink.close()
+    print(file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
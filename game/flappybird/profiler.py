@@ -0,0 +1,164 @@
+"""Per-frame section timings for the game loop, with an on-screen overlay.
+
+The loop splits each frame into named sections with lap(name): a lap is the
+time since the previous lap, so sections never overlap and add up to the
+whole frame. Timings go into fixed-size rings (one slot per frame, the last
+always being the frame in progress), so nothing is allocated per frame once
+every section has been seen.
+
+When profiling is off the game holds NULL_PROFILER, whose methods do
+nothing, so the instrumentation costs one no-op call per section.
+
+dump() writes the recorded frames as CSV (one row per frame, one column per
+section) and as a Chrome trace (open in chrome://tracing or ui.perfetto.dev).
+"""
+import csv
+import json
+import time
+
+import pygame
+
+PROFILE_FRAMES = 600 # Ring size: 10 s at 60 fps
+OVERLAY_REFRESH = 15 # Frames between overlay re-renders
+OVERLAY_SECTIONS = 6 # Costliest sections listed on the overlay
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p / 100))]
+
+class FrameProfiler:
+    enabled = True
+
+    def __init__(self, capacity=PROFILE_FRAMES):
+        self.capacity = capacity
+        self.frames = 0 # Completed frames, including ones the ring has overwritten
+        self.frame_ms = [0.0] * capacity
+        self.frame_start = [0.0] * capacity
+        self.sections = {} # name -> ring of ms, in the order sections first ran
+        self.visible = True
+        self._slot = 0
+        self._overlay = None
+        self._font = None
+        self._overlay_frame = -OVERLAY_REFRESH
+        self._origin = time.perf_counter()
+        self.resume()
+
+    def resume(self):
+        """Starts a fresh frame now, so time spent switched off isn't charged to anything."""
+        self._start = self._last = time.perf_counter()
+        for ring in self.sections.values():
+            ring[self._slot] = 0.0
+
+    def lap(self, name):
+        """Charges the time since the last lap to section `name`."""
+        now = time.perf_counter()
+        ring = self.sections.get(name)
+        if ring is None:
+            ring = self.sections[name] = [0.0] * self.capacity
+        ring[self._slot] += (now - self._last) * 1000
+        self._last = now
+
+    def end_frame(self):
+        now = time.perf_counter()
+        slot = self._slot
+        self.frame_ms[slot] = (now - self._start) * 1000
+        self.frame_start[slot] = self._start - self._origin
+        self.frames += 1
+        self._slot = slot = self.frames % self.capacity
+        for ring in self.sections.values():
+            ring[slot] = 0.0
+        self._start = self._last = now
+
+    def _recorded(self):
+        """Ring slots of the completed frames still in the ring, oldest first."""
+        count = min(self.frames, self.capacity - 1)
+        first = self.frames - count
+        return [(first + i) % self.capacity for i in range(count)]
+
+    def stats(self):
+        """(fps, (p50, p95, p99) frame ms, [(section, mean ms)] costliest first)."""
+        slots = self._recorded()
+        if not slots:
+            return 0.0, (0.0, 0.0, 0.0), []
+        frame_ms = sorted(self.frame_ms[s] for s in slots)
+        total = sum(frame_ms)
+        fps = len(slots) * 1000 / total if total else 0.0
+        means = [(name, sum(ring[s] for s in slots) / len(slots)) for name, ring in self.sections.items()]
+        means.sort(key=lambda item: item[1], reverse=True)
+        return fps, tuple(percentile(frame_ms, p) for p in (50, 95, 99)), means
+
+    # --- Overlay ---
+
+    def draw_overlay(self, screen, pos=(8, 68)):
+        if not self.visible:
+            return
+        if self._overlay is None or self.frames - self._overlay_frame >= OVERLAY_REFRESH:
+            self._overlay = self._render_overlay()
+            self._overlay_frame = self.frames
+        screen.blit(self._overlay, pos)
+
+    def _render_overlay(self):
+        fps, (p50, p95, p99), means = self.stats()
+        lines = [f"{fps:5.1f} fps  {min(self.frames, self.capacity - 1)} frames",
+                 f"frame p50 {p50:.1f}  p95 {p95:.1f}  p99 {p99:.1f} ms"]
+        lines += [f"{name:<12}{ms:6.2f} ms" for name, ms in means[:OVERLAY_SECTIONS]]
+
+        if self._font is None:
+            self._font = pygame.font.SysFont("Courier New", 12, bold=True)
+        font = self._font
+        line_height = font.get_linesize()
+        surf = pygame.Surface((230, line_height * len(lines) + 8), pygame.SRCALPHA)
+        surf.fill((0, 0, 0, 170))
+        for i, line in enumerate(lines):
+            surf.blit(font.render(line, True, (255, 255, 255)), (6, 4 + i * line_height))
+        return surf
+
+    # --- Export ---
+
+    def dump(self, prefix="profile"):
+        """Writes <prefix>.csv and <prefix>.trace.json and returns their paths."""
+        slots = self._recorded()
+        names = list(self.sections)
+        csv_path, trace_path = f"{prefix}.csv", f"{prefix}.trace.json"
+
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", "start_ms", "frame_ms"] + names)
+            first = self.frames - len(slots)
+            for i, s in enumerate(slots):
+                writer.writerow([first + i, f"{self.frame_start[s] * 1000:.3f}", f"{self.frame_ms[s]:.3f}"]
+                                + [f"{self.sections[n][s]:.3f}" for n in names])
+
+        # Sections are laid end to end in the order they first ran, which is the loop's order
+        events = []
+        for s in slots:
+            ts = self.frame_start[s] * 1e6
+            events.append({"name": "frame", "ph": "X", "ts": ts, "dur": self.frame_ms[s] * 1000, "pid": 0, "tid": 0})
+            for name in names:
+                dur = self.sections[name][s] * 1000
+                if dur:
+                    events.append({"name": name, "ph": "X", "ts": ts, "dur": dur, "pid": 0, "tid": 1})
+                    ts += dur
+        with open(trace_path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        return csv_path, trace_path
+
+class NullProfiler:
+    """Stands in for FrameProfiler when profiling is off; every call is a no-op."""
+    enabled = False
+    visible = False
+
+    def resume(self):
+        pass
+
+    def lap(self, name):
+        pass
+
+    def end_frame(self):
+        pass
+
+    def draw_overlay(self, screen, pos=None):
+        pass
+
+NULL_PROFILER = NullProfiler()
@@ -0,0 +1,115 @@
+"""Where frames get drawn: software Surface blits or SDL2 Renderer/Texture.
+
+Both displays take a logical SCREEN_WIDTH x SCREEN_HEIGHT frame and show it
+in a window that may be larger. The game scene draws through the display
+(blit/fill/present). Menus draw in software onto `display.screen` and show
+it with show_screen().
+
+SoftwareDisplay is the original path: blits onto the pygame.display surface.
+It works everywhere, including under SDL_VIDEODRIVER=dummy.
+
+TextureDisplay uses pygame._sdl2.video. Each Surface it is asked to blit is
+uploaded once as a Texture and reused for as long as the Surface lives. That
+makes it only suitable for images that don't change after they are first
+drawn. Surfaces registered with stream() (the video background) are
+re-uploaded into a streaming texture on every blit instead. Scaling to the
+window happens in the renderer.
+
+create_display() falls back to SoftwareDisplay if no renderer can be created.
+"""
+import weakref
+
+import pygame
+
+class SoftwareDisplay:
+    name = "software"
+
+    def __init__(self, size, window_size=None, caption=""):
+        self.size = size
+        self.window_size = window_size or size
+        self.window = pygame.display.set_mode(self.window_size)
+        pygame.display.set_caption(caption)
+        # At 1:1 draw straight onto the window; otherwise draw small and scale up when presenting
+        self.screen = self.window if self.window_size == size else pygame.Surface(size).convert()
+
+    def stream(self, surface):
+        return surface
+
+    def blit(self, surface, pos, area=None):
+        self.screen.blit(surface, pos, area)
+
+    def fill(self, color):
+        self.screen.fill(color)
+
+    def present(self):
+        if self.screen is not self.window:
+            pygame.transform.scale(self.screen, self.window_size, self.window)
+        pygame.display.update()
+
+    show_screen = present
+
+    def close(self):
+        pass
+
+class TextureDisplay:
+    name = "texture"
+
+    def __init__(self, size, window_size=None, caption="", vsync=False):
+        from pygame._sdl2.video import Renderer, Texture, Window
+        self.size = size
+        self.window_size = window_size or size
+        # Surface.convert() needs a display mode even though nothing is drawn to it
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        self.window = Window(caption, self.window_size)
+        self.renderer = Renderer(self.window, accelerated=-1, vsync=vsync)
+        self.renderer.logical_size = size
+        self.screen = pygame.Surface(size).convert()
+        self._texture = Texture
+        self._textures = weakref.WeakKeyDictionary() # Surface -> Texture, freed with the Surface
+        self._streams = weakref.WeakKeyDictionary() # Surface -> streaming Texture, re-uploaded per blit
+        self._screen_texture = Texture(self.renderer, size, streaming=True)
+
+    def stream(self, surface):
+        """Marks `surface` as changing every frame and returns it."""
+        self._streams[surface] = self._texture(self.renderer, surface.get_size(), streaming=True)
+        return surface
+
+    def blit(self, surface, pos, area=None):
+        texture = self._streams.get(surface)
+        if texture is not None:
+            texture.update(surface)
+        else:
+            texture = self._textures.get(surface)
+            if texture is None:
+                texture = self._textures[surface] = self._texture.from_surface(self.renderer, surface)
+        if area is None:
+            texture.draw(dstrect=(pos[0], pos[1], texture.width, texture.height))
+        else:
+            area = pygame.Rect(area)
+            texture.draw(srcrect=area, dstrect=(pos[0], pos[1], area.width, area.height))
+
+    def fill(self, color):
+        self.renderer.draw_color = pygame.Color(color)
+        self.renderer.clear()
+
+    def present(self):
+        self.renderer.present()
+
+    def show_screen(self):
+        self._screen_texture.update(self.screen)
+        self._screen_texture.draw()
+        self.renderer.present()
+
+    def close(self):
+        self.window.destroy()
+
+BACKENDS = {"software": SoftwareDisplay, "texture": TextureDisplay}
+
+def create_display(backend, size, window_size=None, caption=""):
+    """A display of the named backend, or a SoftwareDisplay if that one can't start."""
+    if backend != "software":
+        try:
+            return BACKENDS[backend](size, window_size, caption)
+        except (ImportError, RuntimeError) as e: # pygame.error and the _sdl2 error are RuntimeErrors
+            print(f"{backend} renderer unavailable ({e}); falling back to software rendering.")
+    return SoftwareDisplay(size, window_size, caption)
@@ -0,0 +1,88 @@
+"""Benchmarks the software and texture display backends on a real game scene.
+
+Each run plays a seeded game with the scripted gap policy and draws every
+tick the way run_game_loop does: a streamed full-screen video frame, the
+header, pipes, coins, bird and HUD. The logical frame is always 400x600; the
+window sizes are where the backends differ, since software rendering has to
+scale every frame on the CPU while the renderer scales on present.
+
+    python render_bench.py --sizes 400x600 800x1200 1440x2160 --frames 600
+
+Under SDL_VIDEODRIVER=dummy the texture backend runs on SDL's software
+renderer, so only numbers from a real display say anything about the GPU.
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+import pygame
+
+import flappy
+from flappy_sim import SCREEN_WIDTH, SCREEN_HEIGHT, World, gap_policy
+from render_backend import BACKENDS, create_display
+
+WARMUP_FRAMES = 30 # Uploads and sprite caches fill during these
+
+def video_frames(count=8, seed=0):
+    """A few noise frames standing in for decoded video, in surfarray (x, y) order."""
+    rng = np.random.default_rng(seed)
+    return [rng.integers(0, 256, (SCREEN_WIDTH, SCREEN_HEIGHT, 3), dtype=np.uint8) for _ in range(count)]
+
+def run(backend, window_size, frames, seed, video):
+    display = create_display(backend, (SCREEN_WIDTH, SCREEN_HEIGHT), window_size, caption="render bench")
+    flappy.DISPLAY = display
+    bird_sprite = flappy.BirdSprite(None, flappy.BIRD_SHOP_DATA[0])
+    video_surface = display.stream(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)))
+    world = World(seed)
+
+    for frame in range(WARMUP_FRAMES + frames):
+        if frame == WARMUP_FRAMES:
+            start = time.perf_counter()
+        if not world.active:
+            world = World(seed + frame)
+        if gap_policy(world):
+            world.jump()
+        world.step()
+
+        pygame.event.pump()
+        if video:
+            pygame.surfarray.blit_array(video_surface, video[frame % len(video)])
+        flappy.draw_background(display, video_surface if video else None)
+        flappy.draw_world(display, world, bird_sprite, None)
+        display.blit(flappy.hud_sprite(world.score), (SCREEN_WIDTH - 120, 70))
+        display.present()
+    elapsed = time.perf_counter() - start
+    name = display.name
+    display.close()
+    return name, elapsed / frames * 1000
+
+def parse_size(text):
+    w, _, h = text.lower().partition("x")
+    return int(w), int(h)
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the software and texture display backends.")
+    parser.add_argument("--sizes", type=parse_size, nargs="+",
+                        default=[(400, 600), (800, 1200), (1080, 1620), (1440, 2160)], help="Window sizes, WxH")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-video", action="store_true", help="Plain background instead of a streamed video frame")
+    args = parser.parse_args()
+
+    pygame.init()
+    flappy.load_bird_images()
+    video = None if args.no_video else video_frames()
+    print(f"video driver: {os.environ.get('SDL_VIDEODRIVER') or pygame.display.get_driver()}")
+    print(f"{'window':>10} " + " ".join(f"{b + ' ms':>12}" for b in BACKENDS) + f" {'speedup':>8}")
+    for size in args.sizes:
+        results = {}
+        for backend in BACKENDS:
+            name, ms = run(backend, size, args.frames, args.seed, video)
+            results[backend] = ms if name == backend else float("nan") # Fell back to software
+        speedup = results["software"] / results["texture"]
+        print(f"{size[0]:>4}x{size[1]:<5} " + " ".join(f"{results[b]:>12.2f}" for b in BACKENDS) + f" {speedup:>7.1f}x")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
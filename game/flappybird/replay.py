@@ -0,0 +1,229 @@
+"""Compact binary replays of Flappy games, checked by re-simulating them headlessly.
+
+A replay holds everything needed to re-run a game exactly: the RNG seed, the
+physics constants and the simulation ticks the player jumped on. The score,
+coin total and length the game claimed ride along, and verify() replays the
+inputs through flappy_sim.World (no rendering, no frame pacing) to check
+them. That makes it possible to audit coin redemptions in bulk.
+
+File layout (little-endian):
+
+    magic b"FLRP", format version u8
+    seed u64, gravity f64, bird_jump f64, pipe_speed f64, gap u32, pipe_frequency u32
+    steps u32, score u32, coins u32
+    jump count varint, then each jump tick as a varint delta from the previous one
+    crc32 u32 of everything before it
+
+Jumps are a few dozen ticks apart, so most take one byte and a long game is
+a few hundred bytes. The CRC only catches damaged files; it is not a
+signature, which is why verify() re-simulates instead of trusting the claims.
+
+    python replay.py verify replays/*.flr
+    python replay.py bench --games 200
+"""
+import os
+import struct
+import time
+import zlib
+from dataclasses import dataclass, field
+
+from flappy_sim import DEFAULT_PHYSICS, FPS, Physics, World, gap_policy
+
+MAGIC = b"FLRP"
+FORMAT_VERSION = 1
+REPLAY_DIR = "replays"
+REPLAY_EXT = ".flr"
+
+_HEADER = struct.Struct("<4sBQdddIIIII")
+_CRC = struct.Struct("<I")
+
+@dataclass
+class Replay:
+    seed: int
+    physics: Physics
+    steps: int
+    score: int
+    coins: int
+    jumps: list = field(default_factory=list) # Ticks the player jumped on, increasing
+
+def record(world):
+    """The replay of a World as it stands now."""
+    return Replay(world.seed, world.physics, world.steps, world.score, world.coins, list(world.jumps))
+
+# --- Encoding ---
+
+def _put_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _get_varint(data, pos):
+    value = shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("replay is truncated")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+def encode(replay):
+    p = replay.physics
+    out = bytearray(_HEADER.pack(MAGIC, FORMAT_VERSION, replay.seed, p.gravity, p.bird_jump, p.pipe_speed,
+                                 p.gap, p.pipe_frequency, replay.steps, replay.score, replay.coins))
+    _put_varint(out, len(replay.jumps))
+    last = 0
+    for tick in replay.jumps:
+        _put_varint(out, tick - last)
+        last = tick
+    out += _CRC.pack(zlib.crc32(out))
+    return bytes(out)
+
+def decode(data):
+    """Parses an encoded replay. Raises ValueError if it is damaged or not a replay."""
+    if len(data) < _HEADER.size + 1 + _CRC.size:
+        raise ValueError("replay is truncated")
+    body, (crc,) = data[:-_CRC.size], _CRC.unpack(data[-_CRC.size:])
+    if zlib.crc32(body) != crc:
+        raise ValueError("replay checksum mismatch")
+    (magic, version, seed, gravity, bird_jump, pipe_speed, gap, pipe_frequency,
+     steps, score, coins) = _HEADER.unpack_from(body)
+    if magic != MAGIC:
+        raise ValueError("not a replay file")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"unsupported replay version {version}")
+
+    count, pos = _get_varint(body, _HEADER.size)
+    jumps = []
+    tick = 0
+    for i in range(count):
+        delta, pos = _get_varint(body, pos)
+        if i and delta == 0:
+            raise ValueError("replay jump ticks are not increasing")
+        tick += delta
+        jumps.append(tick)
+    if pos != len(body):
+        raise ValueError("trailing bytes after replay")
+    return Replay(seed, Physics(gravity, bird_jump, pipe_speed, gap, pipe_frequency), steps, score, coins, jumps)
+
+def save(replay, directory=REPLAY_DIR):
+    """Writes a replay to <directory>/<unix time>-<seed>.flr and returns the path."""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{int(time.time())}-{replay.seed}{REPLAY_EXT}")
+    with open(path, "wb") as f:
+        f.write(encode(replay))
+    return path
+
+def load(path):
+    with open(path, "rb") as f:
+        return decode(f.read())
+
+# --- Verification ---
+
+def simulate(replay):
+    """Re-runs the replay's inputs and returns the World it ends in."""
+    world = World(replay.seed, replay.physics)
+    jumps = iter(replay.jumps)
+    next_jump = next(jumps, None)
+    while world.active and world.steps < replay.steps:
+        if world.steps == next_jump:
+            world.jump()
+            next_jump = next(jumps, None)
+        world.step()
+    return world
+
+def verify(replay, physics=DEFAULT_PHYSICS):
+    """(ok, reason): whether the replay really produces the score and coins it claims.
+
+    `physics` is what the game ships with; a replay played under other
+    constants is rejected. Pass None to accept any.
+    """
+    if physics is not None and replay.physics != physics:
+        return False, f"physics {replay.physics} differ from {physics}"
+    world = simulate(replay)
+    if world.jumps != replay.jumps:
+        return False, "jumps recorded after the game ended"
+    claimed = (replay.steps, replay.score, replay.coins)
+    actual = (world.steps, world.score, world.coins)
+    if claimed != actual:
+        return False, "claimed steps/score/coins {} but replay gives {}".format(claimed, actual)
+    return True, "ok"
+
+def verify_file(path):
+    """(path, ok, reason, steps, coins) for one replay file; unreadable files fail."""
+    try:
+        replay = load(path)
+    except (OSError, ValueError) as e:
+        return path, False, str(e), 0, 0
+    ok, reason = verify(replay)
+    return path, ok, reason, replay.steps, replay.coins
+
+# --- CLI ---
+
+def _verify_cmd(args):
+    from concurrent.futures import ProcessPoolExecutor
+
+    start = time.perf_counter()
+    failed = steps = coins = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for path, ok, reason, n, c in pool.map(verify_file, args.files, chunksize=16):
+            steps += n
+            if ok:
+                coins += c
+            else:
+                failed += 1
+                print(f"FAIL {path}: {reason}")
+            if args.verbose and ok:
+                print(f"ok   {path}")
+    elapsed = time.perf_counter() - start
+
+    game_seconds = steps / FPS
+    print(f"{len(args.files) - failed}/{len(args.files)} replays valid, {coins} coins confirmed")
+    print(f"{game_seconds:.0f}s of play checked in {elapsed:.2f}s ({game_seconds / max(elapsed, 1e-9):.0f}x real time)")
+    return 1 if failed else 0
+
+def _bench_cmd(args):
+    """Records scripted games, then round-trips and verifies every replay in-process."""
+    replays = [record(World(args.seed + i).run(gap_policy, args.max_steps)) for i in range(args.games)]
+    blobs = [encode(r) for r in replays]
+
+    start = time.perf_counter()
+    results = [verify(decode(blob)) for blob in blobs]
+    elapsed = time.perf_counter() - start
+
+    steps = sum(r.steps for r in replays)
+    assert all(ok for ok, _ in results), [reason for ok, reason in results if not ok][:3]
+    print(f"games: {args.games}  jumps/game: {sum(len(r.jumps) for r in replays) / args.games:.0f}"
+          f"  bytes/replay: {sum(map(len, blobs)) / args.games:.0f} (max {max(map(len, blobs))})")
+    print(f"verified {steps / FPS:.0f}s of play in {elapsed:.2f}s ({steps / FPS / elapsed:.0f}x real time)")
+
+    # A forged claim must not pass
+    forged = replays[0]
+    forged.coins += 1
+    assert not verify(decode(encode(forged)))[0]
+    return 0
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Verify Flappy replays by re-simulating them.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    check = sub.add_parser("verify", help="Check replay files against their claimed score and coins")
+    check.add_argument("files", nargs="+")
+    check.add_argument("--workers", type=int, default=os.cpu_count())
+    check.add_argument("-v", "--verbose", action="store_true")
+
+    bench = sub.add_parser("bench", help="Record scripted games and time verifying their replays")
+    bench.add_argument("--games", type=int, default=100)
+    bench.add_argument("--seed", type=int, default=0)
+    bench.add_argument("--max-steps", type=int, default=20000)
+
+    args = parser.parse_args(argv)
+    return _verify_cmd(args) if args.command == "verify" else _bench_cmd(args)
+
+if __name__ == "__main__":
+    raise SystemExit(main())
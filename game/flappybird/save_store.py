@@ -0,0 +1,146 @@
+"""Crash-safe save-game persistence that never blocks the game loop.
+
+The game hands its save dict to SaveStore.save(), which takes a snapshot and
+returns immediately. A background thread coalesces snapshots and writes the
+newest one at most every `debounce` seconds, and again at exit. Other files
+the game writes (replays) go through the same thread with write_later(). Writes go to
+a temp file that is fsynced and then renamed over the save, so a crash or
+power cut leaves either the old save or the new one, never half of each.
+"""
+import atexit
+import copy
+import json
+import os
+import tempfile
+import threading
+
+SCHEMA_VERSION = 1
+
+def default_data():
+    return {"version": SCHEMA_VERSION, "coins": 0, "unlocked": [0], "current": 0}
+
+def migrate(data):
+    """Brings a loaded save up to SCHEMA_VERSION, filling in anything missing or malformed."""
+    if not isinstance(data, dict):
+        raise ValueError("save data is not an object")
+    version = data.get("version", 0)
+    if version > SCHEMA_VERSION:
+        raise ValueError(f"save version {version} is newer than this game ({SCHEMA_VERSION})")
+
+    # Version 0: the original unversioned {"coins", "unlocked", "current"} file
+    result = default_data()
+    if isinstance(data.get("coins"), int) and data["coins"] >= 0:
+        result["coins"] = data["coins"]
+    unlocked = data.get("unlocked")
+    if isinstance(unlocked, list) and all(isinstance(i, int) for i in unlocked):
+        result["unlocked"] = sorted(set(unlocked) | {0})
+    if data.get("current") in result["unlocked"]:
+        result["current"] = data["current"]
+    return result
+
+def read_save(path):
+    """Loads and migrates a save. A corrupt file is moved aside to <path>.corrupt, not lost."""
+    if not os.path.exists(path):
+        return default_data()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return migrate(json.load(f))
+    except (OSError, ValueError) as e:
+        print(f"Save file {path} is unreadable ({e}); starting fresh.")
+        try:
+            os.replace(path, path + ".corrupt")
+        except OSError:
+            pass
+        return default_data()
+
+def write_atomic(path, data):
+    """Writes JSON to path via temp file + fsync + rename."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".save-", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    # Make the rename itself durable (not supported on Windows, where replace is already enough)
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+class SaveStore:
+    """Owns the save file and the background thread that writes it."""
+    def __init__(self, path, debounce=2.0):
+        self.path = path
+        self.debounce = debounce
+        self.data = read_save(path)
+        self._pending = None # Newest snapshot not yet on disk
+        self._jobs = [] # write_later() callables not yet run
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def save(self, data=None):
+        """Queues a snapshot of `data` (default: self.data) for writing. Never touches the disk."""
+        snapshot = copy.deepcopy(self.data if data is None else data)
+        snapshot["version"] = SCHEMA_VERSION
+        with self._lock:
+            self._pending = snapshot
+        self._wake.set()
+
+    def write_later(self, job, *args):
+        """Runs job(*args) on the writer thread with the next save write."""
+        with self._lock:
+            self._jobs.append((job, args))
+        self._wake.set()
+
+    def flush(self):
+        """Writes the pending snapshot and runs queued jobs now, on the calling thread."""
+        with self._lock:
+            snapshot, self._pending = self._pending, None
+            jobs, self._jobs = self._jobs, []
+        for job, args in jobs:
+            job(*args)
+        if snapshot is None:
+            return
+        try:
+            write_atomic(self.path, snapshot)
+        except OSError as e:
+            print(f"Could not save game data: {e}")
+            with self._lock:
+                # Keep it for the next attempt unless something newer arrived meanwhile
+                if self._pending is None:
+                    self._pending = snapshot
+
+    def close(self):
+        """Stops the writer and flushes anything still pending. Safe to call more than once."""
+        if self._closed:
+            return
+        self._closed = True
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout=5)
+        self.flush()
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            # Coalesce: everything saved in the next `debounce` seconds goes out as one write
+            self._stop.wait(self.debounce)
+            if self._stop.is_set():
+                return # close() does the final flush
+            self._wake.clear()
+            self.flush()
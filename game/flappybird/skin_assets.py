@@ -0,0 +1,140 @@
+"""Bird skin catalog and lazily loaded, cached skin images.
+
+The catalog lives in skins.json. Saves refer to skins by their position in
+that list, so new skins go on the end. Nothing is decoded at startup:
+
+* Sprites are loaded on first use and kept in an LRU of at most `max_loaded`.
+* Shop thumbnails are packed into one atlas surface; each thumbnail is a
+  subsurface of it.
+* Every scaled image (sprite, thumbnail, atlas, coin) is written to a PNG in
+  the on-disk cache keyed by the source file's size and mtime, so later starts
+  load a small pre-scaled PNG instead of decoding and resampling a JPEG.
+"""
+import hashlib
+import json
+import math
+import os
+from collections import OrderedDict
+
+import pygame
+
+CATALOG_FILE = "skins.json"
+CACHE_DIR = ".asset_cache"
+SPRITE_SIZE = (50, 40)
+THUMB_SIZE = (40, 32)
+
+def load_catalog(path=CATALOG_FILE):
+    """The skin list, in shop (and save-file index) order."""
+    with open(path, "r", encoding="utf-8") as f:
+        catalog = json.load(f)
+    for skin in catalog:
+        skin["color"] = tuple(skin["color"])
+    return catalog
+
+def _source_key(path):
+    """Identifies a source image's current contents cheaply, or None if it is missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return f"{os.path.abspath(path)}|{st.st_size}|{st.st_mtime_ns}"
+
+def _cache_name(*parts):
+    return hashlib.sha1("|".join(str(p) for p in parts).encode()).hexdigest()[:16] + ".png"
+
+class ImageCache:
+    """Scaled copies of source images, kept as PNGs under cache_dir."""
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    def load_scaled(self, path, size):
+        """`path` scaled to `size`, from the disk cache when possible. None if it can't be loaded."""
+        key = _source_key(path)
+        if key is None:
+            return None
+        cached = os.path.join(self.cache_dir, _cache_name(key, size))
+        if os.path.exists(cached):
+            try:
+                return pygame.image.load(cached).convert_alpha()
+            except pygame.error:
+                pass # Damaged cache entry; rebuild it below
+        try:
+            img = pygame.transform.smoothscale(pygame.image.load(path).convert_alpha(), size)
+        except pygame.error as e:
+            print(f"Error loading image {path}: {e}")
+            return None
+        self.store(cached, img)
+        return img
+
+    def store(self, cached, surface):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp = cached + ".tmp.png"
+            pygame.image.save(surface, tmp)
+            os.replace(tmp, cached)
+        except (OSError, pygame.error) as e:
+            print(f"Could not write asset cache {cached}: {e}")
+
+class SkinAssets:
+    """Images for the skins in a catalog, loaded only when something asks for them."""
+    def __init__(self, catalog, image_cache=None, max_loaded=16):
+        self.catalog = catalog
+        self.by_id = {skin["id"]: skin for skin in catalog}
+        self.images = image_cache or ImageCache()
+        self.max_loaded = max_loaded
+        self._sprites = OrderedDict() # bird_id -> Surface or None, least recently used first
+        self._atlas = None
+        self._thumbs = {}
+
+    def sprite(self, bird_id):
+        """The full-size in-game sprite, or None to use the skin's fallback color."""
+        if bird_id in self._sprites:
+            self._sprites.move_to_end(bird_id)
+            return self._sprites[bird_id]
+        skin = self.by_id.get(bird_id)
+        img = self.images.load_scaled(skin["image"], SPRITE_SIZE) if skin else None
+        self._sprites[bird_id] = img
+        if len(self._sprites) > self.max_loaded:
+            self._sprites.popitem(last=False)
+        return img
+
+    def thumb(self, bird_id):
+        """The shop thumbnail (a view into the atlas), or None to use the fallback color."""
+        if self._atlas is None:
+            self._build_atlas()
+        return self._thumbs.get(bird_id)
+
+    def _build_atlas(self):
+        """Packs every thumbnail into one grid surface, itself cached on disk."""
+        w, h = THUMB_SIZE
+        cols = max(1, math.ceil(math.sqrt(len(self.catalog))))
+        rows = max(1, math.ceil(len(self.catalog) / cols))
+        keys = [(skin["id"], _source_key(skin["image"])) for skin in self.catalog]
+        cached = os.path.join(self.images.cache_dir, _cache_name("atlas", THUMB_SIZE, *keys))
+
+        atlas = None
+        failed = set() # Skins whose image exists but wouldn't load; they keep the fallback color
+        if os.path.exists(cached):
+            try:
+                atlas = pygame.image.load(cached).convert_alpha()
+            except pygame.error:
+                atlas = None
+        if atlas is None:
+            atlas = pygame.Surface((cols * w, rows * h), pygame.SRCALPHA)
+            for i, (bird_id, key) in enumerate(keys):
+                if key is None:
+                    continue
+                thumb = self.images.load_scaled(self.by_id[bird_id]["image"], THUMB_SIZE)
+                if thumb:
+                    atlas.blit(thumb, ((i % cols) * w, (i // cols) * h))
+                else:
+                    failed.add(bird_id)
+            # A cached atlas can't say which cells are blank, so only cache a complete one
+            if not failed:
+                self.images.store(cached, atlas)
+
+        self._atlas = atlas
+        self._thumbs = {
+            bird_id: atlas.subsurface(pygame.Rect((i % cols) * w, (i // cols) * h, w, h))
+            for i, (bird_id, key) in enumerate(keys) if key is not None and bird_id not in failed
+        }